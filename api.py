@@ -1,14 +1,22 @@
 # api.py
 from flask import Flask, request, jsonify, send_from_directory
-import threading
 import uuid
 import os
+import threading
 import logging
 import sys
 import requests
 import json
-from datetime import datetime
+from config import EXECUTOR_JOBS, BANCO_PEDIDOS, LIMITE_POR_SITE, SITES_CONFIG, identificar_site
 from scraper_manager import ScraperManager
+from utils.executor_jobs import obter_executor, obter_executor_entregas
+from utils.limites_site import LimitesSite
+from utils.banco_pedidos import obter_banco_pedidos
+from utils.pedidos_em_voo import obter_pedidos_em_voo
+from utils.camadas_busca import obter_memoria_camadas
+from utils.motor_async import obter_motor
+from utils.cache_http import obter_cache_http
+from utils.cache_snapshots import obter_snapshots
 
 # --- FORÇAR EXIBIÇÃO DE LOGS NO TERMINAL ---
 os.environ["PYTHONUNBUFFERED"] = "1" 
@@ -51,14 +59,63 @@ URL_CALLBACK_API_NOVA = "http://127.0.0.1:3000/api/datasheet/webhook"
 # ==============================================================================
 
 scraper_manager = ScraperManager()
-pedidos = {}
+executor = obter_executor()
+executor.configurar(**EXECUTOR_JOBS, limites=LimitesSite(SITES_CONFIG, **LIMITE_POR_SITE))
+entregas = obter_executor_entregas()
+pedidos = obter_banco_pedidos()
+pedidos.configurar(**BANCO_PEDIDOS)
+em_voo = obter_pedidos_em_voo()
+
+def processar_pedido_background(pedido):
+    """
+    Raspa a URL uma vez e entrega o resultado a todos os pedidos anexados a ela.
+    Scraper só-HTTP vai para o loop do motor assíncrono e o Future volta para o
+    executor: o worker fica livre enquanto o job espera a rede.
+    """
+    resultado = None
+    try:
+        pedidos.atualizar_status(pedido['id'], 'processando')
+        logger.info(f"🔧 [PROCESSANDO] UUID Interno: {pedido['id']}")
+
+        if scraper_manager.assincrono(pedido['url']):
+            futuro = scraper_manager.agendar_scraping(pedido['url'], OUTPUT_DIR)
+            # O callback roda na thread do loop: a entrega (SQLite + webhook) vai para os workers de entrega
+            futuro.add_done_callback(lambda f: agendar_entrega(
+                concluir_pedido, pedido, None if f.cancelled() or f.exception() else f.result()
+            ))
+            return futuro
 
-def processar_pedido_background(request_id_interno, url, webhook_url, origem="PADRAO", codigo_tarefa_externo=None, custom_id=None):
+        # Executa o Scraper
+        resultado = scraper_manager.executar_scraping(pedido['url'], OUTPUT_DIR)
+
+    except Exception as e:
+        logger.exception(f"   💥 Erro Crítico na Thread: {str(e)}")
+
+    concluir_pedido(pedido, resultado)
+
+def concluir_pedido(pedido, resultado):
+    if resultado and resultado.get('sucesso') and resultado.get('arquivos'):
+        pedidos.guardar_resultado(pedido['url'], resultado)
+    # Inclui o próprio pedido e os repetidos que chegaram enquanto ele rodava
+    for anexado in em_voo.concluir(pedido['url']):
+        entregar_resultado(anexado, resultado)
+
+def agendar_entrega(funcao, *args):
+    if not entregas.submeter(funcao, *args):
+        # Fila de entregas lotada: não dá para perder o webhook
+        threading.Thread(target=funcao, args=args, daemon=True).start()
+
+def entregar_resultado(pedido, resultado):
+    request_id_interno = pedido['id']
+    origem = pedido.get('origem') or "PADRAO"
+    codigo_tarefa_externo = pedido.get('codigo_tarefa')
+    custom_id = pedido.get('custom_id')
+    webhook_url = pedido.get('webhook')
     try:
-        pasta_pedido = OUTPUT_DIR 
-        
-        logger.info(f"🔧 [PROCESSANDO] UUID Interno: {request_id_interno}")
-        
+        if resultado is None:
+            pedidos.atualizar_status(request_id_interno, 'erro_critico')
+            return
+
         # Define qual ID será enviado de volta.
         # Se o bot mandou um custom_id, usamos ele como PRINCIPAL.
         # Se não mandou, usamos o UUID interno gerado pelo Python.
@@ -66,10 +123,7 @@ def processar_pedido_background(request_id_interno, url, webhook_url, origem="PA
 
         if custom_id:
             logger.info(f"   🔖 ID DO CLIENTE: {custom_id}")
-        
-        # Executa o Scraper
-        resultado = scraper_manager.executar_scraping(url, pasta_pedido)
-        
+
         base_url = "http://localhost:6004"
         files = resultado.get('arquivos', {})
         
@@ -130,8 +184,7 @@ def processar_pedido_background(request_id_interno, url, webhook_url, origem="PA
                 }
 
         # Atualiza status interno
-        pedidos[request_id_interno]['resultado'] = payload_final
-        pedidos[request_id_interno]['status'] = 'concluido' if resultado.get('sucesso') else 'erro'
+        pedidos.atualizar_status(request_id_interno, 'concluido' if resultado.get('sucesso') else 'erro', payload_final)
 
         # --- ENVIO DO WEBHOOK ---
         if webhook_url:
@@ -142,8 +195,43 @@ def processar_pedido_background(request_id_interno, url, webhook_url, origem="PA
                 logger.error(f"   ❌ Erro ao chamar Webhook: {e}")
 
     except Exception as e:
-        logger.exception(f"   💥 Erro Crítico na Thread: {str(e)}")
-        pedidos[request_id_interno]['status'] = 'erro_critico'
+        logger.exception(f"   💥 Erro Crítico na entrega: {str(e)}")
+        pedidos.atualizar_status(request_id_interno, 'erro_critico')
+
+def resultado_em_cache(url):
+    """Resultado recente da URL (dentro do 'resultado_ttl' do site) cujos Word/PDF ainda existem"""
+    site = identificar_site(url)[0]
+    resultado = pedidos.resultado_recente(url, SITES_CONFIG.get(site, {}).get('resultado_ttl'))
+    if not resultado:
+        return None
+    arquivos = resultado.get('arquivos') or {}
+    nomes = [arquivos.get('word_nome'), arquivos.get('pdf_nome')]
+    if not all(nomes) or not all(os.path.exists(os.path.join(OUTPUT_DIR, n)) for n in nomes):
+        # Alguém limpou a pasta de saída: o cache não vale mais
+        pedidos.descartar_resultado(url)
+        return None
+    return resultado
+
+def enfileirar_pedidos(novos):
+    """Jobs de raspagem, limitados por site"""
+    return executor.submeter_lote(
+        [(processar_pedido_background, (p,), identificar_site(p['url'])[0]) for p in novos]
+    )
+
+def retomar_pedidos_pendentes():
+    """Pedidos que estavam na fila ou em processamento quando o serviço parou voltam para a fila"""
+    pendentes = pedidos.pendentes()
+    if not pendentes:
+        return
+    for p in pendentes:
+        if p['status'] != 'na_fila':
+            pedidos.atualizar_status(p['id'], 'na_fila')
+    if em_voo.anexar_lote(pendentes, enfileirar_pedidos):
+        logger.info(f"♻️ {len(pendentes)} pedido(s) interrompido(s) voltaram para a fila.")
+    else:
+        logger.error(f"[ERRO] Fila cheia: {len(pendentes)} pedido(s) interrompido(s) não foram retomados.")
+
+retomar_pedidos_pendentes()
 
 # --- ROTAS DA API ---
 
@@ -162,6 +250,9 @@ def iniciar_scraping():
     logger.info(f"📦 [DADOS RECEBIDOS]: {dados}")
     
     lista_processamento = [] 
+
+    # "force_refresh": true ignora o cache de resultados e raspa de novo
+    forcar = bool(dados.get('force_refresh') or (dados.get('dados') or {}).get('force_refresh'))
     
     # 1. API NOVA
     if 'codigoTarefa' in dados:
@@ -211,34 +302,43 @@ def iniciar_scraping():
         return jsonify({"error": "Nenhuma URL fornecida no corpo da requisição"}), 400
 
     ids_gerados = []
+    registros = []
+    a_raspar = []
+    prontos = []
     
     for item in lista_processamento:
         request_id_interno = str(uuid.uuid4())
         
-        pedidos[request_id_interno] = {
+        registros.append({
+            'id': request_id_interno,
             'url': item['url'],
-            'status': 'processando',
             'origem': item['origem'],
             'custom_id': item['custom_id'],
-            'criado_em': datetime.now().isoformat()
-        }
-
-        thread = threading.Thread(
-            target=processar_pedido_background,
-            args=(
-                request_id_interno, 
-                item['url'], 
-                item['webhook'], 
-                item['origem'], 
-                item['codigo_tarefa'], 
-                item['custom_id']
-            )
-        )
-        thread.daemon = True
-        thread.start()
-        
+            'codigo_tarefa': item['codigo_tarefa'],
+            'webhook': item['webhook']
+        })
         ids_gerados.append(request_id_interno)
 
+        resultado = None if forcar else resultado_em_cache(item['url'])
+        if resultado:
+            logger.info(f"   ♻️ [CACHE] {item['url']} já foi gerado: reaproveitando {resultado['arquivos']['pdf_nome']}")
+            prontos.append((registros[-1], resultado))
+        else:
+            a_raspar.append(registros[-1])
+
+    # Uma transação e um único enfileiramento para o lote inteiro: a rota não espera nenhum job.
+    # URLs que já estão sendo raspadas só se anexam ao job em andamento.
+    pedidos.registrar_lote(registros)
+    if not em_voo.anexar_lote(a_raspar, enfileirar_pedidos):
+        pedidos.remover(ids_gerados)
+        logger.error(f"[ERRO] Fila cheia. Lote de {len(registros)} URL(s) recusado.")
+        return jsonify({"error": "Fila de processamento cheia, tente novamente mais tarde"}), 503
+
+    # As que estão no cache de resultados só têm o webhook disparado, pelos workers de
+    # entrega: não esperam na fila de raspagem atrás de jobs de navegador
+    for registro, resultado in prontos:
+        agendar_entrega(entregar_resultado, registro, resultado)
+
     return jsonify({
         "success": True,
         "message": "Processamento iniciado",
@@ -247,12 +347,12 @@ def iniciar_scraping():
 
 @app.route('/api/status/<request_id>', methods=['GET'])
 def verificar_status(request_id):
-    if request_id not in pedidos:
+    pedido = pedidos.obter(request_id)
+    if not pedido:
         return jsonify({"success": False, "message": "ID não encontrado"}), 404
     
-    pedido = pedidos[request_id]
     if pedido['status'] in ['concluido', 'erro', 'erro_critico']:
-        return jsonify(pedido.get('resultado', {}))
+        return jsonify(pedido['resultado'] or {})
     
     return jsonify({"success": True, "status": pedido['status']})
 
@@ -268,7 +368,18 @@ def health_check():
     return jsonify({
         "status": "online",
         "pasta": OUTPUT_DIR,
-        "pedidos_ativos": sum(1 for p in pedidos.values() if p['status'] == 'processando')
+        "pedidos_ativos": pedidos.contar('processando'),
+        "pedidos": pedidos.estatisticas(),
+        "executor": executor.estatisticas(),
+        "entregas": entregas.estatisticas(),
+        "em_voo": em_voo.estatisticas(),
+        "navegadores": scraper_manager.pool_navegadores.estatisticas(),
+        "fila_navegadores": scraper_manager.governador.estatisticas(),
+        "supervisor": scraper_manager.supervisor.relatorio(),
+        "camadas_busca": obter_memoria_camadas().estatisticas(),
+        "motor_async": obter_motor().estatisticas(),
+        "cache_http": obter_cache_http().estatisticas(),
+        "snapshots": obter_snapshots().estatisticas()
     })
 
 if __name__ == '__main__':
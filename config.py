@@ -1,15 +1,100 @@
 # config.py
 import re
 
+# ==============================================================================
+# 🧰 RUNTIME DO NAVEGADOR
+# ==============================================================================
+
+RUNTIME_NAVEGADOR = {
+    # None = detecta a versão do Chrome instalado. Ex: 109 para forçar no Windows Server 2012 R2.
+    'versao_chrome': None
+}
+
+# ==============================================================================
+# 🌐 POOL DE NAVEGADORES
+# ==============================================================================
+
+POOL_NAVEGADORES = {
+    'tamanho_maximo': 4,          # Máximo de Chromes abertos ao mesmo tempo
+    'ociosos_por_assinatura': 2,  # Quantos ficam abertos esperando o próximo job
+    'tempo_ocioso_maximo': 600,   # Segundos até fechar um navegador parado
+    'aquecer_ao_iniciar': 1,      # Quantos sobem junto com o serviço
+    # 'navegador' = um Chrome por job | 'abas' = vários jobs em abas do mesmo Chrome (economiza RAM)
+    'modo': 'navegador',
+    'abas_por_navegador': 4
+}
+
+GOVERNADOR_NAVEGADORES = {
+    'maximo': None,             # Teto manual. None = tamanho do pool (x abas no modo 'abas')
+    'mb_por_job': 450,          # RAM estimada por job no modo 'navegador'
+    'mb_por_job_abas': 150,     # RAM estimada por job no modo 'abas'
+    'reserva_mb': 1024,         # RAM deixada para o sistema e a API
+    'jobs_por_nucleo': 1.0,
+    'memoria_minima_mb': 600    # Abaixo disso só admite um job por vez
+}
+
+SUPERVISOR_NAVEGADORES = {
+    'reciclar_apos_paginas': 50,     # Fecha e recria o Chrome depois de N páginas
+    'limite_rss_mb': 1500,           # ... ou quando passar deste consumo de memória
+    'intervalo_varredura': 60,       # Segundos entre as varreduras de processos órfãos
+    'tempo_maximo_emprestimo': 900   # Job segurando o navegador além disso é considerado travado
+}
+
+EXECUTOR_JOBS = {
+    'workers': 16,          # Pedidos da API processados ao mesmo tempo (navegadores ainda passam pelo governador)
+    'fila_maxima': 5000     # Pedidos esperando; acima disso a API responde 503
+}
+
+LIMITE_POR_SITE = {
+    'max_simultaneos': 4,   # Jobs do mesmo site rodando ao mesmo tempo (0 = sem limite)
+    'jobs_por_minuto': 0,   # Jobs do mesmo site iniciados por minuto (0 = sem limite)
+    'rajada': 0             # Quantos podem começar de uma vez antes do ritmo valer (0 = max_simultaneos)
+}
+
+BANCO_PEDIDOS = {
+    'ttl': 7 * 24 * 3600,                 # Segundos que um pedido terminado fica consultável em /api/status (pasta 'pedidos')
+    'resultado_ttl_padrao': 24 * 3600     # Segundos em que um link já gerado é respondido com os mesmos arquivos. 'resultado_ttl' do site sobrepõe
+}
+
+CACHE_HTTP = {
+    'ativo': True,
+    'tamanho_maximo_mb': 500,   # Teto do cache em disco (pasta 'cache_http'); passou, sai o menos usado
+    'ttl_padrao': 0             # 0 = sempre revalida (304 quando nada mudou). 'cache_ttl' do site sobrepõe
+}
+
 # ==============================================================================
 # 📋 LISTA DE SITES SUPORTADOS
 # ==============================================================================
+# Chaves opcionais por site:
+#   'bloquear_recursos': categorias bloqueadas no Chrome (ver utils/bloqueio_recursos.py).
+#                        Padrão: ['fontes', 'midia', 'rastreadores']. Use [] para não bloquear nada.
+#   'tempo_prontidao':   limite (s) do BaseScraper.aguardar_pagina para o site. Padrão: 8.
+#   'perfil_persistente': True para guardar perfil do Chrome, cookies e consentimento do site
+#                        em 'perfis/' (desafios anti-bot e banners são resolvidos uma vez só).
+#   'tls':               None (padrão), 'sem_verificacao' (certificado não verificado) ou 'legado'
+#                        (também libera cifras antigas). Vale para as sessões HTTP do site
+#                        (ver utils/sessoes_http.py).
+#   'cache_ttl':         segundos em que página/imagem do site saem do cache HTTP sem nem
+#                        revalidar (ver utils/cache_http.py). Padrão: CACHE_HTTP['ttl_padrao'].
+#   'snapshot_ttl':      segundos em que o DOM já renderizado do produto fica guardado em
+#                        'snapshots/' (ver utils/cache_snapshots.py). Um job repetido dentro do
+#                        prazo não abre o Chrome. Sem a chave, o site não usa snapshots.
+#   'max_simultaneos',
+#   'jobs_por_minuto',
+#   'rajada':            orçamento de jobs do site no executor da API (ver utils/limites_site.py).
+#                        Jobs de um site saturado esperam na fila sem travar os dos outros.
+#                        Padrão: LIMITE_POR_SITE.
+#   'resultado_ttl':     segundos em que o Word/PDF já gerado para o link é reaproveitado pela API
+#                        sem raspar de novo (0 = nunca). Padrão: BANCO_PEDIDOS['resultado_ttl_padrao'].
+#                        O pedido com "force_refresh": true sempre raspa.
 
 SITES_CONFIG = {
     'MERCADO_LIVRE': {
         'padroes_url': [r'mercadolivre\.com', r'produto\.mercadolivre'],
         'modulo': 'mercado_livre',
-        'classe': 'MercadoLivreScraper'
+        'classe': 'MercadoLivreScraper',
+        'max_simultaneos': 2,
+        'jobs_por_minuto': 12
     },
     'ACIMAQ': {
         'padroes_url': [r'acimaq\.com\.br'],
@@ -19,7 +104,9 @@ SITES_CONFIG = {
     'AMAZON': {
         'padroes_url': [r'amazon\.com', r'amzn\.to'],
         'modulo': 'amazon',
-        'classe': 'AmazonScraper'
+        'classe': 'AmazonScraper',
+        'max_simultaneos': 2,
+        'jobs_por_minuto': 12
     },
     'ANHANGUERA': {
         'padroes_url': [r'anhangueraferramentas\.com\.br'],
@@ -64,7 +151,8 @@ SITES_CONFIG = {
     'PICHAU': {
         'padroes_url': [r'pichau\.com\.br'],
         'modulo': 'pichau',
-        'classe': 'PichauScraper'
+        'classe': 'PichauScraper',
+        'snapshot_ttl': 21600
     },
     'EPSON': {
         'padroes_url': [r'epson\.com\.br'],
@@ -84,7 +172,9 @@ SITES_CONFIG = {
     'CASAS_BAHIA': {
         'padroes_url': [r'casasbahia\.com\.br'],
         'modulo': 'casasbahia',
-        'classe': 'CasasBahiaScraper'
+        'classe': 'CasasBahiaScraper',
+        'bloquear_recursos': ['fontes', 'midia', 'rastreadores', 'imagens'],
+        'snapshot_ttl': 21600
     },
     'atacadosp': {
         'padroes_url': [r'atacadosaopaulo\.com\.br'],
@@ -120,7 +210,8 @@ SITES_CONFIG = {
         # Magalu Varejo (Comum)
         'padroes_url': [r'magazineluiza\.com\.br', r'magalu\.com'],
         'modulo': 'magalu',
-        'classe': 'MagaluScraper'
+        'classe': 'MagaluScraper',
+        'bloquear_recursos': ['fontes', 'midia', 'rastreadores', 'imagens']
     },
     'MAGALU_EMPRESAS': {
         # Magalu Empresas (B2B)
@@ -147,12 +238,15 @@ SITES_CONFIG = {
     'MADEIRA_MADEIRA': {
         'padroes_url': [r'madeiramadeira\.com\.br'],
         'modulo': 'madeiramadeira',
-        'classe': 'MadeiraMadeiraScraper'
+        'classe': 'MadeiraMadeiraScraper',
+        'perfil_persistente': True
     },
     'LEROY_MERLIN': {
         'padroes_url': [r'leroymerlin\.com\.br'],
         'modulo': 'leroymerlin',
-        'classe': 'LeroyMerlinScraper'
+        'classe': 'LeroyMerlinScraper',
+        'bloquear_recursos': ['fontes', 'midia', 'rastreadores', 'imagens'],
+        'perfil_persistente': True
     },
     'FRIGELAR': {
         'padroes_url': [r'frigelar\.com\.br'],
@@ -162,27 +256,33 @@ SITES_CONFIG = {
     'FASTSHOP': {
         'padroes_url': [r'fastshop\.com\.br', r'site\.fastshop'],
         'modulo': 'fastshop',
-        'classe': 'FastShopScraper'
+        'classe': 'FastShopScraper',
+        'snapshot_ttl': 21600
     },
     'ODERCO': {
         'padroes_url': [r'oderco\.com\.br'],
         'modulo': 'oderco',
-        'classe': 'OdercoScraper'
+        'classe': 'OdercoScraper',
+        # O Chrome rodava com --ignore-certificate-errors; o GET direto mantém o mesmo
+        'tls': 'sem_verificacao'
     },
     'MAZER': {
         'padroes_url': [r'mazer\.com\.br'],
         'modulo': 'mazer',
-        'classe': 'MazerScraper'
+        'classe': 'MazerScraper',
+        'tls': 'sem_verificacao'
     },
     'DUTRA': {
         'padroes_url': [r'dutramaquinas\.com\.br'],
         'modulo': 'dutramaquinas',
-        'classe': 'DutraMaquinasScraper'
+        'classe': 'DutraMaquinasScraper',
+        'tls': 'sem_verificacao'
     },
     'ROUTE66': {
         'padroes_url': [r'route66\.com\.br'],
         'modulo': 'router66',
-        'classe': 'Router66Scraper'
+        'classe': 'Router66Scraper',
+        'tls': 'sem_verificacao'
     },
     'LOJADOMECANICO': {
         'padroes_url': [r'lojadomecanico\.com\.br'],
@@ -192,7 +292,8 @@ SITES_CONFIG = {
     'VONDER': {
         'padroes_url': [r'vonder\.com\.br'],
         'modulo': 'vonder',
-        'classe': 'VonderScraper'
+        'classe': 'VonderScraper',
+        'tls': 'legado'
     },
     'CONSUL': {
         'padroes_url': [r'consul\.com\.br'],
@@ -217,7 +318,8 @@ SITES_CONFIG = {
     'KALUNGA': {
         'padroes_url': [r'kalunga\.com\.br'],
         'modulo': 'kalunga',
-        'classe': 'KalungaScraper'
+        'classe': 'KalungaScraper',
+        'tls': 'sem_verificacao'
     },
     'BRASTEMP': {
         'padroes_url': [r'brastemp\.com\.br'],
@@ -237,7 +339,8 @@ SITES_CONFIG = {
     'QUASETUDO': {
         'padroes_url': [r'quasetudodeinformatica\.com\.br'],
         'modulo': 'quasetudo',
-        'classe': 'QuaseTudoScraper'
+        'classe': 'QuaseTudoScraper',
+        'tls': 'sem_verificacao'
     },
     'ACIMAQ': {
         'padroes_url': [r'acimaq\.com\.br'],
@@ -257,22 +360,28 @@ SITES_CONFIG = {
     'KABUM': {
         'padroes_url': [r'kabum\.com\.br'],
         'modulo': 'kabum',
-        'classe': 'KabumScraper'
+        'classe': 'KabumScraper',
+        'snapshot_ttl': 21600,
+        'max_simultaneos': 2,
+        'jobs_por_minuto': 12
     },
     'DELL': {
         'padroes_url': [r'dell\.com'],
         'modulo': 'dell',
-        'classe': 'DellScraper'
+        'classe': 'DellScraper',
+        'perfil_persistente': True
     },
     'DIMENSIONAL': {
         'padroes_url': [r'dimensional\.com\.br'],
         'modulo': 'dimensional',
-        'classe': 'DimensionalScraper'
+        'classe': 'DimensionalScraper',
+        'tls': 'sem_verificacao'
     },
     'HAYAMAX': {
         'padroes_url': [r'hayamax\.com\.br'],
         'modulo': 'hayamax',
-        'classe': 'HayamaxScraper'
+        'classe': 'HayamaxScraper',
+        'tls': 'sem_verificacao'
     },
     'WEG': {
         'padroes_url': [r'weg\.net'],
@@ -3,7 +3,6 @@ import sys
 import re
 import uuid
 import json
-import threading
 import requests
 import importlib
 from datetime import datetime
@@ -28,6 +27,10 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from fpdf import FPDF
 from PIL import Image
 
+# --- MÓDULOS DO PROJETO ---
+from config import EXECUTOR_JOBS
+from utils.executor_jobs import obter_executor
+
 # ==============================================================================
 # 📋 CONFIGURAÇÕES E SITES (Antigo config.py)
 # ==============================================================================
@@ -194,8 +197,13 @@ class ScraperManager:
 
 scraper_manager = ScraperManager()
 
+# Workers fixos consumindo uma fila (em vez de uma thread por pedido)
+executor = obter_executor()
+executor.configurar(**EXECUTOR_JOBS)
+
 def processar_pedido_background(request_id_interno, url, webhook_url, origem, codigo_tarefa, custom_id):
     try:
+        pedidos[request_id_interno]['status'] = 'processando'
         id_bot = custom_id if custom_id else request_id_interno
         print(f" ⚙️ [THREAD] Processando ID: {id_bot}", flush=True)
         
@@ -238,11 +246,11 @@ def iniciar():
     if not url: return jsonify({"error": "URL faltando"}), 400
 
     req_id = str(uuid.uuid4())
-    pedidos[req_id] = {'status': 'processando'}
+    pedidos[req_id] = {'status': 'na_fila'}
 
-    thread = threading.Thread(target=processar_pedido_background, args=(req_id, url, webhook, "API", c_tarefa, c_id))
-    thread.daemon = True
-    thread.start()
+    if not executor.submeter(processar_pedido_background, req_id, url, webhook, "API", c_tarefa, c_id):
+        pedidos.pop(req_id, None)
+        return jsonify({"error": "Fila cheia"}), 503
 
     return jsonify({"success": True, "request_id": req_id}), 202
 
@@ -252,7 +260,7 @@ def download(filename):
 
 @app.route('/health')
 def health():
-    return jsonify({"status": "online", "pasta": OUTPUT_DIR, "pedidos_ativos": len(pedidos)})
+    return jsonify({"status": "online", "pasta": OUTPUT_DIR, "pedidos_ativos": len(pedidos), "executor": executor.estatisticas()})
 
 if __name__ == '__main__':
     os.makedirs(OUTPUT_DIR, exist_ok=True)
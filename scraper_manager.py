@@ -2,7 +2,7 @@
 import importlib
 import sys
 import os
-from config import identificar_site
+from config import identificar_site, POOL_NAVEGADORES, RUNTIME_NAVEGADOR, SUPERVISOR_NAVEGADORES, GOVERNADOR_NAVEGADORES, CACHE_HTTP, SITES_CONFIG
 
 # --- CORREÇÃO DE PATH ---
 # Adiciona o diretório atual (onde está este arquivo) ao sys.path
@@ -12,9 +12,58 @@ if diretorio_atual not in sys.path:
     sys.path.append(diretorio_atual)
 # ------------------------
 
+from utils.pool_navegadores import PoolNavegadores
+from utils.runtime_navegador import obter_runtime
+from utils.supervisor_navegadores import SupervisorNavegadores
+from utils.governador import GovernadorNavegadores
+from utils.motor_async import obter_motor
+from utils.cache_http import obter_cache_http
+
 class ScraperManager:
     def __init__(self):
         self.scrapers_carregados = {}
+
+        # Resolve e patcheia o chromedriver uma única vez (usa o cache da pasta 'drivers')
+        self.runtime = obter_runtime()
+        self.runtime.versao_forcada = RUNTIME_NAVEGADOR['versao_chrome']
+        try:
+            self.runtime.preparar()
+        except Exception as e:
+            print(f"   ⚠️ [RUNTIME] Navegador indisponível: {e}. Scrapers sem Chrome continuam funcionando.")
+
+        # Cache HTTP em disco por baixo das sessões compartilhadas
+        obter_cache_http().configurar(**CACHE_HTTP)
+
+        # Acompanha os processos de Chrome: recicla os gastos e mata os órfãos
+        self.supervisor = SupervisorNavegadores(**SUPERVISOR_NAVEGADORES)
+        self.supervisor.iniciar()
+
+        # Navegadores reaproveitados entre os jobs (evita subir um Chrome por URL)
+        self.pool_navegadores = PoolNavegadores(
+            tamanho_maximo=POOL_NAVEGADORES['tamanho_maximo'],
+            ociosos_por_assinatura=POOL_NAVEGADORES['ociosos_por_assinatura'],
+            tempo_ocioso_maximo=POOL_NAVEGADORES['tempo_ocioso_maximo'],
+            modo=POOL_NAVEGADORES['modo'],
+            abas_por_navegador=POOL_NAVEGADORES['abas_por_navegador'],
+            runtime=self.runtime,
+            supervisor=self.supervisor
+        )
+
+        # Fila global para jobs com navegador, dimensionada pela RAM/CPU da máquina
+        modo_abas = POOL_NAVEGADORES['modo'] == 'abas'
+        teto = GOVERNADOR_NAVEGADORES['maximo'] or (
+            POOL_NAVEGADORES['tamanho_maximo'] * (POOL_NAVEGADORES['abas_por_navegador'] if modo_abas else 1)
+        )
+        self.governador = GovernadorNavegadores(
+            maximo=teto,
+            mb_por_job=GOVERNADOR_NAVEGADORES['mb_por_job_abas' if modo_abas else 'mb_por_job'],
+            reserva_mb=GOVERNADOR_NAVEGADORES['reserva_mb'],
+            jobs_por_nucleo=GOVERNADOR_NAVEGADORES['jobs_por_nucleo'],
+            memoria_minima_mb=GOVERNADOR_NAVEGADORES['memoria_minima_mb']
+        )
+
+        if POOL_NAVEGADORES['aquecer_ao_iniciar'] and self.runtime.caminho_driver:
+            self.pool_navegadores.aquecer(POOL_NAVEGADORES['aquecer_ao_iniciar'])
     
     def carregar_scraper(self, modulo_nome, classe_nome):
         # Carregamento dinâmico
@@ -31,22 +80,76 @@ class ScraperManager:
             print(f"DEBUG PATH: {sys.path}")
             raise Exception(f"Erro de Importação: {e}. Verifique se 'scrapers/{modulo_nome}.py' existe e se tem __init__.py na pasta.")
     
+    def _instanciar(self, url, output_folder):
+        site_nome, modulo_nome, classe_nome = identificar_site(url)
+        if not site_nome:
+            return None
+
+        ClasseScraper = self.carregar_scraper(modulo_nome, classe_nome)
+
+        # Instancia o scraper
+        scraper = ClasseScraper(url)
+        scraper.output_folder = output_folder
+        scraper.pool_navegadores = self.pool_navegadores
+        scraper.governador = self.governador
+        scraper.site_nome = site_nome
+        scraper.config_site = SITES_CONFIG.get(site_nome, {})
+        return scraper
+
     def executar_scraping(self, url, output_folder):
+        scraper = None
         try:
-            site_nome, modulo_nome, classe_nome = identificar_site(url)
-            
-            if not site_nome:
+            scraper = self._instanciar(url, output_folder)
+            if not scraper:
                 return {'sucesso': False, 'erro': 'Site não configurado ou URL inválida'}
-            
-            ClasseScraper = self.carregar_scraper(modulo_nome, classe_nome)
-            
-            # Instancia o scraper
-            scraper = ClasseScraper(url)
-            scraper.output_folder = output_folder
-            
-            print(f"   --> Iniciando scraper: {site_nome}")
+
+            print(f"   --> Iniciando scraper: {scraper.site_nome}")
             return scraper.executar()
             
         except Exception as e:
             # Retorna o erro detalhado para aparecer no log da API
-            return {'sucesso': False, 'erro': str(e)}
\ No newline at end of file
+            return {'sucesso': False, 'erro': str(e)}
+        finally:
+            # Devolve ao pool qualquer navegador que o scraper esqueceu aberto
+            if scraper:
+                scraper.liberar_navegadores()
+
+    def assincrono(self, url):
+        """True se o scraper da URL é só-HTTP e pode rodar inteiro no motor assíncrono"""
+        site_nome, modulo_nome, classe_nome = identificar_site(url)
+        if not site_nome:
+            return False
+        try:
+            return self.carregar_scraper(modulo_nome, classe_nome).assincrono()
+        except Exception:
+            return False
+
+    def agendar_scraping(self, url, output_folder):
+        """
+        Coloca o scraper assíncrono no loop do motor e devolve o concurrent.futures.Future
+        na hora: a thread chamadora (worker da API) não fica presa esperando o job.
+        """
+        return obter_motor().agendar(self.executar_scraping_async(url, output_folder))
+
+    async def executar_scraping_async(self, url, output_folder):
+        """
+        Versão para o event loop do motor assíncrono: scrapers só-HTTP rodam direto
+        no loop; os de navegador vão para a pool de threads do navegador do motor.
+        """
+        try:
+            scraper = self._instanciar(url, output_folder)
+        except Exception as e:
+            return {'sucesso': False, 'erro': str(e)}
+        if not scraper:
+            return {'sucesso': False, 'erro': 'Site não configurado ou URL inválida'}
+        if not scraper.assincrono():
+            return await obter_motor().em_thread_navegador(self.executar_scraping, url, output_folder)
+
+        print(f"   --> Iniciando scraper: {scraper.site_nome} (assíncrono)")
+        try:
+            return await scraper.rodar_async()
+        except Exception as e:
+            return {'sucesso': False, 'erro': str(e)}
+        finally:
+            # Scrapers VTEX podem ter caído no navegador quando a API falhou
+            scraper.liberar_navegadores()
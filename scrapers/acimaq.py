@@ -7,10 +7,26 @@ from bs4 import BeautifulSoup
 import time
 import os
 import re
-from .base import BaseScraper
+from .plataformas.vtex import ScraperVTEX
 
-class AcimaqScraper(BaseScraper):
-    def executar(self):
+class AcimaqScraper(ScraperVTEX):
+    TERMOS_IGNORADOS_SPECS = ("garantia", "manutenção", "sac", "nota fiscal", "assistência")
+
+    # Spec da extração em uma única chamada ao navegador (ver BaseScraper.extrair_no_navegador)
+    EXTRACAO = {
+        'titulo': ['h1[class*="productNameContainer"]', 'h1'],
+        'descricao': [
+            {'seletor': '[class*="productDescriptionText"], [class*="productDescriptionContainer"]', 'minimo': 1}
+        ],
+        'specs': [
+            # Estrutura VTEX customizada da Acimaq (item_technical_info) e tabelas clássicas
+            {'linhas': '[class*="item_technical_info"]', 'chave': '[class*="title_technical_info"]', 'valor': '[class*="value_technical_info"]'},
+            {'linhas': 'tr', 'chave': 'th', 'valor': 'td', 'somar': True}
+        ],
+        'imagens': ['img[class*="productImageTag"]']
+    }
+
+    def executar_navegador(self):
         driver = None
         try:
             print(f"   [Acimaq] Iniciando Scraper (Estratégia VTEX Avançada)...")
@@ -31,7 +47,7 @@ class AcimaqScraper(BaseScraper):
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.maximize_window() 
             
             print(f"   [Acimaq] Acessando: {self.url}")
@@ -46,9 +62,7 @@ class AcimaqScraper(BaseScraper):
             
             # --- 1. ROLAGEM LENTA (Lazy Load) ---
             print("   [Acimaq] Vasculhando a página...")
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=2500)
             
             # --- 2. CLICAR EM "VER MAIS" (Expandir a Descrição da VTEX) ---
             print("   [Acimaq] Procurando botões para expandir a descrição e ficha técnica...")
@@ -76,28 +90,22 @@ class AcimaqScraper(BaseScraper):
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            extraido = self.extrair_no_navegador(driver, self.EXTRACAO)
 
             # --- TÍTULO ---
-            titulo = "Produto Acimaq"
-            h1 = soup.find('h1', class_=re.compile(r'productNameContainer'))
-            if not h1: h1 = soup.find('h1')
-            if h1: titulo = self.limpar_texto(h1.get_text())
+            titulo = self.limpar_texto(extraido['titulo']) or "Produto Acimaq"
             print(f"   ✅ Título capturado: {titulo}")
 
             # --- DESCRIÇÃO ---
             print("   [Acimaq] Extraindo Descrição...")
             descricao = "Descrição indisponível."
             try:
-                # Usa JS para capturar a div exata da VTEX ignorando as restrições de tamanho
-                descricao_bruta = driver.execute_script("""
-                    var d = document.querySelector('[class*="productDescriptionText"], [class*="productDescriptionContainer"]');
-                    if(d) return d.innerText;
-                    return '';
-                """)
+                # A div exata da VTEX já veio do navegador, sem restrição de tamanho
+                descricao_bruta = extraido['descricao']
                 
                 if not descricao_bruta or len(descricao_bruta.strip()) < 15:
                     # Fallback BeautifulSoup
+                    soup = BeautifulSoup(driver.page_source, 'html.parser')
                     desc_bs4 = soup.find('div', class_=re.compile(r"productDescriptionText"))
                     if desc_bs4:
                         for br in desc_bs4.find_all("br"): br.replace_with("\n")
@@ -115,31 +123,7 @@ class AcimaqScraper(BaseScraper):
             print("   [Acimaq] Extraindo Ficha Técnica...")
             specs = {}
             try:
-                specs_dict = driver.execute_script("""
-                    var specs = {};
-                    // Busca pela estrutura de tabela da Acimaq (item_technical_info) ou tabelas clássicas
-                    var rows = document.querySelectorAll('[class*="item_technical_info"], tr');
-                    rows.forEach(r => {
-                        var th, td;
-                        if(r.tagName.toLowerCase() === 'tr') {
-                            th = r.querySelector('th');
-                            td = r.querySelector('td');
-                        } else {
-                            // Estrutura VTEX customizada da Acimaq
-                            th = r.querySelector('[class*="title_technical_info"]');
-                            td = r.querySelector('[class*="value_technical_info"]');
-                        }
-                        
-                        if(th && td) {
-                            var key = th.innerText.trim();
-                            var val = td.innerText.trim();
-                            if(key && val && key !== val) {
-                                specs[key] = val;
-                            }
-                        }
-                    });
-                    return specs;
-                """)
+                specs_dict = extraido['specs']
                 
                 if specs_dict:
                     for k, v in specs_dict.items():
@@ -147,7 +131,7 @@ class AcimaqScraper(BaseScraper):
                         valor_limpo = self.limpar_texto(v)
                         # Aplica o bloqueio de Lixo Comercial
                         ignorar = False
-                        termos_proibidos_specs = ["garantia", "manutenção", "sac", "nota fiscal", "assistência"]
+                        termos_proibidos_specs = self.TERMOS_IGNORADOS_SPECS
                         if any(t in chave_limpa.lower() or t in valor_limpo.lower() for t in termos_proibidos_specs):
                             ignorar = True
 
@@ -163,9 +147,8 @@ class AcimaqScraper(BaseScraper):
             url_img = None
             caminho_imagem = None
             
-            img_container = soup.find('img', class_=re.compile(r'productImageTag--main|productImageTag'))
-            if img_container:
-                url_img = img_container.get('src')
+            if extraido['imagens']:
+                url_img = extraido['imagens'][0]
 
             if url_img:
                 print(f"   [Acimaq] URL da imagem encontrada: {url_img}")
@@ -177,12 +160,9 @@ class AcimaqScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[class*='productImageTag--main'], img[class*='productImageTag']")
                     if el_img:
-                        filename = f"temp_img_acimaq_{int(time.time())}.png"
+                        filename = f"temp_img_acimaq_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -212,5 +192,5 @@ class AcimaqScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
\ No newline at end of file
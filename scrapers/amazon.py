@@ -1,5 +1,4 @@
 # scrapers/amazon.py
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 import time
@@ -18,7 +17,7 @@ class AmazonScraper(BaseScraper):
             opts.add_argument('--ignore-certificate-errors')
             opts.add_argument(f'user-agent={self.headers["User-Agent"]}')
 
-            driver = webdriver.Chrome(options=opts)
+            driver = self.abrir_navegador(opts, undetected=False)
 
             print(f"   [Amazon] Acessando: {self.url}")
             driver.get(self.url)
@@ -93,4 +92,4 @@ class AmazonScraper(BaseScraper):
             print(f"   [ERRO SELENIUM] {str(e)}")
             return {'sucesso': False, 'erro': str(e)}
         finally:
-            if driver: driver.quit()
\ No newline at end of file
+            if driver: self.fechar_navegador(driver)
\ No newline at end of file
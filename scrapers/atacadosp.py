@@ -7,9 +7,9 @@ from bs4 import BeautifulSoup
 import time
 import os
 import traceback
-from .base import BaseScraper
+from .plataformas.vtex import ScraperVTEX
 
-class AtacadoSPScraper(BaseScraper):
+class AtacadoSPScraper(ScraperVTEX):
     def log_debug(self, msg):
         try:
             # Cria um ficheiro de log direto na pasta datasheetget (impossível de ser bloqueado)
@@ -20,7 +20,7 @@ class AtacadoSPScraper(BaseScraper):
         except:
             pass
 
-    def executar(self):
+    def executar_navegador(self):
         driver = None
         self.log_debug("="*40)
         self.log_debug(f"1. INICIANDO ATACADO SP: {self.url}")
@@ -47,8 +47,8 @@ class AtacadoSPScraper(BaseScraper):
             options.add_argument("--disable-dev-shm-usage") 
             options.add_argument("--disable-gpu") 
             
-            self.log_debug("3. Abrindo Chrome Headless (V109)...")
-            driver = uc.Chrome(options=options, version_main=109)
+            self.log_debug("3. Abrindo Chrome Headless...")
+            driver = self.abrir_navegador(options)
             
             self.log_debug("4. Acessando a página...")
             driver.set_page_load_timeout(30)
@@ -104,15 +104,11 @@ class AtacadoSPScraper(BaseScraper):
                         if imgs: el_img = imgs[0]
 
                     if el_img:
-                        # Centraliza a imagem na tela para garantir que ela carregou 100%
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(2) # Espera a animação de zoom terminar
-                        
                         # Salva na mesma pasta de output para o gerador de PDF achar fácil
                         filename = f"temp_img_atacadosp_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
                         
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         self.log_debug(f"   [OK] Screenshot capturado com sucesso em: {caminho_imagem}")
                     else:
                         self.log_debug("   [ERRO] Não achou a imagem nem para tirar foto.")
@@ -175,6 +171,6 @@ class AtacadoSPScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
             self.log_debug("13. Processo terminado. Chrome encerrado.")
\ No newline at end of file
@@ -1,16 +1,60 @@
 # scrapers/base.py
 import os
-import requests
 import re
+import time
+import base64
+import uuid
+import asyncio
 from datetime import datetime
+from urllib.parse import urlparse
 from PIL import Image
 from io import BytesIO
+from bs4 import BeautifulSoup
 from utils.generator import DocGenerator
+from utils.bloqueio_recursos import aplicar_bloqueio, remover_bloqueio, BLOQUEIO_PADRAO
+from utils.scripts_navegador import AGUARDAR_PAGINA, EXTRAIR_PRODUTO, PREPARAR_CAPTURA, COLETAR_ESTRUTURADOS
+from utils.runtime_navegador import obter_runtime
+from utils.perfis_navegador import obter_perfis, parece_desafio
+from utils.camadas_busca import obter_memoria_camadas
+from utils.cache_snapshots import obter_snapshots
+from utils.dados_estruturados import extrair_dados_estruturados, IDENTIFICADORES
+from utils.estado_hidratacao import extrair_estado_hidratacao
+from utils.sessoes_http import http_get
+from utils.motor_async import obter_motor
+from utils.pool_navegadores import opcoes_padrao
+from utils.supervisor_navegadores import DonoJob
 
 class BaseScraper:
+    # Todo HTML da página do produto (GET, navegador, extração no DOM) passa pelos dados
+    # estruturados, e o que o DOM não trouxe sai deles (ver completar_com_estruturados).
+    # Scraper que trata esses dados por conta própria desliga com False.
+    LER_DADOS_ESTRUTURADOS = True
+
     def __init__(self, url):
         self.url = url
         self.output_folder = ""
+
+        # Entrada do SITES_CONFIG (injetada pelo ScraperManager)
+        self.site_nome = None
+        self.config_site = {}
+
+        # Pool de navegadores (injetado pelo ScraperManager). Sem pool, cada job abre o seu Chrome.
+        self.pool_navegadores = None
+        self._navegadores_abertos = []
+        self._dono = DonoJob()
+
+        # Última leitura de JSON-LD/microdata/OpenGraph da página (ver ler_dados_estruturados)
+        self.estruturados = None
+
+        # Downloads de imagem disparados pelo caminho assíncrono (ver rodar_async)
+        self._tarefas_imagem = []
+
+        # Limite global de navegadores (injetado pelo ScraperManager)
+        self.governador = None
+        self._vaga_navegador = False
+
+        # True quando cookies/consentimento de um job anterior foram restaurados
+        self.estado_restaurado = False
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -83,21 +127,513 @@ class BaseScraper:
                 specs_limpas[k] = v
         return specs_limpas
 
+    def abrir_navegador(self, options=None, undetected=True):
+        """Pega um navegador emprestado do pool (ou abre um novo se o scraper rodar sozinho)"""
+        perfil = self.config_site.get('perfil_persistente') and self.site_nome
+        if perfil:
+            if options is None: options = opcoes_padrao()
+            options.add_argument(f"--user-data-dir={obter_perfis().pasta_user_data(self.site_nome)}")
+
+        # Espera na fila por uma vaga de navegador (uma vaga por job)
+        if self.governador and not self._vaga_navegador:
+            self.governador.adquirir()
+            self._vaga_navegador = True
+
+        try:
+            if self.pool_navegadores:
+                driver = self.pool_navegadores.emprestar(options, undetected, dono=self._dono)
+            else:
+                driver = obter_runtime().criar_driver(options, undetected)
+        except Exception:
+            self._liberar_vaga()
+            raise
+
+        self._navegadores_abertos.append(driver)
+        aplicar_bloqueio(driver, self.config_site.get('bloquear_recursos', BLOQUEIO_PADRAO))
+        if perfil:
+            self.estado_restaurado = obter_perfis().restaurar(driver, self.site_nome)
+        return driver
+
+    def fechar_navegador(self, driver):
+        """Devolve o navegador ao pool. Pode ser chamado mais de uma vez com segurança."""
+        if driver is None or driver not in self._navegadores_abertos: return
+        self._navegadores_abertos.remove(driver)
+
+        if self.config_site.get('perfil_persistente') and self.site_nome:
+            perfis = obter_perfis()
+            try:
+                if not perfis.desafio_na_pagina(driver):
+                    perfis.salvar(driver, self.site_nome)
+            except: pass
+            perfis.descartar_script(driver)
+
+        if self.pool_navegadores:
+            self.pool_navegadores.devolver(driver)
+        else:
+            try: driver.quit()
+            except: pass
+        self._liberar_vaga()
+
+    def _liberar_vaga(self):
+        if self._vaga_navegador and not self._navegadores_abertos:
+            self._vaga_navegador = False
+            self.governador.liberar()
+
+    def http_get(self, url, **kwargs):
+        """
+        GET pela sessão compartilhada do host (keep-alive), com o TLS configurado para o site.
+        A resposta HTML da própria página do produto já passa pelos dados estruturados.
+        """
+        res = self._http_get(url, **kwargs)
+        if url == self.url and res.status_code == 200 and 'html' in res.headers.get('Content-Type', ''):
+            self._registrar_estruturados(res.text)
+        return res
+
+    def _http_get(self, url, **kwargs):
+        return http_get(url, tls=self.config_site.get('tls'), cache_ttl=self.config_site.get('cache_ttl'), **kwargs)
+
+    def obter_html(self, obrigatorios=None, headers=None, renderizar=None, options=None, undetected=True,
+                   aceitar_estruturados=False):
+        """
+        Busca em camadas: tenta um GET simples e só abre o navegador se a resposta for
+        uma página de bloqueio ou não tiver todos os seletores CSS de `obrigatorios`.
+        Com `aceitar_estruturados`, o GET também basta quando os dados estruturados da
+        página estão completos (ver ler_dados_estruturados).
+        A camada que resolveu fica registrada e o próximo job do site já começa nela.
+        `renderizar(driver)` roda logo depois do driver.get (esperas, cliques); sem ele,
+        usa aguardar_pagina. Retorna (html, driver); driver é None quando o HTTP bastou.
+        """
+        memoria = obter_memoria_camadas()
+        site = self.site_nome or urlparse(self.url).netloc
+        if memoria.camada_inicial(site) == 'http':
+            html = self._buscar_http(headers or self.headers, obrigatorios, aceitar_estruturados)
+            if html:
+                memoria.registrar(site, 'http')
+                print("   ⚡ Página resolvida por HTTP (sem navegador).")
+                return html, None
+            print("   🪜 HTTP não trouxe o produto. Escalando para o navegador...")
+
+        driver = self.abrir_navegador(options, undetected)
+        driver.set_page_load_timeout(30)
+        driver.get(self.url)
+        if renderizar:
+            renderizar(driver)
+        else:
+            self.aguardar_pagina(driver)
+        memoria.registrar(site, 'navegador')
+        html = driver.page_source
+        self._registrar_estruturados(html)
+        return html, driver
+
+    def ler_snapshot(self):
+        """
+        DOM renderizado guardado por um job anterior (sites com 'snapshot_ttl').
+        None quando não há snapshot válido: o scraper segue com o navegador, como sempre.
+        """
+        ttl = self.config_site.get('snapshot_ttl')
+        if not ttl:
+            return None
+        html = obter_snapshots().ler(self.url, ttl)
+        if html:
+            print("   ⚡ Página renderizada veio do cache de snapshots (sem navegador).")
+        return html
+
+    def guardar_snapshot(self, html):
+        """Guarda o DOM final (depois de esperas e cliques) para os próximos jobs da mesma URL"""
+        ttl = self.config_site.get('snapshot_ttl')
+        if not ttl or not html:
+            return
+        try:
+            obter_snapshots().gravar(self.url, html, ttl)
+        except Exception as e:
+            print(f"   ⚠️ [SNAPSHOT] Falha ao gravar: {e}")
+
+    def _buscar_http(self, headers, obrigatorios, aceitar_estruturados=False):
+        try:
+            res = self._http_get(self.url, headers=headers, timeout=15)
+        except Exception as e:
+            print(f"   ⚠️ GET direto falhou: {e}")
+            return None
+        if res.status_code != 200 or parece_desafio(res.text[:20000]):
+            return None
+        if not obrigatorios and not aceitar_estruturados and not self.LER_DADOS_ESTRUTURADOS:
+            return res.text
+        # Um parse só: serve aos seletores obrigatórios e aos dados estruturados
+        soup = BeautifulSoup(res.text, 'html.parser')
+        estruturados = self._registrar_estruturados(soup)
+        if not obrigatorios and not aceitar_estruturados:
+            return res.text
+        if obrigatorios and all(soup.select_one(seletor) for seletor in obrigatorios):
+            return res.text
+        if aceitar_estruturados and (estruturados or extrair_dados_estruturados(soup, url_base=self.url))['completo']:
+            return res.text
+        return None
+
+    def ler_dados_estruturados(self, html):
+        """
+        Primeira passada sobre o HTML buscado: JSON-LD, microdata e OpenGraph
+        (ver utils/dados_estruturados.py). Com 'completo', o scraper pode pular as
+        heurísticas de DOM e fechar o job com finalizar_estruturados. A leitura fica em
+        self.estruturados para completar a ficha no fim do job.
+        """
+        estruturados = extrair_dados_estruturados(html, url_base=self.url)
+        if estruturados['fontes']:
+            situacao = "completos" if estruturados['completo'] else "parciais"
+            print(f"   🧾 Dados estruturados {situacao} ({', '.join(estruturados['fontes'])}): "
+                  f"{len(estruturados['specs'])} specs.")
+        self.estruturados = estruturados
+        return estruturados
+
+    def _registrar_estruturados(self, html):
+        """Leitura automática dos pontos de busca (GET, navegador, extração no DOM)"""
+        if not self.LER_DADOS_ESTRUTURADOS:
+            return None
+        try:
+            return self.ler_dados_estruturados(html)
+        except Exception as e:
+            print(f"   ⚠️ Dados estruturados ilegíveis: {e}")
+            return None
+
+    def _estruturados_do_navegador(self, driver):
+        """Só os trechos estruturados do DOM renderizado (sem trazer o page_source)"""
+        if not self.LER_DADOS_ESTRUTURADOS:
+            return None
+        try:
+            trechos = driver.execute_script(COLETAR_ESTRUTURADOS)
+        except Exception as e:
+            print(f"   ⚠️ Dados estruturados do navegador indisponíveis: {e}")
+            return None
+        return self._registrar_estruturados(trechos or "")
+
+    def completar_com_estruturados(self, dados):
+        """
+        Passada final de todo job (chamada pelo gerar_arquivos_finais): título provisório,
+        descrição vazia, imagem que faltou e ficha pobre (menos de 3 itens) saem dos dados
+        estruturados da página. Sem leitura até aqui e com navegador aberto, lê dele.
+        Na ficha só entram specs técnicas: Marca/SKU/EAN e afins ficam com o DOM.
+        """
+        if not self.LER_DADOS_ESTRUTURADOS:
+            return dados
+        if self.estruturados is None and self._navegadores_abertos:
+            self._estruturados_do_navegador(self._navegadores_abertos[-1])
+        estruturados = self.estruturados
+        if not estruturados or not estruturados['fontes']:
+            return dados
+
+        if self._titulo_provisorio(dados.get('titulo')) and estruturados['titulo']:
+            dados['titulo'] = self.limpar_texto(estruturados['titulo'])
+
+        descricao = dados.get('descricao') or ""
+        if (len(descricao) < 40 or descricao == "Informações técnicas não detalhadas.") \
+                and len(estruturados['descricao']) > len(descricao):
+            dados['descricao'] = self.limpar_lixo_comercial(estruturados['descricao'])
+
+        specs = dados.get('caracteristicas')
+        if isinstance(specs, dict) and len(specs) < 3:
+            tecnicas = {k: v for k, v in estruturados['specs'].items() if k not in IDENTIFICADORES}
+            for k, v in self.filtrar_specs(tecnicas).items():
+                specs.setdefault(k, v)
+        elif specs is None:
+            dados['caracteristicas'] = self.filtrar_specs(
+                {k: v for k, v in estruturados['specs'].items() if k not in IDENTIFICADORES}
+            )
+
+        if not dados.get('caminho_imagem_temp') and estruturados['imagem']:
+            dados['caminho_imagem_temp'] = self.baixar_imagem_temp(estruturados['imagem'])
+        return dados
+
+    def _titulo_provisorio(self, titulo):
+        # "Produto Magalu", "Livro Travessa"...: o título padrão de quando o DOM não achou o h1
+        palavras = str(titulo or "").split()
+        return len(" ".join(palavras)) < 5 or (palavras[0] in ("Produto", "Livro") and len(palavras) <= 4)
+
+    def buscar_estado_hidratacao(self, headers=None, minimo_specs=3):
+        """
+        Camada HTTP dos sites em Next.js/React: um GET e a leitura do JSON de hidratação
+        (__NEXT_DATA__, __INITIAL_STATE__...; ver utils/estado_hidratacao.py).
+        Retorna o estado quando ele está completo (feche o job com finalizar_estruturados)
+        ou None quando o navegador ainda é necessário. Usa a mesma memória de camadas do
+        obter_html: site que não resolve por HTTP vai direto para o navegador.
+        """
+        memoria = obter_memoria_camadas()
+        site = self.site_nome or urlparse(self.url).netloc
+        if memoria.camada_inicial(site) != 'http':
+            return None
+        try:
+            res = self._http_get(self.url, headers=headers or self.headers, timeout=15)
+            if res.status_code == 200 and not parece_desafio(res.text[:20000]):
+                soup = BeautifulSoup(res.text, 'html.parser')
+                estado = extrair_estado_hidratacao(soup, url_base=self.url, minimo_specs=minimo_specs,
+                                                   estruturados=self._registrar_estruturados(soup))
+                if estado['fontes']:
+                    situacao = "completo" if estado['completo'] else "parcial"
+                    print(f"   🧾 Estado de hidratação {situacao} ({', '.join(estado['fontes'])}): "
+                          f"{len(estado['specs'])} specs.")
+                if estado['completo']:
+                    memoria.registrar(site, 'http')
+                    return estado
+        except Exception as e:
+            print(f"   ⚠️ GET direto falhou: {e}")
+        print("   🪜 HTML cru não trouxe o produto. Escalando para o navegador...")
+        memoria.registrar(site, 'navegador')
+        return None
+
+    def finalizar_estruturados(self, estruturados, filtro_specs=None, **sobrepor):
+        """
+        Fecha o job só com os dados estruturados (ou o estado de hidratação, que tem o
+        mesmo formato). `filtro_specs` é o filtro de specs do próprio site (o mesmo do
+        caminho pelo DOM), aplicado depois do filtrar_specs. `sobrepor` troca campos de
+        `dados` (ex.: descrição traduzida, imagem já capturada em 'caminho_imagem_temp';
+        sem imagem, baixa a do JSON-LD/OpenGraph).
+        """
+        print("   ⚡ Dados completos sem renderizar: pulando as heurísticas de DOM.")
+        specs = self.filtrar_specs(estruturados['specs'])
+        if filtro_specs:
+            specs = filtro_specs(specs)
+        dados = {
+            "titulo": self.limpar_texto(estruturados['titulo']),
+            "descricao": self.limpar_lixo_comercial(estruturados['descricao']),
+            "caracteristicas": specs
+        }
+        dados.update(sobrepor)
+        if not dados.get('caminho_imagem_temp'):
+            dados['caminho_imagem_temp'] = self.baixar_imagem_temp(estruturados['imagem'])
+
+        titulo = dados['titulo']
+        total_imagens = 1 if dados['caminho_imagem_temp'] else 0
+        arquivos = self.gerar_arquivos_finais(dados)
+
+        return {
+            'sucesso': True,
+            'titulo': titulo,
+            'descricao': dados['descricao'],
+            'caracteristicas': dados['caracteristicas'],
+            'total_imagens': total_imagens,
+            'arquivos': arquivos
+        }
+
+    def aguardar_pagina(self, driver, seletor=None, profundidade=3000, quietude_ms=400, tempo_maximo=None):
+        """
+        Substitui os 'scroll + time.sleep' fixos: retorna assim que o seletor existir,
+        a rede e o DOM ficarem quietos e as imagens visíveis carregarem (rolando até
+        `profundidade` px para disparar o lazy load). Use profundidade=0 para não rolar.
+        O limite vem de 'tempo_prontidao' no SITES_CONFIG (padrão 8s).
+        """
+        if tempo_maximo is None:
+            tempo_maximo = self.config_site.get('tempo_prontidao', 8)
+        inicio = time.time()
+        try:
+            driver.set_script_timeout(tempo_maximo + 5)
+            resultado = driver.execute_async_script(
+                AGUARDAR_PAGINA, seletor, profundidade, quietude_ms, int(tempo_maximo * 1000)
+            )
+        except Exception as e:
+            print(f"   ⚠️ Prontidão da página não confirmada: {e}")
+            return False
+
+        pronto = bool(resultado and resultado.get('pronto'))
+        if not pronto:
+            print(f"   ⚠️ Página não estabilizou em {tempo_maximo}s. Seguindo com o que carregou.")
+        else:
+            print(f"   ⏱️ Página pronta em {time.time() - inicio:.1f}s")
+        return pronto
+
+    def aguardar_desafio(self, driver, tempo_maximo=20):
+        """
+        Substitui o 'time.sleep' fixo esperando o anti-bot: se a página já é o produto,
+        retorna na hora. Se caiu no desafio, invalida o estado salvo e espera ele passar.
+        """
+        perfis = obter_perfis()
+        if not perfis.desafio_na_pagina(driver):
+            return True
+
+        print("   🛡️ Desafio anti-bot detectado. Aguardando liberação...")
+        if self.site_nome:
+            perfis.invalidar(self.site_nome)
+        limite = time.time() + tempo_maximo
+        while time.time() < limite:
+            time.sleep(0.5)
+            if not perfis.desafio_na_pagina(driver):
+                print("   ✅ Desafio superado.")
+                if self.config_site.get('perfil_persistente') and self.site_nome:
+                    perfis.salvar(driver, self.site_nome)
+                return True
+        print(f"   ⚠️ Desafio não liberou em {tempo_maximo}s.")
+        return False
+
+    def extrair_no_navegador(self, driver, spec):
+        """
+        Extrai título, descrição, specs e URLs de imagem numa única ida ao navegador,
+        seguindo o spec declarativo do site (formato em utils/scripts_navegador.py).
+        Nada de page_source nem BeautifulSoup no caminho principal. Campos não
+        encontrados voltam vazios para o scraper cair no fallback antigo.
+        """
+        dados = {'titulo': '', 'descricao': '', 'specs': {}, 'imagens': []}
+        if self.estruturados is None:
+            self._estruturados_do_navegador(driver)
+        try:
+            resultado = driver.execute_script(EXTRAIR_PRODUTO, spec) or {}
+        except Exception as e:
+            print(f"   ⚠️ Extração no navegador falhou: {e}")
+            return dados
+        dados.update({k: v for k, v in resultado.items() if k in dados and v})
+        return dados
+
+    def liberar_imagens(self, driver):
+        """Desliga o bloqueio de imagens e força o download das <img> da página (para screenshots)"""
+        if 'imagens' not in getattr(driver, 'categorias_bloqueadas', []): return
+        remover_bloqueio(driver, ['imagens'])
+        try:
+            driver.execute_script("""
+                document.querySelectorAll('img').forEach(function(img) {
+                    if (img.currentSrc || img.src) { var s = img.src; img.src = ''; img.src = s; }
+                });
+            """)
+        except: pass
+
+    def capturar_elemento(self, driver, elemento, tamanho=500, qualidade=90):
+        """
+        Print só do retângulo do elemento via CDP (Page.captureScreenshot com clip), já em
+        JPEG e no tamanho final do documento (`tamanho` px no maior lado). Não rola a página
+        nem usa sleep fixo: só espera a <img> terminar de carregar, se ainda não terminou.
+        Retorna os bytes do JPEG.
+        """
+        self.liberar_imagens(driver)
+        driver.set_script_timeout(10)
+        caixa = driver.execute_async_script(PREPARAR_CAPTURA, elemento, 3000)
+        if not caixa or caixa['largura'] < 1 or caixa['altura'] < 1:
+            raise Exception("Elemento sem área visível para captura")
+
+        # Renderiza direto na resolução final (o DocGenerator reduz para 500px de qualquer forma)
+        maior_lado = max(caixa['largura'], caixa['altura']) * caixa['escala']
+        escala = min(1.0, tamanho / maior_lado)
+        resposta = driver.execute_cdp_cmd("Page.captureScreenshot", {
+            "format": "jpeg",
+            "quality": qualidade,
+            "captureBeyondViewport": True,
+            "clip": {
+                "x": caixa['x'], "y": caixa['y'],
+                "width": caixa['largura'], "height": caixa['altura'],
+                "scale": escala
+            }
+        })
+        conteudo = base64.b64decode(resposta['data'])
+
+        # Telas com devicePixelRatio > 1 ainda podem sair maiores que o alvo
+        img = Image.open(BytesIO(conteudo))
+        if max(img.size) > tamanho:
+            img = img.convert("RGB")
+            img.thumbnail((tamanho, tamanho), Image.Resampling.LANCZOS)
+            saida = BytesIO()
+            img.save(saida, "JPEG", quality=qualidade)
+            conteudo = saida.getvalue()
+        return conteudo
+
+    def salvar_captura(self, driver, elemento, caminho):
+        """Atalho para os fallbacks de imagem: captura o elemento e grava o JPEG em `caminho`"""
+        with open(caminho, 'wb') as f:
+            f.write(self.capturar_elemento(driver, elemento))
+        return caminho
+
+    def liberar_navegadores(self):
+        """Garante que nenhum navegador fique preso ao job depois que ele termina"""
+        for driver in list(self._navegadores_abertos):
+            self.fechar_navegador(driver)
+        # O que ainda constar emprestado a este job vira órfão para o supervisor
+        self._dono.encerrar()
+
     def baixar_imagem_temp(self, url_imagem):
         if not url_imagem or not self.output_folder: return None
         try:
             if url_imagem.startswith("//"): url_imagem = "https:" + url_imagem
-            res = requests.get(url_imagem, headers=self.headers, stream=True, timeout=10)
+            res = self.http_get(url_imagem, headers=self.headers, timeout=10)
             if res.status_code == 200:
-                filename = os.path.join(self.output_folder, "temp_img.jpg")
-                img = Image.open(BytesIO(res.content)).convert("RGB")
-                img.save(filename, "JPEG", quality=90)
-                return filename
+                return self._salvar_imagem_temp(res.content)
         except: pass
         return None
 
+    def _salvar_imagem_temp(self, conteudo):
+        # Nome único: jobs simultâneos podem dividir a mesma pasta de saída
+        filename = os.path.join(self.output_folder, f"temp_img_{uuid.uuid4().hex[:8]}.jpg")
+        img = Image.open(BytesIO(conteudo)).convert("RGB")
+        img.save(filename, "JPEG", quality=90)
+        return filename
+
+    # ------------------------------------------------------------------
+    # CAMINHO ASSÍNCRONO (scrapers só-HTTP implementam executar_async)
+    # ------------------------------------------------------------------
+    async def http_get_async(self, url, headers=None, timeout=None):
+        """GET no motor assíncrono, com o TLS configurado para o site"""
+        return await obter_motor().get(url, tls=self.config_site.get('tls'), headers=headers, timeout=timeout,
+                                       cache_ttl=self.config_site.get('cache_ttl'))
+
+    async def baixar_imagem_temp_async(self, url_imagem):
+        if not url_imagem or not self.output_folder: return None
+        try:
+            if url_imagem.startswith("//"): url_imagem = "https:" + url_imagem
+            res = await self.http_get_async(url_imagem, headers=self.headers, timeout=10)
+            if res.status_code == 200:
+                return await asyncio.to_thread(self._salvar_imagem_temp, res.content)
+        except: pass
+        return None
+
+    def iniciar_download_imagem(self, url_imagem):
+        """Dispara o download da imagem em paralelo com o resto do parsing; dê await na tarefa depois"""
+        tarefa = asyncio.ensure_future(self.baixar_imagem_temp_async(url_imagem))
+        self._tarefas_imagem.append(tarefa)
+        return tarefa
+
+    async def parsear_html_async(self, html):
+        """
+        BeautifulSoup numa thread: parsear uma página grande no loop trava todos os outros jobs.
+        O primeiro HTML parseado no job (a página do produto) já passa pelos dados estruturados.
+        """
+        return await asyncio.to_thread(self._parsear_pagina, html)
+
+    def _parsear_pagina(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+        if self.estruturados is None:
+            self._registrar_estruturados(soup)
+        return soup
+
+    async def rodar_async(self):
+        """Entrada do caminho assíncrono: executar_async + descarte das imagens que o job não usou"""
+        try:
+            return await self.executar_async()
+        finally:
+            await self._descartar_tarefas_imagem()
+
+    async def _descartar_tarefas_imagem(self):
+        # Job que falhou antes do await da imagem: cancela o download ou apaga o temporário já gravado
+        tarefas, self._tarefas_imagem = self._tarefas_imagem, []
+        for tarefa in tarefas:
+            if not tarefa.done():
+                tarefa.cancel()
+        for caminho in await asyncio.gather(*tarefas, return_exceptions=True):
+            if isinstance(caminho, str) and os.path.exists(caminho):
+                try: os.remove(caminho)
+                except: pass
+
+    async def gerar_arquivos_finais_async(self, dados):
+        # Word/PDF são CPU e disco: saem do loop para não travar os outros jobs
+        return await asyncio.to_thread(self.gerar_arquivos_finais, dados)
+
+    async def finalizar_async(self, dados, url_imagem):
+        """Baixa a imagem, gera Word/PDF e monta o retorno padrão (motores de plataforma)"""
+        dados['caminho_imagem_temp'] = await self.baixar_imagem_temp_async(url_imagem)
+        arquivos = await self.gerar_arquivos_finais_async(dados)
+        return {
+            'sucesso': True,
+            'titulo': dados['titulo'],
+            'descricao': dados['descricao'],
+            'caracteristicas': dados['caracteristicas'],
+            'total_imagens': 1 if dados['caminho_imagem_temp'] else 0,
+            'arquivos': arquivos
+        }
+
     def gerar_arquivos_finais(self, dados):
         if not self.output_folder: raise Exception("Pasta de saída indefinida")
+        self.completar_com_estruturados(dados)
 
         if 'titulo' in dados and dados['titulo']:
             dados['titulo'] = str(dados['titulo']).upper()
@@ -127,4 +663,14 @@ class BaseScraper:
         }
 
     def executar(self):
-        raise NotImplementedError
\ No newline at end of file
+        if not self.assincrono():
+            raise NotImplementedError
+        # Scraper só-HTTP: roda no event loop compartilhado, esta thread só espera
+        return obter_motor().executar(self.rodar_async())
+
+    async def executar_async(self):
+        raise NotImplementedError
+
+    @classmethod
+    def assincrono(cls):
+        return cls.executar_async is not BaseScraper.executar_async
@@ -6,11 +6,13 @@ from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 import time
 import os
-import json
 from deep_translator import GoogleTranslator
 from .base import BaseScraper
 
 class BhPhotoVideoScraper(BaseScraper):
+    # Os dados estruturados da B&H vêm em inglês: este scraper os trata (e traduz) por conta própria
+    LER_DADOS_ESTRUTURADOS = False
+
     def executar(self):
         driver = None
         try:
@@ -29,8 +31,8 @@ class BhPhotoVideoScraper(BaseScraper):
             options.add_argument("--disable-http2")
             options.page_load_strategy = 'eager'
             
-            # CRÍTICO: Versão 109 para rodar no Windows Server 2012 R2
-            driver = uc.Chrome(options=options, version_main=109)
+            # Versão do Chrome/chromedriver resolvida pelo runtime compartilhado (utils/runtime_navegador.py)
+            driver = self.abrir_navegador(options)
             
             # =========================================================
             # ETAPA 1: PÁGINA PRINCIPAL
@@ -56,6 +58,10 @@ class BhPhotoVideoScraper(BaseScraper):
             titulo = "Produto B&H"
             h1 = soup_main.find("h1", attrs={"data-selenium": "productTitle"})
             if h1: titulo = self.limpar_texto(h1.get_text())
+
+            estruturados = self.ler_dados_estruturados(soup_main)
+            if titulo == "Produto B&H" and estruturados['titulo']:
+                titulo = self.limpar_texto(estruturados['titulo'])
             print(f"   [DEBUG] Título: {titulo}")
 
             # --- IMAGEM ---
@@ -71,16 +77,23 @@ class BhPhotoVideoScraper(BaseScraper):
                     els = driver.find_elements(By.CSS_SELECTOR, seletor)
                     for el in els:
                         if el.is_displayed() and el.size['width'] > 50:
-                            filename = "temp_img_bh.png"
+                            filename = "temp_img_bh.jpg"
                             caminho_imagem = os.path.join(self.pasta_saida, filename)
-                            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
-                            time.sleep(0.3)
-                            el.screenshot(caminho_imagem)
+                            self.salvar_captura(driver, el, caminho_imagem)
                             print(f"   ✅ Imagem salva.")
                             break
                     if caminho_imagem: break
                 except: pass
 
+            # Dados estruturados completos dispensam as páginas /overview e /specs
+            if estruturados['completo']:
+                return self.finalizar_estruturados(
+                    estruturados,
+                    titulo=titulo,
+                    descricao=self.traduzir_texto(estruturados['descricao']),
+                    caminho_imagem_temp=caminho_imagem
+                )
+
             # =========================================================
             # ETAPA 2: OVERVIEW
             # =========================================================
@@ -177,29 +190,10 @@ class BhPhotoVideoScraper(BaseScraper):
                                 if not any(ig in k.lower() for ig in ["packaging", "box dim", "peso da emb"]):
                                     specs[k] = v
             
-            # 2. Extração Oculta (JSON-LD)
+            # 2. Extração Oculta (JSON-LD: marca, SKU, dimensões...)
             if not specs:
                 print("   ⚠️ Tabelas vazias. Buscando dados ocultos (JSON-LD)...")
-                try:
-                    scripts = soup_specs.find_all("script", type="application/ld+json")
-                    for script in scripts:
-                        try:
-                            txt = script.get_text()
-                            if "weight" in txt or "width" in txt:
-                                data = json.loads(txt)
-                                if isinstance(data, list): data = data[0]
-                                
-                                if "width" in data: specs["Largura"] = str(data["width"])
-                                if "height" in data: specs["Altura"] = str(data["height"])
-                                if "depth" in data: specs["Profundidade"] = str(data["depth"])
-                                if "weight" in data: specs["Peso"] = str(data["weight"])
-                                if "sku" in data: specs["SKU"] = str(data["sku"])
-                                if "brand" in data: 
-                                    b = data["brand"]
-                                    if isinstance(b, dict): specs["Marca"] = b.get("name", "")
-                                    else: specs["Marca"] = str(b)
-                        except: pass
-                except: pass
+                specs = dict(estruturados['specs'] or self.ler_dados_estruturados(soup_specs)['specs'])
 
             # A TRADUÇÃO DE SPECS FOI REMOVIDA DAQUI
             specs_final = specs
@@ -227,11 +221,11 @@ class BhPhotoVideoScraper(BaseScraper):
 
         except Exception as e:
             print(f"   ❌ [ERRO B&H] {e}")
-            if driver: driver.quit()
+            if driver: self.fechar_navegador(driver)
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def traduzir_texto(self, texto, curto=False):
@@ -43,7 +43,7 @@ class BradyidScraper(BaseScraper):
             options.add_argument("--password-store=basic")
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             
             print(f"   [BradyID] A aceder a: {self.url}")
             driver.set_page_load_timeout(30)
@@ -58,9 +58,7 @@ class BradyidScraper(BaseScraper):
                 print("   ⚠️ Aviso: Título não encontrado rapidamente. A forçar a extração.")
             
             # --- ROLAGEM PROGRESSIVA ---
-            for i in range(4):
-                driver.execute_script("window.scrollBy(0, 600);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=2400)
 
             # --- AUTO-CLICKER ---
             print("   [BradyID] A expandir painéis de especificações (Accordions)...")
@@ -71,7 +69,7 @@ class BradyidScraper(BaseScraper):
                     try { botoes[i].click(); } catch(e) {}
                 }
             """)
-            time.sleep(2)
+            self.aguardar_pagina(driver, profundidade=0)
             
             soup = BeautifulSoup(driver.page_source, 'html.parser')
 
@@ -157,11 +155,9 @@ class BradyidScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[data-test-id='media-gallery-main-image']")
                     if el_img:
-                        filename = f"temp_img_brady_{int(time.time())}.png"
+                        filename = f"temp_img_brady_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except: pass
 
@@ -190,5 +186,5 @@ class BradyidScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
\ No newline at end of file
@@ -7,10 +7,31 @@ from bs4 import BeautifulSoup
 import time
 import os
 import re
-from .base import BaseScraper
+from .plataformas.vtex import ScraperVTEX
 
-class BrastempScraper(BaseScraper):
-    def executar(self):
+class BrastempScraper(ScraperVTEX):
+    TERMOS_IGNORADOS_SPECS = ("garantia", "ean", "referência", "palavra chave", "sku", "sac", "nota fiscal", "textos legais", "itens inclusos na embalagem")
+
+    # Spec da extração em uma única chamada ao navegador (ver BaseScraper.extrair_no_navegador)
+    EXTRACAO = {
+        'titulo': ['h1.btp-product-title__title-new, h1[class*="productNameContainer"]', 'h1'],
+        'descricao': [
+            # Layout Whirlpool (Cartões de Diferenciais): título numa linha, texto na seguinte
+            {'itens': '.whirlpool-styleguide-0-x-whp_styleguide-imageTextCard--texts', 'titulo': 'h3', 'texto': 'p',
+             'marcador': '', 'separador': '\n'},
+            # Fallback VTEX genérico
+            '.productDescriptionText, .productDescription'
+        ],
+        'specs': [
+            # A Brastemp usa listas onde o texto é "Chave: Valor"
+            {'itens': '.whp_styleguide-producttechnicaltable p, .whirlpool-styleguide-0-x-whp_styleguide-technicalSpecifications-alert p'},
+            # Fallback para Tabela VTEX tradicional
+            {'linhas': 'tr', 'chave': 'th', 'valor': 'td'}
+        ],
+        'imagens': ['img[class*="productImageTag"]', 'meta[property="og:image"]']
+    }
+
+    def executar_navegador(self):
         driver = None
         try:
             print(f"   [Brastemp] Iniciando Scraper (Motor Whirlpool/VTEX)...")
@@ -29,7 +50,7 @@ class BrastempScraper(BaseScraper):
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.minimize_window() 
             
             print(f"   [Brastemp] Acedendo: {self.url}")
@@ -47,9 +68,7 @@ class BrastempScraper(BaseScraper):
             
             # --- 1. ROLAGEM PROGRESSIVA (Garante o carregamento de imagens e blocos dinâmicos) ---
             print("   [Brastemp] A vasculhar a página para contornar o Lazy Load...")
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 600);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=3000)
             
             # --- 2. DESTRUIDOR DE BOTÕES DE CATÁLOGO (Expandir) ---
             print("   [Brastemp] A clicar nos botões de expansão de ficha técnica...")
@@ -71,49 +90,26 @@ class BrastempScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(2)
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            extraido = self.extrair_no_navegador(driver, self.EXTRACAO)
 
             # --- TÍTULO ---
-            titulo = "Produto Brastemp"
-            h1 = soup.find('h1', class_=re.compile(r'btp-product-title__title-new|productNameContainer'))
-            if not h1: h1 = soup.find('h1')
-            if h1: titulo = self.limpar_texto(h1.get_text())
+            titulo = self.limpar_texto(extraido['titulo']) or "Produto Brastemp"
             print(f"   ✅ Título capturado: {titulo}")
 
             # --- DESCRIÇÃO ---
             print("   [Brastemp] A extrair Descrição...")
             descricao = "Descrição indisponível."
             try:
-                descricao_bruta = driver.execute_script("""
-                    var text = '';
-                    
-                    // Estratégia Principal: Layout Whirlpool (Cartões de Diferenciais)
-                    var cards = document.querySelectorAll('.whirlpool-styleguide-0-x-whp_styleguide-imageTextCard--texts');
-                    if (cards.length > 0) {
-                        cards.forEach(c => {
-                            var h3 = c.querySelector('h3');
-                            var p = c.querySelector('p');
-                            if(h3) text += h3.innerText.trim() + '\\n';
-                            if(p) text += p.innerText.trim() + '\\n\\n';
-                        });
-                    }
-                    
-                    // Estratégia de Fallback: VTEX Genérico
-                    if (text.length < 15) {
-                        var desc = document.querySelector('.productDescriptionText, .productDescription');
-                        if (desc) text = desc.innerText;
-                    }
-                    
-                    return text;
-                """)
+                descricao_bruta = extraido['descricao']
                 
-                # Se não apanhou via JS, usa o BeautifulSoup como rede de segurança
+                # Se não apanhou no navegador, usa o BeautifulSoup como rede de segurança
                 if not descricao_bruta or len(descricao_bruta.strip()) < 15:
+                    soup = BeautifulSoup(driver.page_source, 'html.parser')
                     cards_bs4 = soup.find_all('div', class_=re.compile(r"imageTextCard--texts"))
                     if cards_bs4:
                         linhas = []
@@ -136,39 +132,7 @@ class BrastempScraper(BaseScraper):
             print("   [Brastemp] A extrair Ficha Técnica...")
             specs = {}
             try:
-                specs_dict = driver.execute_script("""
-                    var specs = {};
-                    
-                    // A Brastemp usa listas onde o texto é "Chave: Valor"
-                    var items = document.querySelectorAll('.whp_styleguide-producttechnicaltable p, .whirlpool-styleguide-0-x-whp_styleguide-technicalSpecifications-alert p');
-                    
-                    if (items.length > 0) {
-                        items.forEach(p => {
-                            var text = p.innerText.trim();
-                            if(text.includes(':')) {
-                                var parts = text.split(':');
-                                var key = parts.shift().trim(); // Apanha a primeira parte antes dos dois pontos
-                                var val = parts.join(':').trim(); // Junta o resto caso o valor também tenha dois pontos
-                                if(key && val) {
-                                    specs[key] = val;
-                                }
-                            }
-                        });
-                    } else {
-                        // Fallback para Tabela VTEX tradicional
-                        var rows = document.querySelectorAll('tr');
-                        rows.forEach(r => {
-                            var th = r.querySelector('th');
-                            var td = r.querySelector('td');
-                            if(th && td) {
-                                var key = th.innerText.trim();
-                                var val = td.innerText.trim();
-                                if(key && val && key !== val) specs[key] = val;
-                            }
-                        });
-                    }
-                    return specs;
-                """)
+                specs_dict = extraido['specs']
                 
                 if specs_dict:
                     for k, v in specs_dict.items():
@@ -177,10 +141,7 @@ class BrastempScraper(BaseScraper):
                         
                         # Filtro rigoroso adaptado aos textos da Brastemp
                         ignorar = False
-                        termos_proibidos_specs = [
-                            "garantia", "ean", "referência", "palavra chave", 
-                            "sku", "sac", "nota fiscal", "textos legais", "itens inclusos na embalagem"
-                        ]
+                        termos_proibidos_specs = self.TERMOS_IGNORADOS_SPECS
                         if any(t in chave_limpa.lower() or t in valor_limpo.lower() for t in termos_proibidos_specs):
                             ignorar = True
 
@@ -199,13 +160,8 @@ class BrastempScraper(BaseScraper):
             url_img = None
             caminho_imagem = None
             
-            img_container = soup.find('img', class_=re.compile(r'productImageTag--main|productImageTag'))
-            if img_container:
-                url_img = img_container.get('src')
-                
-            if not url_img:
-                meta_img = soup.find("meta", property="og:image")
-                if meta_img: url_img = meta_img.get("content")
+            if extraido['imagens']:
+                url_img = extraido['imagens'][0]
 
             if url_img:
                 print(f"   [Brastemp] URL da imagem encontrada: {url_img}")
@@ -217,12 +173,9 @@ class BrastempScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[class*='productImageTag--main'], img[class*='productImageTag']")
                     if el_img:
-                        filename = f"temp_img_brastemp_{int(time.time())}.png"
+                        filename = f"temp_img_brastemp_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -252,5 +205,5 @@ class BrastempScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
\ No newline at end of file
@@ -20,61 +20,20 @@ class CasasBahiaScraper(BaseScraper):
             if not os.path.exists(self.output_folder): 
                 os.makedirs(self.output_folder)
 
-            options = uc.ChromeOptions()
-            options.page_load_strategy = 'eager'
-            options.add_argument("--no-first-run")
-            options.add_argument("--password-store=basic")
-            options.add_argument(f'--user-agent={self.headers.get("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")}')
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920,1080")
-            
-            driver = uc.Chrome(options=options, version_main=109)
-            driver.set_window_size(1920, 1080)
-            
-            print(f"   [Casas Bahia] A aceder a: {self.url}")
-            driver.set_page_load_timeout(30)
-            driver.get(self.url)
-            
-            print("   [Casas Bahia] A aguardar renderização inicial...")
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "h1, [data-testid='dsvia-base-div']"))
-                )
-            except:
-                print("   ⚠️ Aviso: H1 não encontrado rapidamente. A forçar a extração.")
-            
-            # --- ROLAGEM PROGRESSIVA ---
-            print("   [Casas Bahia] A vasculhar a página para contornar o Lazy Load...")
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 600);")
-                time.sleep(1)
-            
-            # --- AUTO-CLICKER DUPLO (Ver Mais + Especificações) ---
-            print("   [Casas Bahia] A expandir botões e separadores da Ficha Técnica...")
-            driver.execute_script("""
-                // 1. Clica no botão "Ver mais" das características
-                var btnVerMais = document.querySelector('[data-cy="product-characteristics-see-more"]');
-                if(btnVerMais) { try { btnVerMais.click(); } catch(e) {} }
-                
-                // 2. Procura e clica no separador "Especificações Técnicas"
-                var textos = document.querySelectorAll('p, div, button, span');
-                for (var i = 0; i < textos.length; i++) {
-                    if(textos[i].innerText) {
-                        var textoLimpo = textos[i].innerText.trim().toLowerCase();
-                        if (textoLimpo === 'especificações técnicas' || textoLimpo === 'características') {
-                            try { textos[i].click(); } catch(e) {}
-                        }
-                    }
-                }
-            """)
-            time.sleep(2) # Aguarda a animação de abertura das abas
-            
-            driver.execute_script("window.scrollTo(0, 300);")
-            time.sleep(0.5)
+            # Snapshot do DOM renderizado (job repetido/reprocessado): pula o navegador
+            html = self.ler_snapshot()
+            if not html:
+                # O JSON de hidratação do HTML cru já traz o produto: um GET, sem navegador
+                estado = self.buscar_estado_hidratacao()
+                if estado:
+                    return self.finalizar_estruturados(
+                        estado, filtro_specs=self.filtrar_specs_casasbahia,
+                        descricao=self.limpar_descricao_casasbahia(estado['descricao'])
+                    )
+                driver = self.renderizar_casasbahia()
+                html = driver.page_source
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
 
             # --- TÍTULO ---
             titulo = "Produto Casas Bahia"
@@ -99,13 +58,17 @@ class CasasBahiaScraper(BaseScraper):
                         if texto and len(texto) > 3:
                             linhas_desc.append(texto)
                     descricao_bruta = "\n\n".join(linhas_desc)
-                else:
+                elif driver:
                     # Fallback via Javascript caso a classe mude
                     descricao_bruta = driver.execute_script("""
                         var desc = document.querySelector('[id="descricao"], [data-component="special-content"], .product-description');
                         if (desc) return desc.innerText;
                         return '';
                     """)
+                else:
+                    # Snapshot em cache: mesmo seletor do fallback JS, lido do HTML guardado
+                    desc = soup.select_one('[id="descricao"], [data-component="special-content"], .product-description')
+                    if desc: descricao_bruta = desc.get_text(separator="\n", strip=True)
 
                 if descricao_bruta and len(descricao_bruta.strip()) > 15:
                     descricao = self.limpar_descricao_casasbahia(descricao_bruta.strip())
@@ -138,17 +101,7 @@ class CasasBahiaScraper(BaseScraper):
                                 specs[chave] = valor
                 
                 # Limpeza rigorosa
-                specs_limpas = {}
-                termos_proibidos_specs = [
-                    "garantia", "entrega do produto", "conteúdo da embalagem", 
-                    "cód. item", "outros produtos"
-                ]
-                for k, v in specs.items():
-                    k_lower = k.lower()
-                    if not any(t in k_lower for t in termos_proibidos_specs):
-                        specs_limpas[k] = v
-                
-                specs = specs_limpas
+                specs = self.filtrar_specs_casasbahia(specs)
                 if hasattr(self, 'filtrar_specs'):
                     specs = self.filtrar_specs(specs)
                     
@@ -178,18 +131,16 @@ class CasasBahiaScraper(BaseScraper):
                 print(f"   [Casas Bahia] URL da imagem original encontrada: {url_img}")
                 caminho_imagem = self.baixar_imagem_temp(url_img)
 
-            if not caminho_imagem or not os.path.exists(caminho_imagem):
+            imagem_por_url = bool(caminho_imagem)
+            if driver and (not caminho_imagem or not os.path.exists(caminho_imagem)):
                 print("   [Casas Bahia] A recorrer ao Screenshot da imagem principal...")
                 try:
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[alt*='Imagem do produto'], img[alt*='produto']")
                     if el_img:
-                        filename = f"temp_img_cb_{int(time.time())}.png"
+                        filename = f"temp_img_cb_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -205,6 +156,10 @@ class CasasBahiaScraper(BaseScraper):
             print("   [Casas Bahia] A gerar ficheiros PDF/Word...")
             arquivos = self.gerar_arquivos_finais(dados)
 
+            # Só guarda o snapshot se ele reproduz o job inteiro (a captura de tela precisa do navegador)
+            if driver and imagem_por_url:
+                self.guardar_snapshot(html)
+
             return {
                 'sucesso': True,
                 'titulo': titulo,
@@ -219,9 +174,65 @@ class CasasBahiaScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
+    def renderizar_casasbahia(self):
+        """Abre o Chrome, rola a página e expande "Ver mais" e a aba de especificações"""
+        options = uc.ChromeOptions()
+        options.page_load_strategy = 'eager'
+        options.add_argument("--no-first-run")
+        options.add_argument("--password-store=basic")
+        options.add_argument(f'--user-agent={self.headers.get("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")}')
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+
+        driver = self.abrir_navegador(options)
+        driver.set_window_size(1920, 1080)
+
+        print(f"   [Casas Bahia] A aceder a: {self.url}")
+        driver.set_page_load_timeout(30)
+        driver.get(self.url)
+
+        print("   [Casas Bahia] A aguardar renderização inicial...")
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "h1, [data-testid='dsvia-base-div']"))
+            )
+        except:
+            print("   ⚠️ Aviso: H1 não encontrado rapidamente. A forçar a extração.")
+
+        # --- ROLAGEM PROGRESSIVA ---
+        print("   [Casas Bahia] A vasculhar a página para contornar o Lazy Load...")
+        self.aguardar_pagina(driver, profundidade=3000)
+
+        # --- AUTO-CLICKER DUPLO (Ver Mais + Especificações) ---
+        print("   [Casas Bahia] A expandir botões e separadores da Ficha Técnica...")
+        driver.execute_script("""
+            // 1. Clica no botão "Ver mais" das características
+            var btnVerMais = document.querySelector('[data-cy="product-characteristics-see-more"]');
+            if(btnVerMais) { try { btnVerMais.click(); } catch(e) {} }
+
+            // 2. Procura e clica no separador "Especificações Técnicas"
+            var textos = document.querySelectorAll('p, div, button, span');
+            for (var i = 0; i < textos.length; i++) {
+                if(textos[i].innerText) {
+                    var textoLimpo = textos[i].innerText.trim().toLowerCase();
+                    if (textoLimpo === 'especificações técnicas' || textoLimpo === 'características') {
+                        try { textos[i].click(); } catch(e) {}
+                    }
+                }
+            }
+        """)
+        self.aguardar_pagina(driver, profundidade=0)
+
+        driver.execute_script("window.scrollTo(0, 300);")
+        time.sleep(0.5)
+
+        return driver
+
     def limpar_descricao_casasbahia(self, texto_bruto):
         if not texto_bruto: return "Descrição indisponível."
 
@@ -246,4 +257,12 @@ class CasasBahiaScraper(BaseScraper):
             
             linhas_limpas.append(linha_clean)
 
-        return "\n\n".join(linhas_limpas)
\ No newline at end of file
+        return "\n\n".join(linhas_limpas)
+
+    def filtrar_specs_casasbahia(self, specs):
+        specs_limpas = {}
+        ignorar = ["garantia", "entrega do produto", "conteúdo da embalagem", "cód. item", "outros produtos"]
+        for k, v in specs.items():
+            if not any(x in k.lower() for x in ignorar):
+                specs_limpas[k] = v
+        return specs_limpas
\ No newline at end of file
@@ -7,10 +7,31 @@ from bs4 import BeautifulSoup
 import time
 import os
 import re
-from .base import BaseScraper
+from .plataformas.vtex import ScraperVTEX
 
-class CetroScraper(BaseScraper):
-    def executar(self):
+class CetroScraper(ScraperVTEX):
+    TERMOS_IGNORADOS_SPECS = ("garantia", "ean", "referência", "sku", "sac", "vídeo")
+
+    # Spec da extração em uma única chamada ao navegador (ver BaseScraper.extrair_no_navegador)
+    EXTRACAO = {
+        'titulo': ['h1[class*="productBrand"], h1[class*="productNameContainer"], span[class*="productBrand"], span[class*="productNameContainer"]', 'h1'],
+        'descricao': [
+            '.vtex-store-components-3-x-productDescriptionText, .productDescription',
+            # Blocos de Rich Text, IGNORANDO os que pertencem à Ficha Técnica (ex: Voltagem, Peso)
+            {'itens': '.vtex-rich-text-0-x-paragraph', 'minimo_item': 5, 'limite_marcador': 60, 'somar': True,
+             'ignorar': '[class*="-title"]:not([class*="special-details"]), [class*="-description"]:not([class*="special-details"])'}
+        ],
+        'specs': [
+            # 1. Tabela VTEX Tradicional
+            {'chaves': '.vtex-product-specifications-1-x-specificationName', 'valores': '.vtex-product-specifications-1-x-specificationValue'},
+            # 2. Especificações "escondidas" nos blocos visuais (títulos longos são subtítulos de marketing)
+            {'chaves': 'p[class*="-title"]', 'container': '.vtex-flex-layout-0-x-flexCol', 'valor': 'p[class*="-description"]',
+             'chave_max': 40, 'somar': True}
+        ],
+        'imagens': ['img[class*="productImageTag"]', 'meta[property="og:image"]']
+    }
+
+    def executar_navegador(self):
         driver = None
         try:
             print(f"   [Cetro] A iniciar Scraper (Motor VTEX IO com Escudo de Rodapé Máximo)...")
@@ -31,7 +52,7 @@ class CetroScraper(BaseScraper):
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.set_window_size(1920, 1080)
             
             print(f"   [Cetro] A aceder a: {self.url}")
@@ -48,9 +69,7 @@ class CetroScraper(BaseScraper):
             
             # --- ROLAGEM PROGRESSIVA ---
             print("   [Cetro] A executar rolagem para carregar descrições e módulos ocultos...")
-            for i in range(6):
-                driver.execute_script("window.scrollBy(0, 600);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=3600)
             
             # --- AUTO-CLICKER ---
             print("   [Cetro] A expandir abas de Especificações e Descrição...")
@@ -72,60 +91,26 @@ class CetroScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(2)
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            extraido = self.extrair_no_navegador(driver, self.EXTRACAO)
 
             # --- TÍTULO ---
-            titulo = "Produto Cetro"
-            h1 = soup.find(['h1', 'span'], class_=re.compile(r'productBrand|productNameContainer'))
-            if not h1: h1 = soup.find('h1')
-            if h1: titulo = self.limpar_texto(h1.get_text())
+            titulo = self.limpar_texto(extraido['titulo']) or "Produto Cetro"
             print(f"   ✅ Título capturado: {titulo}")
 
             # --- DESCRIÇÃO ---
             print("   [Cetro] A extrair Descrição Limpa...")
             descricao = "Descrição indisponível."
             try:
-                descricao_bruta = driver.execute_script("""
-                    var text = '';
-                    
-                    // 1. Apanha a descrição principal
-                    var desc = document.querySelector('.vtex-store-components-3-x-productDescriptionText, .productDescription');
-                    if (desc && desc.innerText.trim().length > 15) {
-                        text += desc.innerText.trim() + '\\n\\n';
-                    }
-                    
-                    // 2. Apanha blocos de Rich Text, IGNORANDO os que pertencem à Ficha Técnica
-                    var richTexts = document.querySelectorAll('.vtex-rich-text-0-x-paragraph');
-                    richTexts.forEach(p => {
-                        var pText = p.innerText.trim();
-                        var pClass = p.className || "";
-                        
-                        // Impede que características técnicas (ex: Voltagem, Peso) contaminem a descrição
-                        if (pClass.includes('-title') || pClass.includes('-description')) {
-                            if (!pClass.includes('special-details')) {
-                                return; // É uma spec técnica, ignora!
-                            }
-                        }
-                        
-                        if (pText.length > 4 && !text.includes(pText)) {
-                            if (pText.length < 60) {
-                                text += '• ' + pText + '\\n';
-                            } else {
-                                text += pText + '\\n\\n';
-                            }
-                        }
-                    });
-                    
-                    return text.trim();
-                """)
+                descricao_bruta = extraido['descricao']
                 
                 # Fallback em Python
                 if not descricao_bruta or len(descricao_bruta.strip()) < 15:
+                    soup = BeautifulSoup(driver.page_source, 'html.parser')
                     desc_bs4 = soup.find('div', class_=re.compile(r"productDescriptionText"))
                     if desc_bs4:
                         for br in desc_bs4.find_all("br"): br.replace_with("\n")
@@ -143,37 +128,7 @@ class CetroScraper(BaseScraper):
             print("   [Cetro] A extrair Ficha Técnica Dupla...")
             specs = {}
             try:
-                specs_dict = driver.execute_script("""
-                    var specs = {};
-                    
-                    // 1. Extrai a Tabela VTEX Tradicional
-                    var names = document.querySelectorAll('.vtex-product-specifications-1-x-specificationName');
-                    var values = document.querySelectorAll('.vtex-product-specifications-1-x-specificationValue');
-                    for(var i = 0; i < names.length; i++) {
-                        if(names[i] && values[i]) {
-                            specs[names[i].innerText.trim()] = values[i].innerText.trim().replace(/\\n/g, '; ');
-                        }
-                    }
-                    
-                    // 2. Extrai as Especificações "Escondidas" nos blocos Visuais (Ex: Tensão, Consumo, etc)
-                    var gridTitles = document.querySelectorAll('p[class*="-title"]');
-                    gridTitles.forEach(t => {
-                        var key = t.innerText.trim();
-                        // Ignora títulos muito longos que são na verdade subtítulos de marketing
-                        if(key.length > 40) return; 
-                        
-                        // Procura o valor correspondente dentro da mesma coluna
-                        var container = t.closest('.vtex-flex-layout-0-x-flexCol');
-                        if(container) {
-                            var desc = container.querySelector('p[class*="-description"]');
-                            if(desc) {
-                                specs[key] = desc.innerText.trim().replace(/\\n/g, '; ');
-                            }
-                        }
-                    });
-                    
-                    return specs;
-                """)
+                specs_dict = extraido['specs']
                 
                 if specs_dict:
                     for k, v in specs_dict.items():
@@ -181,7 +136,7 @@ class CetroScraper(BaseScraper):
                         valor_limpo = self.limpar_texto(v)
                         
                         ignorar = False
-                        termos_proibidos_specs = ["garantia", "ean", "referência", "sku", "sac", "vídeo"]
+                        termos_proibidos_specs = self.TERMOS_IGNORADOS_SPECS
                         if any(t in chave_limpa.lower() or t in valor_limpo.lower() for t in termos_proibidos_specs):
                             ignorar = True
 
@@ -200,13 +155,8 @@ class CetroScraper(BaseScraper):
             url_img = None
             caminho_imagem = None
             
-            img_container = soup.find('img', class_=re.compile(r'productImageTag--main|productImageTag'))
-            if img_container:
-                url_img = img_container.get('src')
-                
-            if not url_img:
-                meta_img = soup.find("meta", property="og:image")
-                if meta_img: url_img = meta_img.get("content")
+            if extraido['imagens']:
+                url_img = extraido['imagens'][0]
 
             if url_img:
                 if "?" in url_img:
@@ -220,12 +170,9 @@ class CetroScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[class*='productImageTag--main'], img[class*='productImageTag']")
                     if el_img:
-                        filename = f"temp_img_cetro_{int(time.time())}.png"
+                        filename = f"temp_img_cetro_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -255,7 +202,7 @@ class CetroScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_cetro(self, texto_bruto):
@@ -306,4 +253,7 @@ class CetroScraper(BaseScraper):
         resultado = "\n".join(linhas_limpas)
         resultado = re.sub(r'\n{3,}', '\n\n', resultado)
         
-        return resultado.strip()
\ No newline at end of file
+        return resultado.strip()
+
+    def limpar_descricao_vtex(self, texto):
+        return self.limpar_descricao_cetro(texto)
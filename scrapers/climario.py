@@ -7,10 +7,27 @@ from bs4 import BeautifulSoup
 import time
 import os
 import re
-from .base import BaseScraper
-
-class ClimarioScraper(BaseScraper):
-    def executar(self):
+from .plataformas.vtex import ScraperVTEX
+
+class ClimarioScraper(ScraperVTEX):
+    TERMOS_IGNORADOS_SPECS = ("garantia", "código modelo", "ean", "referência", "sku", "sac", "nota fiscal", "informações fornecidas")
+
+    # Spec da extração em uma única chamada ao navegador (ver BaseScraper.extrair_no_navegador)
+    EXTRACAO = {
+        'titulo': ['h1[class*="productBrand"], h1[class*="productNameContainer"], span[class*="productBrand"], span[class*="productNameContainer"]', 'h1'],
+        'descricao': [
+            {'seletor': '.vtex-store-components-3-x-productDescriptionText, .vtex-store-components-3-x-productDescriptionContainer', 'minimo': 1}
+        ],
+        'specs': [
+            # Grelha VTEX: emparelha as chaves com os valores correspondentes
+            {'chaves': '.vtex-product-specifications-1-x-specificationName', 'valores': '.vtex-product-specifications-1-x-specificationValue'},
+            # Fallback para tabelas tradicionais
+            {'linhas': 'tr', 'chave': 'th', 'valor': 'td'}
+        ],
+        'imagens': ['img[class*="productImageTag"]', 'meta[property="og:image"]']
+    }
+
+    def executar_navegador(self):
         driver = None
         try:
             print(f"   [Climario] A iniciar Scraper (Motor VTEX IO - Grelha de Especificações)...")
@@ -30,7 +47,7 @@ class ClimarioScraper(BaseScraper):
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.set_window_size(1920, 1080)
             
             print(f"   [Climario] A aceder a: {self.url}")
@@ -48,9 +65,7 @@ class ClimarioScraper(BaseScraper):
             
             # --- ROLAGEM PROGRESSIVA ---
             print("   [Climario] A executar rolagem para carregar descrições e imagens ocultas...")
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 600);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=3000)
             
             # --- AUTO-CLICKER ---
             print("   [Climario] A ativar separadores de Descrição e Especificações...")
@@ -73,32 +88,26 @@ class ClimarioScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(2) # Aguarda a transição das abas
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 400);")
             time.sleep(0.5)
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            extraido = self.extrair_no_navegador(driver, self.EXTRACAO)
 
             # --- TÍTULO ---
-            titulo = "Produto Climario"
-            h1 = soup.find(['h1', 'span'], class_=re.compile(r'productBrand|productNameContainer'))
-            if not h1: h1 = soup.find('h1')
-            if h1: titulo = self.limpar_texto(h1.get_text())
+            titulo = self.limpar_texto(extraido['titulo']) or "Produto Climario"
             print(f"   ✅ Título capturado: {titulo}")
 
             # --- DESCRIÇÃO ---
             print("   [Climario] A extrair Descrição...")
             descricao = "Descrição indisponível."
             try:
-                descricao_bruta = driver.execute_script("""
-                    var desc = document.querySelector('.vtex-store-components-3-x-productDescriptionText, .vtex-store-components-3-x-productDescriptionContainer');
-                    if (desc) return desc.innerText;
-                    return '';
-                """)
+                descricao_bruta = extraido['descricao']
                 
                 # Rede de segurança (Fallback em Python)
                 if not descricao_bruta or len(descricao_bruta.strip()) < 15:
+                    soup = BeautifulSoup(driver.page_source, 'html.parser')
                     desc_bs4 = soup.find('div', class_=re.compile(r"productDescriptionText|productDescriptionContainer"))
                     if desc_bs4:
                         # Converte tags <br> em quebras de linha para manter a formatação original em lista
@@ -118,37 +127,7 @@ class ClimarioScraper(BaseScraper):
             specs = {}
             try:
                 # Extração otimizada com Javascript focada nas classes específicas da VTEX
-                specs_dict = driver.execute_script("""
-                    var specs = {};
-                    var names = document.querySelectorAll('.vtex-product-specifications-1-x-specificationName');
-                    var values = document.querySelectorAll('.vtex-product-specifications-1-x-specificationValue');
-                    
-                    // Emparelha as chaves com os valores correspondentes
-                    for(var i = 0; i < names.length; i++) {
-                        if(names[i] && values[i]) {
-                            var key = names[i].innerText.trim();
-                            var val = values[i].innerText.trim();
-                            if(key && val && key !== val) {
-                                specs[key] = val;
-                            }
-                        }
-                    }
-                    
-                    // Fallback para tabelas tradicionais (caso a página utilize outro formato)
-                    if (Object.keys(specs).length === 0) {
-                        var rows = document.querySelectorAll('tr');
-                        rows.forEach(r => {
-                            var th = r.querySelector('th');
-                            var td = r.querySelector('td');
-                            if(th && td) {
-                                var key = th.innerText.trim();
-                                var val = td.innerText.trim();
-                                if(key && val && key !== val) specs[key] = val;
-                            }
-                        });
-                    }
-                    return specs;
-                """)
+                specs_dict = extraido['specs']
                 
                 if specs_dict:
                     for k, v in specs_dict.items():
@@ -157,10 +136,7 @@ class ClimarioScraper(BaseScraper):
                         
                         # Filtro VTEX Rigoroso
                         ignorar = False
-                        termos_proibidos_specs = [
-                            "garantia", "código modelo", "ean", "referência", 
-                            "sku", "sac", "nota fiscal", "informações fornecidas"
-                        ]
+                        termos_proibidos_specs = self.TERMOS_IGNORADOS_SPECS
                         if any(t in chave_limpa.lower() or t in valor_limpo.lower() for t in termos_proibidos_specs):
                             ignorar = True
 
@@ -179,13 +155,8 @@ class ClimarioScraper(BaseScraper):
             url_img = None
             caminho_imagem = None
             
-            img_container = soup.find('img', class_=re.compile(r'productImageTag--main|productImageTag'))
-            if img_container:
-                url_img = img_container.get('src')
-                
-            if not url_img:
-                meta_img = soup.find("meta", property="og:image")
-                if meta_img: url_img = meta_img.get("content")
+            if extraido['imagens']:
+                url_img = extraido['imagens'][0]
 
             if url_img:
                 # TRUQUE DE ALTA RESOLUÇÃO: Remove os parâmetros de tamanho e tracking do link (tudo após o "?")
@@ -200,12 +171,9 @@ class ClimarioScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[class*='productImageTag--main'], img[class*='productImageTag']")
                     if el_img:
-                        filename = f"temp_img_climario_{int(time.time())}.png"
+                        filename = f"temp_img_climario_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -235,7 +203,7 @@ class ClimarioScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_climario(self, texto_bruto):
@@ -266,4 +234,7 @@ class ClimarioScraper(BaseScraper):
             
             linhas_limpas.append(linha_clean)
 
-        return "\n".join(linhas_limpas).strip()
\ No newline at end of file
+        return "\n".join(linhas_limpas).strip()
+
+    def limpar_descricao_vtex(self, texto):
+        return self.limpar_descricao_climario(texto)
@@ -6,7 +6,6 @@ from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 import time
 import os
-import json
 from .base import BaseScraper
 
 class CompraGoldenScraper(BaseScraper):
@@ -28,30 +27,21 @@ class CompraGoldenScraper(BaseScraper):
             options.add_argument("--disable-http2")
             options.page_load_strategy = 'eager'
 
-            # CRÍTICO: Versão 109 para rodar no Windows Server 2012 R2
-            driver = uc.Chrome(options=options, version_main=109)
-            
-            # 1. ACESSO
+            # 1. ACESSO (GET simples primeiro: JSON-LD completo dispensa o Chrome)
             print(f"   [Compra Golden] Acessando: {self.url}")
-            driver.set_page_load_timeout(30)
-            driver.get(self.url)
-
-            # Espera um elemento genérico e universal: a tag H1
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "h1"))
-                )
-            except:
-                print("   ⚠️ Timeout esperando o H1. Tentando forçar extração...")
-
-            # Scroll longo para garantir o carregamento das imagens (Essencial para Vue.js)
-            driver.execute_script("window.scrollTo(0, 800);")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, 1500);")
-            time.sleep(1)
+            html, driver = self.obter_html(
+                renderizar=self.renderizar_compragolden,
+                options=options,
+                aceitar_estruturados=True
+            )
 
             # 2. EXTRAÇÃO
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
+
+            # obter_html já leu os dados estruturados da página (GET ou navegador)
+            estruturados = self.estruturados or self.ler_dados_estruturados(soup)
+            if estruturados['completo']:
+                return self.finalizar_estruturados(estruturados)
 
             # --- TÍTULO ---
             titulo = "Produto Compra Golden"
@@ -59,11 +49,9 @@ class CompraGoldenScraper(BaseScraper):
             if h1:
                 titulo = self.limpar_texto(h1.get_text())
                 
-            # Plano B para o Título (OG Meta Tag ou JSON-LD)
-            if titulo == "Produto Compra Golden" or len(titulo) < 3:
-                meta_title = soup.find("meta", property="og:title")
-                if meta_title: 
-                    titulo = self.limpar_texto(meta_title.get("content"))
+            # Plano B para o Título (JSON-LD ou OG Meta Tag)
+            if (titulo == "Produto Compra Golden" or len(titulo) < 3) and estruturados['titulo']:
+                titulo = self.limpar_texto(estruturados['titulo'])
                     
             print(f"   [DEBUG] Título capturado: {titulo}")
 
@@ -85,15 +73,7 @@ class CompraGoldenScraper(BaseScraper):
             
             # TENTATIVA 3: Fallback JSON-LD
             if not url_img:
-                scripts = soup.find_all("script", type="application/ld+json")
-                for script in scripts:
-                    try:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict) and "image" in data:
-                            imgs = data["image"]
-                            url_img = imgs[0] if isinstance(imgs, list) else imgs
-                            break
-                    except: pass
+                url_img = estruturados['imagem']
                     
             # Correção de caminhos relativos ou mal formados
             if url_img:
@@ -139,6 +119,10 @@ class CompraGoldenScraper(BaseScraper):
                         if k and v and len(k) < 60 and "garantia" not in k.lower():
                             specs[k] = v
 
+            # Marca/EAN/etc. do JSON-LD completam a ficha quando a página não tem
+            for k, v in estruturados['specs'].items():
+                specs.setdefault(k, v)
+
             print(f"   ✅ Specs encontradas: {len(specs)} itens.")
 
             # --- FINALIZAÇÃO E GERAÇÃO DE ARQUIVOS ---
@@ -162,9 +146,25 @@ class CompraGoldenScraper(BaseScraper):
 
         except Exception as e:
             print(f"   ❌ [ERRO COMPRA GOLDEN] {e}")
-            if driver: driver.quit()
+            if driver: self.fechar_navegador(driver)
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
-                except: pass
\ No newline at end of file
+                try: self.fechar_navegador(driver)
+                except: pass
+
+    def renderizar_compragolden(self, driver):
+        """Espera o H1 e rola a página para o Vue.js carregar as imagens"""
+        # Espera um elemento genérico e universal: a tag H1
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.TAG_NAME, "h1"))
+            )
+        except:
+            print("   ⚠️ Timeout esperando o H1. Tentando forçar extração...")
+
+        # Scroll longo para garantir o carregamento das imagens (Essencial para Vue.js)
+        driver.execute_script("window.scrollTo(0, 800);")
+        time.sleep(1)
+        driver.execute_script("window.scrollTo(0, 1500);")
+        time.sleep(1)
@@ -7,10 +7,31 @@ from bs4 import BeautifulSoup
 import time
 import os
 import re
-from .base import BaseScraper
-
-class ConsulScraper(BaseScraper):
-    def executar(self):
+from .plataformas.vtex import ScraperVTEX
+
+class ConsulScraper(ScraperVTEX):
+    TERMOS_IGNORADOS_SPECS = ("garantia", "ean", "referência", "sku", "sac", "nota fiscal", "textos legais", "itens inclusos", "diferenciais")
+
+    # Spec da extração em uma única chamada ao navegador (ver BaseScraper.extrair_no_navegador)
+    EXTRACAO = {
+        'titulo': ['[class*="productBrand"], [class*="productNameContainer"]', 'h1'],
+        'descricao': [
+            '.productDescriptionText, .productDescription',
+            {'itens': '.whirlpool-styleguide-0-x-whp_styleguide-imageTextCard--texts', 'titulo': 'h3', 'texto': 'p',
+             'cabecalho': 'Destaques do Produto:', 'somar': True}
+        ],
+        'specs': [
+            # 1. Tabela de Especificações Consul (novo layout)
+            {'linhas': '.consul-pdp-components-0-x-table-technical-specification-custom tr', 'chave': 'td:nth-of-type(1)', 'valor': 'td:nth-of-type(2)'},
+            # 2. Whirlpool Styleguide ("Chave: Valor")
+            {'itens': '.whp_styleguide-producttechnicaltable p, .whirlpool-styleguide-0-x-whp_styleguide-technicalSpecifications-alert p'},
+            # 3. Fallback Genérico VTEX
+            {'linhas': 'tr', 'chave': 'th', 'valor': 'td'}
+        ],
+        'imagens': ['img[class*="productImageTag"]', 'meta[property="og:image"]']
+    }
+
+    def executar_navegador(self):
         driver = None
         try:
             print(f"   [Consul] A iniciar Scraper (Motor de Tabs e Tabela Atualizada)...")
@@ -30,7 +51,7 @@ class ConsulScraper(BaseScraper):
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.set_window_size(1920, 1080)
             
             print(f"   [Consul] A aceder a: {self.url}")
@@ -47,9 +68,7 @@ class ConsulScraper(BaseScraper):
             
             # --- ROLAGEM PROGRESSIVA ---
             print("   [Consul] A vasculhar a página para contornar o Lazy Load...")
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 700);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=3500)
             
             # --- AUTO-CLICKER (Agora focado no separador de Especificações) ---
             print("   [Consul] A expandir separadores de Ficha Técnica...")
@@ -77,54 +96,25 @@ class ConsulScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(2)
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            extraido = self.extrair_no_navegador(driver, self.EXTRACAO)
 
             # --- TÍTULO ---
-            titulo = "Produto Consul"
-            h1 = soup.find(['h1', 'span', 'div'], class_=re.compile(r'productBrand|productNameContainer'))
-            if not h1: h1 = soup.find('h1')
-            if h1: titulo = self.limpar_texto(h1.get_text())
+            titulo = self.limpar_texto(extraido['titulo']) or "Produto Consul"
             print(f"   ✅ Título capturado: {titulo}")
 
             # --- DESCRIÇÃO (COM FORMATAÇÃO PREMIUM) ---
             print("   [Consul] A extrair e formatar a Descrição...")
             descricao = "Descrição indisponível."
             try:
-                descricao_bruta = driver.execute_script("""
-                    var text = '';
-                    
-                    var desc = document.querySelector('.productDescriptionText, .productDescription');
-                    if (desc && desc.innerText.trim().length > 15) {
-                        text += desc.innerText.trim() + '\\n\\n';
-                    }
-                    
-                    var cards = document.querySelectorAll('.whirlpool-styleguide-0-x-whp_styleguide-imageTextCard--texts');
-                    if (cards.length > 0) {
-                        text += 'Destaques do Produto:\\n';
-                        cards.forEach(c => {
-                            var h3 = c.querySelector('h3');
-                            var p = c.querySelector('p');
-                            
-                            var tituloCard = h3 ? h3.innerText.replace(/\\n/g, ' ').trim() : '';
-                            var textoCard = p ? p.innerText.replace(/\\n/g, ' ').trim() : '';
-                            
-                            if(tituloCard && textoCard) {
-                                text += '• ' + tituloCard + ': ' + textoCard + '\\n';
-                            } else if (textoCard) {
-                                text += '• ' + textoCard + '\\n';
-                            }
-                        });
-                    }
-                    
-                    return text;
-                """)
+                descricao_bruta = extraido['descricao']
                 
                 if not descricao_bruta or len(descricao_bruta.strip()) < 15:
+                    soup = BeautifulSoup(driver.page_source, 'html.parser')
                     linhas = []
                     cards_bs4 = soup.find_all('div', class_=re.compile(r"imageTextCard--texts"))
                     if cards_bs4:
@@ -152,55 +142,7 @@ class ConsulScraper(BaseScraper):
             print("   [Consul] A extrair Ficha Técnica...")
             specs = {}
             try:
-                specs_dict = driver.execute_script("""
-                    var specs = {};
-                    
-                    // 1. Nova Estratégia: Tabela de Especificações Consul 
-                    var tableRows = document.querySelectorAll('.consul-pdp-components-0-x-table-technical-specification-custom tr');
-                    if (tableRows.length > 0) {
-                        tableRows.forEach(r => {
-                            var tds = r.querySelectorAll('td');
-                            if (tds.length >= 2) {
-                                var key = tds[0].innerText.trim();
-                                var val = tds[1].innerText.trim();
-                                if(key && val && key !== val) specs[key] = val;
-                            }
-                        });
-                    }
-                    
-                    // 2. Estratégia Anterior (Whirlpool Styleguide com textos misturados)
-                    if (Object.keys(specs).length === 0) {
-                        var items = document.querySelectorAll('.whp_styleguide-producttechnicaltable p, .whirlpool-styleguide-0-x-whp_styleguide-technicalSpecifications-alert p');
-                        if (items.length > 0) {
-                            items.forEach(p => {
-                                var text = p.innerText.trim();
-                                if(text.includes(':')) {
-                                    var parts = text.split(':');
-                                    var key = parts.shift().trim(); 
-                                    var val = parts.join(':').trim(); 
-                                    if(key && val) {
-                                        specs[key] = val;
-                                    }
-                                }
-                            });
-                        }
-                    }
-                    
-                    // 3. Fallback Genérico VTEX
-                    if (Object.keys(specs).length === 0) {
-                        var rows = document.querySelectorAll('tr');
-                        rows.forEach(r => {
-                            var th = r.querySelector('th');
-                            var td = r.querySelector('td');
-                            if(th && td) {
-                                var key = th.innerText.trim();
-                                var val = td.innerText.trim();
-                                if(key && val && key !== val) specs[key] = val;
-                            }
-                        });
-                    }
-                    return specs;
-                """)
+                specs_dict = extraido['specs']
                 
                 if specs_dict:
                     for k, v in specs_dict.items():
@@ -208,10 +150,7 @@ class ConsulScraper(BaseScraper):
                         valor_limpo = self.limpar_texto(v)
                         
                         ignorar = False
-                        termos_proibidos_specs = [
-                            "garantia", "ean", "referência", "sku", "sac", 
-                            "nota fiscal", "textos legais", "itens inclusos", "diferenciais"
-                        ]
+                        termos_proibidos_specs = self.TERMOS_IGNORADOS_SPECS
                         if any(t in chave_limpa.lower() or t in valor_limpo.lower() for t in termos_proibidos_specs):
                             ignorar = True
 
@@ -230,13 +169,8 @@ class ConsulScraper(BaseScraper):
             url_img = None
             caminho_imagem = None
             
-            img_container = soup.find('img', class_=re.compile(r'productImageTag--main|productImageTag'))
-            if img_container:
-                url_img = img_container.get('src')
-                
-            if not url_img:
-                meta_img = soup.find("meta", property="og:image")
-                if meta_img: url_img = meta_img.get("content")
+            if extraido['imagens']:
+                url_img = extraido['imagens'][0]
 
             if url_img:
                 if "?" in url_img:
@@ -250,12 +184,9 @@ class ConsulScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[class*='productImageTag--main'], img[class*='productImageTag']")
                     if el_img:
-                        filename = f"temp_img_consul_{int(time.time())}.png"
+                        filename = f"temp_img_consul_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -285,7 +216,7 @@ class ConsulScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_consul(self, texto_bruto):
@@ -314,4 +245,7 @@ class ConsulScraper(BaseScraper):
             
             linhas_limpas.append(linha_clean)
 
-        return "\n".join(linhas_limpas)
\ No newline at end of file
+        return "\n".join(linhas_limpas)
+
+    def limpar_descricao_vtex(self, texto):
+        return self.limpar_descricao_consul(texto)
@@ -30,7 +30,7 @@ class DellScraper(BaseScraper):
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             
             print(f"   [Dell] Acessando: {self.url}")
             driver.set_page_load_timeout(30)
@@ -76,8 +76,17 @@ class DellScraper(BaseScraper):
                 print("   [Dell] Download bloqueado pela Dell. Extraindo via screenshot limpo...")
                 try:
                     # --- OCULTADOR DE BANNERS (MÉTODO SEGURO VIA CSS) ---
-                    print("   [Dell] A ocultar o banner de cookies via CSS...")
-                    time.sleep(2) # Espera que o banner carregue
+                    # Com o consentimento salvo no perfil o banner nem aparece: pula as esperas
+                    banner_visivel = not self.estado_restaurado
+                    if banner_visivel:
+                        print("   [Dell] A aceitar/ocultar o banner de cookies...")
+                        time.sleep(2) # Espera que o banner carregue
+
+                        # Aceitar grava o cookie de consentimento, que fica salvo para os próximos jobs
+                        driver.execute_script("""
+                            var btn = document.querySelector('#truste-consent-button');
+                            if (btn) { try { btn.click(); } catch(e) {} }
+                        """)
                     
                     driver.execute_script("""
                         // Cria uma regra CSS imperativa que esconde o TrustArc sem alterar a estrutura da página
@@ -96,7 +105,8 @@ class DellScraper(BaseScraper):
                         `;
                         document.head.appendChild(estilo);
                     """)
-                    time.sleep(1.5) # Dá tempo ao navegador para aplicar a invisibilidade
+                    if banner_visivel:
+                        time.sleep(1.5) # Dá tempo ao navegador para aplicar a invisibilidade
                     # ------------------------------------------------------------------------
 
                     driver.execute_script("window.scrollTo(0, 0);")
@@ -113,15 +123,10 @@ class DellScraper(BaseScraper):
                                 break
                     
                     if el_img:
-                        temp_png = f"raw_dell_{int(time.time())}.png"
-                        caminho_img_raw = os.path.join(self.pasta_saida, temp_png)
-                        
-                        # Centraliza para garantir que a imagem não saia cortada
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1.5) 
-                        
+                        temp_raw = f"raw_dell_{int(time.time())}.jpg"
+                        caminho_img_raw = os.path.join(self.pasta_saida, temp_raw)
                         # Agora tira o print da imagem limpa (o banner foi deletado)
-                        el_img.screenshot(caminho_img_raw)
+                        self.salvar_captura(driver, el_img, caminho_img_raw)
                         print(f"   [Dell] Screenshot RAW salvo perfeitamente em {caminho_img_raw}")
                     else:
                         print("   [Dell] ERRO: Não achou o elemento da imagem para o print.")
@@ -147,7 +152,7 @@ class DellScraper(BaseScraper):
                     img.close()
                     print(f"   ✅ Imagem convertida para JPEG com sucesso!")
                     
-                    # Apaga o PNG temporário para não sujar a pasta
+                    # Apaga a captura temporária para não sujar a pasta
                     time.sleep(0.5)
                     try: os.remove(caminho_img_raw)
                     except: pass
@@ -234,7 +239,7 @@ class DellScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
     
     def limpar_descricao_dell(self, texto):
@@ -1,14 +1,11 @@
 # scrapers/dimensional.py
-import requests
-from bs4 import BeautifulSoup
-from .base import BaseScraper
-import urllib3
+from .plataformas.vtex import ScraperVTEX
 
-# Desabilita avisos SSL
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-class DimensionalScraper(BaseScraper):
-    def executar(self):
+class DimensionalScraper(ScraperVTEX):
+    TERMOS_IGNORADOS_SPECS = ("datasheet", "baixar arquivo")
+
+    async def executar_pagina_vtex(self):
         try:
             print(f"   [Dimensional] Iniciando Scraper...")
             
@@ -18,12 +15,12 @@ class DimensionalScraper(BaseScraper):
             }
 
             # 1. Requisição Padrão
-            response = requests.get(self.url, headers=headers, timeout=20, verify=False)
+            response = await self.http_get_async(self.url, headers=headers, timeout=20)
             
             if response.status_code != 200:
                 raise Exception(f"Erro HTTP {response.status_code}")
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self.parsear_html_async(response.text)
 
             # --- TÍTULO ---
             # Identificado: <span class="vtex-store-components-3-x-productBrand ...">
@@ -44,6 +41,9 @@ class DimensionalScraper(BaseScraper):
                 if not url_img and img_tag.get("srcset"):
                     url_img = img_tag.get("srcset").split(" ")[0]
 
+            # A imagem já começa a baixar enquanto o resto da página é lido
+            tarefa_imagem = self.iniciar_download_imagem(url_img)
+
             # --- DESCRIÇÃO ---
             # Identificado: <div class="vtex-store-components-3-x-productDescriptionText ...">
             descricao = "Descrição indisponível."
@@ -98,10 +98,10 @@ class DimensionalScraper(BaseScraper):
                 "titulo": titulo,
                 "descricao": descricao,
                 "caracteristicas": specs,
-                "caminho_imagem_temp": self.baixar_imagem_temp(url_img)
+                "caminho_imagem_temp": await tarefa_imagem
             }
 
-            arquivos = self.gerar_arquivos_finais(dados)
+            arquivos = await self.gerar_arquivos_finais_async(dados)
 
             return {
                 'sucesso': True,
@@ -30,7 +30,7 @@ class DufrioScraper(BaseScraper):
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.set_window_size(1920, 1080)
             
             print(f"   [Dufrio] A aceder a: {self.url}")
@@ -47,9 +47,7 @@ class DufrioScraper(BaseScraper):
             
             # --- ROLAGEM PROGRESSIVA ---
             print("   [Dufrio] A vasculhar a página para contornar o Lazy Load...")
-            for i in range(6):
-                driver.execute_script("window.scrollBy(0, 600);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=3600)
             
             # --- AUTO-CLICKER ---
             print("   [Dufrio] A expandir Características Técnicas...")
@@ -68,7 +66,7 @@ class DufrioScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(2) # Aguarda a transição da aba
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
@@ -199,12 +197,9 @@ class DufrioScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[src*='/media/catalog/product/']")
                     if el_img:
-                        filename = f"temp_img_dufrio_{int(time.time())}.png"
+                        filename = f"temp_img_dufrio_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -234,7 +229,7 @@ class DufrioScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_dufrio(self, texto_bruto):
@@ -1,15 +1,10 @@
 # scrapers/dutramaquinas.py
-import requests
 import re
-from bs4 import BeautifulSoup
 from .base import BaseScraper
-import urllib3
 
-# Desabilita avisos de segurança SSL
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 class DutraMaquinasScraper(BaseScraper):
-    def executar(self):
+    async def executar_async(self):
         try:
             print(f"   [Dutra] Iniciando Scraper (V3 - Fix Encoding e Interrogações)...")
             
@@ -19,7 +14,7 @@ class DutraMaquinasScraper(BaseScraper):
             }
 
             # 1. Download do HTML
-            response = requests.get(self.url, headers=headers, timeout=20, verify=False)
+            response = await self.http_get_async(self.url, headers=headers, timeout=20)
             
             # --- CORREÇÃO DE ENCODING ---
             # O requests as vezes erra. Vamos forçar utf-8 se ele achar que é ISO mas o site for moderno
@@ -29,7 +24,7 @@ class DutraMaquinasScraper(BaseScraper):
             if response.status_code != 200:
                 raise Exception(f"Erro HTTP {response.status_code}")
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self.parsear_html_async(response.text)
 
             # --- TÍTULO ---
             titulo = "Produto Dutra"
@@ -51,6 +46,9 @@ class DutraMaquinasScraper(BaseScraper):
             if url_img and not url_img.startswith("http"):
                 url_img = "https://www.dutramaquinas.com.br" + url_img
 
+            # A imagem já começa a baixar enquanto o resto da página é lido
+            tarefa_imagem = self.iniciar_download_imagem(url_img)
+
             # --- DESCRIÇÃO (LÓGICA "MELHOR CANDIDATO") ---
             descricao_bruta = ""
             candidatos = soup.find_all("div", class_="texto")
@@ -102,10 +100,10 @@ class DutraMaquinasScraper(BaseScraper):
                 "titulo": titulo,
                 "descricao": descricao,
                 "caracteristicas": specs,
-                "caminho_imagem_temp": self.baixar_imagem_temp(url_img)
+                "caminho_imagem_temp": await tarefa_imagem
             }
 
-            arquivos = self.gerar_arquivos_finais(dados)
+            arquivos = await self.gerar_arquivos_finais_async(dados)
 
             return {
                 'sucesso': True,
@@ -29,7 +29,7 @@ class ElectroluxScraper(BaseScraper):
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.minimize_window() 
             
             print(f"   [Electrolux] A aceder a: {self.url}")
@@ -46,9 +46,7 @@ class ElectroluxScraper(BaseScraper):
             
             # --- ROLAGEM PROGRESSIVA ---
             print("   [Electrolux] A executar rolagem para carregar descrições e imagens...")
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 600);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=3000)
             
             # --- DESTRUIDOR DE BOTÕES DE CATÁLOGO ---
             print("   [Electrolux] A expandir características ocultas...")
@@ -70,7 +68,7 @@ class ElectroluxScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(2)
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
@@ -173,12 +171,9 @@ class ElectroluxScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[class*='productImageTag--main'], img[class*='productImageTag']")
                     if el_img:
-                        filename = f"temp_img_electrolux_{int(time.time())}.png"
+                        filename = f"temp_img_electrolux_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -208,7 +203,7 @@ class ElectroluxScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_electrolux(self, texto_bruto):
@@ -31,7 +31,7 @@ class ElginScraper(BaseScraper):
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.minimize_window() 
             
             print(f"   [Elgin] Acessando: {self.url}")
@@ -46,9 +46,7 @@ class ElginScraper(BaseScraper):
             
             # --- 1. ROLAGEM LENTA (Lazy Load da VTEX) ---
             print("   [Elgin] Vasculhando a página para carregar elementos ocultos...")
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=2500)
             
             # --- 2. DESTRUIDOR DE BOTÕES DE CATÁLOGO (Ver Mais) ---
             print("   [Elgin] Procurando botões para expandir a descrição e ficha técnica...")
@@ -178,12 +176,9 @@ class ElginScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[class*='productImageTag--main'], img[class*='productImageTag']")
                     if el_img:
-                        filename = f"temp_img_elgin_{int(time.time())}.png"
+                        filename = f"temp_img_elgin_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -213,5 +208,5 @@ class ElginScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
\ No newline at end of file
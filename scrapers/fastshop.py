@@ -1,5 +1,4 @@
 # scrapers/fastshop.py
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -16,42 +15,22 @@ class FastShopScraper(BaseScraper):
         try:
             print(f"   [FastShop] Iniciando Scraper (v2 - Line Breaker)...")
             
-            # --- Configuração ---
-            opts = Options()
-            opts.add_argument("--headless=new") 
-            opts.add_argument("--no-sandbox")
-            opts.add_argument("--disable-dev-shm-usage")
-            opts.add_argument("--window-size=1920,1080")
-            opts.add_argument('--ignore-certificate-errors')
-            opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36")
-
-            driver = webdriver.Chrome(options=opts)
-            driver.get(self.url)
-
-            # 1. Espera Título
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "h1"))
-                )
-            except: pass
-
-            # 2. Scroll e Expansão
-            driver.execute_script("window.scrollTo(0, 600);")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, 1200);")
-            time.sleep(2)
-            
-            # Tenta clicar em "Ver mais"
-            try:
-                botoes = driver.find_elements(By.TAG_NAME, "button")
-                for btn in botoes:
-                    if "ver mais" in btn.text.lower():
-                        driver.execute_script("arguments[0].click();", btn)
-                        time.sleep(1)
-                        break
-            except: pass
-
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            # Snapshot do DOM renderizado (job repetido/reprocessado): pula o navegador
+            html = self.ler_snapshot()
+            if not html:
+                # O JSON de hidratação do HTML cru já traz o produto: um GET, sem navegador
+                estado = self.buscar_estado_hidratacao()
+                if estado:
+                    descricao_final, specs = self.minerar_descricao_fastshop(estado['descricao'])
+                    specs.update(estado['specs'])
+                    return self.finalizar_estruturados(
+                        dict(estado, specs=specs), filtro_specs=self.filtrar_specs_fastshop,
+                        descricao=self.limpar_descricao_cirurgica(descricao_final)
+                    )
+                driver = self.renderizar_fastshop()
+                html = driver.page_source
+
+            soup = BeautifulSoup(html, 'html.parser')
 
             # --- 1. TÍTULO ---
             titulo = "Produto FastShop"
@@ -88,48 +67,7 @@ class FastShopScraper(BaseScraper):
                 # ESTRATÉGIA DE QUEBRA DE LINHA (<br>)
                 # O método get_text(separator="\n") substitui <br> por quebras de linha reais
                 texto_completo = desc_div.get_text(separator="\n")
-                
-                linhas = texto_completo.split("\n")
-                linhas_descricao = []
-                
-                # Flag para saber se entramos numa "zona de especificações"
-                zona_tecnica = False
-
-                for linha in linhas:
-                    linha = self.limpar_texto(linha)
-                    if not linha: continue
-
-                    linha_lower = linha.lower()
-
-                    # Detecta cabeçalhos de specs
-                    headers_specs = ["características", "especificações técnicas", "dimensões e peso", "itens inclusos"]
-                    if any(x == linha_lower for x in headers_specs):
-                        zona_tecnica = True
-                        continue # Não adiciona o título na descrição
-
-                    # Tenta extrair chave:valor
-                    if ":" in linha:
-                        partes = linha.split(":", 1)
-                        if len(partes) == 2:
-                            k = partes[0].strip()
-                            v = partes[1].strip()
-                            
-                            # Validação: Chaves técnicas costumam ser curtas (< 40 chars)
-                            # E valores não devem ser vazios
-                            if len(k) < 40 and len(v) > 0:
-                                # Filtra lixo comercial nas chaves
-                                if "garantia" not in k.lower() and "ean" not in k.lower():
-                                    specs[k] = v
-                                    # Se achou uma spec, considera que estamos em zona técnica ou é uma linha técnica
-                                    # Portanto, NÃO adiciona na descrição
-                                    continue
-                    
-                    # Se não for spec, verificamos se é texto útil para descrição
-                    # Ignora linhas curtas soltas que não são frases
-                    if len(linha) > 3:
-                        linhas_descricao.append(linha)
-
-                descricao_final = "\n\n".join(linhas_descricao)
+                descricao_final, specs = self.minerar_descricao_fastshop(texto_completo)
 
             # --- 4. LIMPEZA COMERCIAL ---
             descricao = self.limpar_descricao_cirurgica(descricao_final)
@@ -146,6 +84,9 @@ class FastShopScraper(BaseScraper):
 
             arquivos = self.gerar_arquivos_finais(dados)
 
+            if driver:
+                self.guardar_snapshot(html)
+
             return {
                 'sucesso': True,
                 'titulo': titulo,
@@ -160,7 +101,91 @@ class FastShopScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                driver.quit()
+                self.fechar_navegador(driver)
+
+    def renderizar_fastshop(self):
+        """Abre o Chrome, rola a página e clica em 'Ver mais'"""
+        # --- Configuração ---
+        opts = Options()
+        opts.add_argument("--headless=new") 
+        opts.add_argument("--no-sandbox")
+        opts.add_argument("--disable-dev-shm-usage")
+        opts.add_argument("--window-size=1920,1080")
+        opts.add_argument('--ignore-certificate-errors')
+        opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36")
+
+        driver = self.abrir_navegador(opts, undetected=False)
+        driver.get(self.url)
+
+        # 1. Espera Título
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.TAG_NAME, "h1"))
+            )
+        except: pass
+
+        # 2. Scroll e Expansão
+        driver.execute_script("window.scrollTo(0, 600);")
+        time.sleep(1)
+        driver.execute_script("window.scrollTo(0, 1200);")
+        time.sleep(2)
+
+        # Tenta clicar em "Ver mais"
+        try:
+            botoes = driver.find_elements(By.TAG_NAME, "button")
+            for btn in botoes:
+                if "ver mais" in btn.text.lower():
+                    driver.execute_script("arguments[0].click();", btn)
+                    time.sleep(1)
+                    break
+        except: pass
+
+        return driver
+
+    def minerar_descricao_fastshop(self, texto_completo):
+        """Separa as linhas 'Chave: Valor' (specs) do texto corrido (descrição)"""
+        specs = {}
+        linhas = texto_completo.split("\n")
+        linhas_descricao = []
+        
+        # Flag para saber se entramos numa "zona de especificações"
+        zona_tecnica = False
+
+        for linha in linhas:
+            linha = self.limpar_texto(linha)
+            if not linha: continue
+
+            linha_lower = linha.lower()
+
+            # Detecta cabeçalhos de specs
+            headers_specs = ["características", "especificações técnicas", "dimensões e peso", "itens inclusos"]
+            if any(x == linha_lower for x in headers_specs):
+                zona_tecnica = True
+                continue # Não adiciona o título na descrição
+
+            # Tenta extrair chave:valor
+            if ":" in linha:
+                partes = linha.split(":", 1)
+                if len(partes) == 2:
+                    k = partes[0].strip()
+                    v = partes[1].strip()
+                    
+                    # Validação: Chaves técnicas costumam ser curtas (< 40 chars)
+                    # E valores não devem ser vazios
+                    if len(k) < 40 and len(v) > 0:
+                        # Filtra lixo comercial nas chaves
+                        if "garantia" not in k.lower() and "ean" not in k.lower():
+                            specs[k] = v
+                            # Se achou uma spec, considera que estamos em zona técnica ou é uma linha técnica
+                            # Portanto, NÃO adiciona na descrição
+                            continue
+            
+            # Se não for spec, verificamos se é texto útil para descrição
+            # Ignora linhas curtas soltas que não são frases
+            if len(linha) > 3:
+                linhas_descricao.append(linha)
+
+        return "\n\n".join(linhas_descricao), specs
 
     def limpar_descricao_cirurgica(self, texto_bruto):
         if not texto_bruto: return "Descrição indisponível."
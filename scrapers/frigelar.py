@@ -31,7 +31,7 @@ class FrigelarScraper(BaseScraper):
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.set_window_size(1920, 1080)
             
             print(f"   [Frigelar] Acessando: {self.url}")
@@ -115,13 +115,11 @@ class FrigelarScraper(BaseScraper):
                             div.appendChild(img);
                             document.body.appendChild(div);
                         """)
-                        time.sleep(3) 
-                        
                         el_img = driver.find_element(By.ID, "imagem-captura-magica")
-                        filename = f"temp_img_frigelar_{int(time.time())}.png"
+                        filename = f"temp_img_frigelar_{int(time.time())}.jpg"
                         caminho_imagem_injecao = os.path.join(self.output_folder, filename)
                         
-                        el_img.screenshot(caminho_imagem_injecao)
+                        self.salvar_captura(driver, el_img, caminho_imagem_injecao)
                         driver.execute_script("document.getElementById('overlay-captura-magica').remove();")
                         
                         if os.path.exists(caminho_imagem_injecao) and os.path.getsize(caminho_imagem_injecao) > 1024:
@@ -239,7 +237,7 @@ class FrigelarScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_cirurgica(self, texto_bruto):
@@ -29,7 +29,7 @@ class FrioPecasBot(BaseScraper):
             opts.add_argument("--disable-dev-shm-usage")
             opts.add_argument("--disable-gpu")
             
-            driver = uc.Chrome(options=opts, version_main=109)
+            driver = self.abrir_navegador(opts)
             driver.minimize_window()
 
             print(f"   [FrioPecas] Acessando: {self.url}")
@@ -43,9 +43,7 @@ class FrioPecasBot(BaseScraper):
             
             # --- 1. ROLAGEM PROGRESSIVA (Lazy Load) ---
             print("   [FrioPecas] Vasculhando a página para carregar as secções...")
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=2500)
 
             # --- 2. CLICAR NO BOTÃO DE CARACTERÍSTICAS (Sinal de +) ---
             print("   [FrioPecas] Abrindo painéis de Ficha Técnica...")
@@ -68,7 +66,7 @@ class FrioPecasBot(BaseScraper):
                     }
                 }
             """)
-            time.sleep(2) # Espera a animação de deslize abrir a lista
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
@@ -165,11 +163,9 @@ class FrioPecasBot(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[class*='productImageTag--main'], img[class*='productImage']")
                     if el_img:
-                        filename = f"temp_img_friopecas_{int(time.time())}.png"
+                        filename = f"temp_img_friopecas_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1.5)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -198,4 +194,4 @@ class FrioPecasBot(BaseScraper):
             print(f"   ❌ [ERRO FRIOPECAS] {e}")
             return {'sucesso': False, 'erro': str(e)}
         finally:
-            if driver: driver.quit()
\ No newline at end of file
+            if driver: self.fechar_navegador(driver)
\ No newline at end of file
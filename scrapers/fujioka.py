@@ -29,7 +29,7 @@ class FujiokaScraper(BaseScraper):
             opts.add_argument("--disable-dev-shm-usage")
             opts.add_argument("--disable-gpu")
             
-            driver = uc.Chrome(options=opts, version_main=109)
+            driver = self.abrir_navegador(opts)
             driver.minimize_window()
 
             print(f"   [Fujioka] Acessando: {self.url}")
@@ -43,9 +43,7 @@ class FujiokaScraper(BaseScraper):
             
             # --- ROLAGEM PROGRESSIVA ---
             print("   [Fujioka] Vasculhando a página para acionar carregamentos...")
-            for i in range(4):
-                driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=2000)
                 
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(1)
@@ -139,11 +137,9 @@ class FujiokaScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, ".product-image img, #image-main")
                     if el_img:
-                        filename = f"temp_img_fujioka_{int(time.time())}.png"
+                        filename = f"temp_img_fujioka_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1.5)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -194,7 +190,7 @@ class FujiokaScraper(BaseScraper):
             print(f"   ❌ [ERRO FUJIOKA] {e}")
             return {'sucesso': False, 'erro': str(e)}
         finally:
-            if driver: driver.quit()
+            if driver: self.fechar_navegador(driver)
 
     def limpar_descricao_fujioka(self, texto_bruto):
         """Limpeza exclusiva e mais suave, para não apagar a descrição real da TV"""
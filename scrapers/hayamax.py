@@ -1,14 +1,9 @@
 # scrapers/hayamax.py
-import requests
-from bs4 import BeautifulSoup
 from .base import BaseScraper
-import urllib3
 
-# Desabilita avisos SSL
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 class HayamaxScraper(BaseScraper):
-    def executar(self):
+    async def executar_async(self):
         try:
             print(f"   [Hayamax] Iniciando Scraper (V2 - Filtro de Conteúdo)...")
             
@@ -18,12 +13,12 @@ class HayamaxScraper(BaseScraper):
             }
 
             # 1. Download da página
-            response = requests.get(self.url, headers=headers, timeout=20, verify=False)
+            response = await self.http_get_async(self.url, headers=headers, timeout=20)
             
             if response.status_code != 200:
                 raise Exception(f"Erro HTTP {response.status_code}")
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self.parsear_html_async(response.text)
 
             # --- TÍTULO ---
             titulo = "Produto Hayamax"
@@ -40,6 +35,9 @@ class HayamaxScraper(BaseScraper):
                 if not url_img:
                     url_img = img_tag.get("src")
 
+            # A imagem já começa a baixar enquanto o resto da página é lido
+            tarefa_imagem = self.iniciar_download_imagem(url_img)
+
             # --- DESCRIÇÃO E FICHA TÉCNICA ---
             descricao_linhas = []
             specs = {}
@@ -104,10 +102,10 @@ class HayamaxScraper(BaseScraper):
                 "titulo": titulo,
                 "descricao": descricao,
                 "caracteristicas": specs,
-                "caminho_imagem_temp": self.baixar_imagem_temp(url_img)
+                "caminho_imagem_temp": await tarefa_imagem
             }
 
-            arquivos = self.gerar_arquivos_finais(dados)
+            arquivos = await self.gerar_arquivos_finais_async(dados)
 
             return {
                 'sucesso': True,
@@ -7,7 +7,6 @@ from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
 import time
 import os
-import requests
 from .base import BaseScraper
 
 class IngramMicroScraper(BaseScraper):
@@ -29,7 +28,7 @@ class IngramMicroScraper(BaseScraper):
             options.add_argument("--disable-http2")
             options.add_argument("--window-size=1920,1080")
 
-            driver = uc.Chrome(options=options, version_main=144)
+            driver = self.abrir_navegador(options)
             
             # 1. ACESSO COM TIMEOUT CONTROLADO
             print(f"   [Ingram] Acessando: {self.url}")
@@ -171,28 +170,25 @@ class IngramMicroScraper(BaseScraper):
 
         except Exception as e:
             print(f"   ❌ [ERRO INGRAM] {e}")
-            if driver: driver.quit()
+            if driver: self.fechar_navegador(driver)
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     # Função auxiliar para baixar imagem usando a sessão do Selenium
     def baixar_imagem_com_cookies(self, driver, url):
         try:
-            # Pega cookies do navegador e passa para o Requests
-            s = requests.Session()
-            selenium_cookies = driver.get_cookies()
-            for cookie in selenium_cookies:
-                s.cookies.set(cookie['name'], cookie['value'])
+            # Pega cookies do navegador e passa para a sessão compartilhada do host
+            cookies = {c['name']: c['value'] for c in driver.get_cookies()}
             
             # Tenta simular um User-Agent real
-            s.headers.update({
+            headers = {
                 "User-Agent": driver.execute_script("return navigator.userAgent;")
-            })
+            }
             
-            resp = s.get(url, timeout=10)
+            resp = self.http_get(url, cookies=cookies, headers=headers, timeout=10)
             if resp.status_code == 200:
                 ext = "jpg" if ".jpg" in url else "png"
                 filename = f"temp_img_ingram.{ext}"
@@ -7,7 +7,6 @@ from bs4 import BeautifulSoup
 import time
 import os
 import re
-import requests
 from .base import BaseScraper
 
 try:
@@ -35,7 +34,7 @@ class IntelbrasScraper(BaseScraper):
             if not hasattr(self, 'pasta_saida'): self.pasta_saida = "output"
             if not os.path.exists(self.pasta_saida): os.makedirs(self.pasta_saida)
             
-            response = requests.get(self.url, timeout=30)
+            response = self.http_get(self.url, timeout=30)
             if response.status_code != 200:
                 raise Exception(f"Erro HTTP {response.status_code}")
             
@@ -161,7 +160,7 @@ class IntelbrasScraper(BaseScraper):
             options.add_argument("--disable-http2")
             options.add_argument("--window-size=1920,1080")
 
-            driver = uc.Chrome(options=options, version_main=144)
+            driver = self.abrir_navegador(options)
             
             print(f"   [Intelbras] Acessando: {self.url}")
             driver.set_page_load_timeout(30)
@@ -193,11 +192,9 @@ class IntelbrasScraper(BaseScraper):
                     el_img = imgs[0] if imgs else None
 
                 if el_img:
-                    filename = "temp_img_intelbras.png"
+                    filename = "temp_img_intelbras.jpg"
                     caminho_imagem = os.path.join(self.pasta_saida, filename)
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                    time.sleep(1)
-                    el_img.screenshot(caminho_imagem)
+                    self.salvar_captura(driver, el_img, caminho_imagem)
             except: pass
 
             descricao = "Descrição indisponível."
@@ -259,11 +256,11 @@ class IntelbrasScraper(BaseScraper):
 
         except Exception as e:
             print(f"   ❌ [ERRO INTELBRAS] {e}")
-            if driver: driver.quit()
+            if driver: self.fechar_navegador(driver)
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_promocional(self, texto):
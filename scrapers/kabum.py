@@ -19,47 +19,18 @@ class KabumScraper(BaseScraper):
             if not hasattr(self, 'pasta_saida'): self.pasta_saida = "output"
             if not os.path.exists(self.pasta_saida): os.makedirs(self.pasta_saida)
 
-            options = uc.ChromeOptions()
-            options.page_load_strategy = 'eager'
-            options.add_argument("--no-first-run")
-            options.add_argument("--password-store=basic")
-            options.add_argument("--disable-http2")
-            options.add_argument("--window-size=1920,1080")
-            
-            driver = uc.Chrome(options=options, version_main=109)
-            driver.set_window_size(1920, 1080)
-            
-            # 1. ACESSO
-            print(f"   [KaBuM!] Acessando: {self.url}")
-            driver.set_page_load_timeout(30)
-            driver.get(self.url)
-
-            try:
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "h1"))
-                )
-            except:
-                print("   ⚠️ Timeout título.")
-
-            # Scroll progressivo para forçar o Lazy Load
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(1)
-            
-            # Destruidor de Botões de "Ver Mais"
-            driver.execute_script("""
-                var botoes = document.querySelectorAll('button, a, span');
-                for (var i = 0; i < botoes.length; i++) {
-                    if(botoes[i].innerText && (botoes[i].innerText.toLowerCase().includes('mostrar descrição') || botoes[i].innerText.toLowerCase().includes('ver mais'))) {
-                        try { botoes[i].click(); } catch(e) {}
-                    }
-                }
-            """)
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, 400);")
+            # Snapshot do DOM renderizado (job repetido/reprocessado): pula o navegador
+            html = self.ler_snapshot()
+            if not html:
+                # O JSON de hidratação do HTML cru já traz o produto: um GET, sem navegador
+                estado = self.buscar_estado_hidratacao()
+                if estado:
+                    return self.finalizar_estruturados(estado)
+                driver = self.renderizar_kabum()
+                html = driver.page_source
 
             # 2. EXTRAÇÃO
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
 
             # --- TÍTULO ---
             titulo = "Produto KaBuM!"
@@ -158,7 +129,8 @@ class KabumScraper(BaseScraper):
                 except AttributeError:
                     pass
 
-            if not caminho_imagem or not os.path.exists(caminho_imagem):
+            imagem_por_url = bool(caminho_imagem)
+            if driver and (not caminho_imagem or not os.path.exists(caminho_imagem)):
                 print("   [KaBuM!] Recorrendo ao Screenshot...")
                 try:
                     driver.execute_script("window.scrollTo(0, 0);")
@@ -177,11 +149,9 @@ class KabumScraper(BaseScraper):
                         if el_img: break
                     
                     if el_img:
-                        filename = f"temp_img_kabum_{int(time.time())}.png"
+                        filename = f"temp_img_kabum_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.pasta_saida, filename)
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print(f"   ✅ Imagem salva: {filename}")
                 except:
                     pass
@@ -196,7 +166,11 @@ class KabumScraper(BaseScraper):
             
             print("   [KaBuM!] Gerando arquivos PDF/Word...")
             arquivos = self.gerar_arquivos_finais(dados)
-            
+
+            # Só guarda o snapshot se ele reproduz o job inteiro (a captura de tela precisa do navegador)
+            if driver and imagem_por_url:
+                self.guardar_snapshot(html)
+
             return {
                 'sucesso': True,
                 'titulo': titulo,
@@ -211,9 +185,50 @@ class KabumScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
+    def renderizar_kabum(self):
+        """Abre o Chrome, espera o produto e expande a descrição"""
+        options = uc.ChromeOptions()
+        options.page_load_strategy = 'eager'
+        options.add_argument("--no-first-run")
+        options.add_argument("--password-store=basic")
+        options.add_argument("--disable-http2")
+        options.add_argument("--window-size=1920,1080")
+
+        driver = self.abrir_navegador(options)
+        driver.set_window_size(1920, 1080)
+
+        # 1. ACESSO
+        print(f"   [KaBuM!] Acessando: {self.url}")
+        driver.set_page_load_timeout(30)
+        driver.get(self.url)
+
+        try:
+            WebDriverWait(driver, 20).until(
+                EC.presence_of_element_located((By.TAG_NAME, "h1"))
+            )
+        except:
+            print("   ⚠️ Timeout título.")
+
+        # Scroll progressivo para forçar o Lazy Load
+        self.aguardar_pagina(driver, profundidade=2500)
+
+        # Destruidor de Botões de "Ver Mais"
+        driver.execute_script("""
+            var botoes = document.querySelectorAll('button, a, span');
+            for (var i = 0; i < botoes.length; i++) {
+                if(botoes[i].innerText && (botoes[i].innerText.toLowerCase().includes('mostrar descrição') || botoes[i].innerText.toLowerCase().includes('ver mais'))) {
+                    try { botoes[i].click(); } catch(e) {}
+                }
+            }
+        """)
+        self.aguardar_pagina(driver, profundidade=0)
+        driver.execute_script("window.scrollTo(0, 400);")
+
+        return driver
+
     def limpar_descricao_kabum(self, div_desc):
         """Lê a estrutura HTML da KaBuM e formata o texto com regras visuais."""
         ctas_proibidos = [
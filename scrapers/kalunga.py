@@ -1,14 +1,9 @@
 # scrapers/kalunga.py
-import requests
 import re
-from bs4 import BeautifulSoup
 from .base import BaseScraper
-import urllib3
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 class KalungaScraper(BaseScraper):
-    def executar(self):
+    async def executar_async(self):
         try:
             print(f"   [Kalunga] Iniciando Scraper (V7 - Divisão por Texto)...")
             
@@ -17,13 +12,13 @@ class KalungaScraper(BaseScraper):
                 "Referer": "https://www.google.com/"
             }
 
-            response = requests.get(self.url, headers=headers, timeout=20, verify=False)
+            response = await self.http_get_async(self.url, headers=headers, timeout=20)
             response.encoding = response.apparent_encoding
             
             if response.status_code != 200:
                 raise Exception(f"Erro HTTP {response.status_code}")
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self.parsear_html_async(response.text)
 
             # --- TÍTULO ---
             titulo = "Produto Kalunga"
@@ -39,6 +34,9 @@ class KalungaScraper(BaseScraper):
             if url_img and not url_img.startswith("http"):
                  url_img = "https:" + url_img if url_img.startswith("//") else "https://www.kalunga.com.br" + url_img
 
+            # A imagem já começa a baixar enquanto o resto da página é lido
+            tarefa_imagem = self.iniciar_download_imagem(url_img)
+
             # --- DIVISÃO ROBUSTA (TEXT SPLIT) ---
             descricao = "Descrição indisponível."
             specs = {}
@@ -93,10 +91,10 @@ class KalungaScraper(BaseScraper):
                 "titulo": titulo,
                 "descricao": descricao,
                 "caracteristicas": specs,
-                "caminho_imagem_temp": self.baixar_imagem_temp(url_img)
+                "caminho_imagem_temp": await tarefa_imagem
             }
 
-            arquivos = self.gerar_arquivos_finais(dados)
+            arquivos = await self.gerar_arquivos_finais_async(dados)
 
             return {
                 'sucesso': True,
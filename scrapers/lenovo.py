@@ -32,7 +32,7 @@ class LenovoScraper(BaseScraper):
             # Força o navegador a ter um tamanho Full HD para que os screenshots saiam com alta qualidade
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             
             # Em vez de minimizar completamente (o que estraga os screenshots), definimos um tamanho fixo grande
             driver.set_window_size(1920, 1080)
@@ -51,9 +51,7 @@ class LenovoScraper(BaseScraper):
             
             # --- ROLAGEM PROGRESSIVA ---
             print("   [Lenovo] A executar rolagem para carregar descrições...")
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 800);")
-                time.sleep(1.5)
+            self.aguardar_pagina(driver, profundidade=4000)
             
             # --- AUTO-CLICKER PARA ESPECIFICAÇÕES ---
             print("   [Lenovo] A abrir separadores de especificações...")
@@ -72,7 +70,7 @@ class LenovoScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(2)
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
@@ -192,11 +190,9 @@ class LenovoScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img.gallery-image, li.canvas-item img")
                     if el_img:
-                        filename = f"temp_img_lenovo_{int(time.time())}.png"
+                        filename = f"temp_img_lenovo_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot em Full HD!")
                 except:
                     pass
@@ -226,7 +222,7 @@ class LenovoScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_lenovo(self, texto_bruto):
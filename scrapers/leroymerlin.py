@@ -33,7 +33,7 @@ class LeroyMerlinScraper(BaseScraper):
             options.add_argument("--disable-dev-shm-usage") 
             options.add_argument("--disable-gpu") 
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.minimize_window() # Minimiza para não atrapalhar no Servidor
             
             # 1. ACESSO
@@ -42,7 +42,7 @@ class LeroyMerlinScraper(BaseScraper):
             driver.get(self.url)
 
             print("   [Leroy Merlin] Aguardando carregamento da página...")
-            time.sleep(5) # Espera o desafio de segurança passar
+            self.aguardar_desafio(driver) # Só espera se o desafio de segurança aparecer
 
             driver.maximize_window() # Maximiza rapidamente para a foto
 
@@ -98,12 +98,9 @@ class LeroyMerlinScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "div[data-is-active='true'] img, img[fetchpriority='high']")
                     if el_img:
-                        filename = f"temp_img_leroy_{int(time.time())}.png"
+                        filename = f"temp_img_leroy_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1.5)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except Exception as e:
                     print(f"   ⚠️ Erro ao salvar imagem: {e}")
@@ -191,5 +188,5 @@ class LeroyMerlinScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
\ No newline at end of file
@@ -29,7 +29,7 @@ class LojaDoMecanicoScraper(BaseScraper):
             opts.add_argument("--disable-dev-shm-usage")
             opts.add_argument("--disable-gpu")
 
-            driver = uc.Chrome(options=opts, version_main=109)
+            driver = self.abrir_navegador(opts)
             driver.minimize_window()
 
             print(f"   [LojaDoMecanico] Acessando: {self.url}")
@@ -46,9 +46,7 @@ class LojaDoMecanicoScraper(BaseScraper):
 
             # --- 2. ROLAGEM E AUTO-CLICKER ---
             print("   [LojaDoMecanico] Forçando o carregamento da descrição (Toggle/Ler Mais)...")
-            for i in range(4):
-                driver.execute_script("window.scrollBy(0, 600);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=2400)
                 
             driver.execute_script("""
                 var botoes = document.querySelectorAll('a, button, span, div');
@@ -59,7 +57,7 @@ class LojaDoMecanicoScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(1.5) # Dá tempo para a caixa de texto expandir
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
@@ -125,11 +123,9 @@ class LojaDoMecanicoScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img.product-zoom")
                     if el_img:
-                        filename = f"temp_img_lojadomec_{int(time.time())}.png"
+                        filename = f"temp_img_lojadomec_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -179,7 +175,7 @@ class LojaDoMecanicoScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_loja(self, texto_bruto):
@@ -33,7 +33,7 @@ class MadeiraMadeiraScraper(BaseScraper):
             options.add_argument("--disable-dev-shm-usage") 
             options.add_argument("--disable-gpu") 
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.minimize_window()
             
             # 1. ACESSO
@@ -42,7 +42,7 @@ class MadeiraMadeiraScraper(BaseScraper):
             driver.get(self.url)
 
             print("   [MadeiraMadeira] Aguardando carregamento da página...")
-            time.sleep(5) # Espera o desafio de segurança passar
+            self.aguardar_desafio(driver) # Só espera se o desafio de segurança aparecer
 
             driver.maximize_window() # Maximiza rapidamente para renderizar tudo corretamente
 
@@ -65,7 +65,7 @@ class MadeiraMadeiraScraper(BaseScraper):
                     if(btn) btn.click();
                 } catch(e) {}
             """)
-            time.sleep(1.5)
+            self.aguardar_pagina(driver, profundidade=0)
 
             # 3. EXTRAÇÃO
             soup = BeautifulSoup(driver.page_source, 'html.parser')
@@ -99,12 +99,9 @@ class MadeiraMadeiraScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "li[data-index='0'] img, img[fetchpriority='high']")
                     if el_img:
-                        filename = f"temp_img_madeira_{int(time.time())}.png"
+                        filename = f"temp_img_madeira_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1.5)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except Exception as e:
                     print(f"   ⚠️ Erro ao salvar imagem: {e}")
@@ -189,5 +186,5 @@ class MadeiraMadeiraScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
\ No newline at end of file
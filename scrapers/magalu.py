@@ -5,7 +5,6 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup, Comment
 import time
-import json
 import re
 import os
 from .base import BaseScraper
@@ -27,74 +26,44 @@ class MagaluScraper(BaseScraper):
             options.add_argument("--disable-http2")
             options.page_load_strategy = 'eager'
 
-            # CRÍTICO: Versão 109 para rodar no Windows Server 2012 R2
-            driver = uc.Chrome(options=options, version_main=109)
-            
+            # GET simples primeiro: se o JSON-LD do produto vier completo, nem abre o Chrome
             print(f"   [Magalu] Acessando: {self.url}")
-            driver.set_page_load_timeout(30)
-            driver.get(self.url)
+            html, driver = self.obter_html(
+                renderizar=self.renderizar_magalu,
+                options=options,
+                aceitar_estruturados=True
+            )
+
+            soup = BeautifulSoup(html, 'html.parser')
+
+            # obter_html já leu os dados estruturados da página (GET ou navegador)
+            estruturados = self.estruturados or self.ler_dados_estruturados(soup)
+            if estruturados['completo']:
+                return self.finalizar_estruturados(
+                    estruturados, filtro_specs=self.filtrar_specs_magalu,
+                    descricao=self.limpar_descricao_sem_precos(estruturados['descricao'])
+                )
 
+            # --- TÍTULO (H1, JSON-LD ou Title da página) ---
             titulo = "Produto Magalu"
 
-            # 1. TENTA CAPTURAR O TÍTULO DIRETAMENTE COM SELENIUM/JS (Mais Forte)
-            try:
-                el_h1 = WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "h1[data-testid='heading']"))
-                )
-                # Puxa o texto via JavaScript para ignorar se o CSS estiver ocultando algo
-                texto_js = driver.execute_script("return arguments[0].innerText;", el_h1)
-                
-                if texto_js and len(texto_js) > 5:
-                    titulo = self.limpar_texto(texto_js)
-                else:
-                    titulo = self.limpar_texto(el_h1.text)
-            except:
-                print("   [Magalu] Aviso: h1 principal demorou a carregar.")
-
-            # Scroll para carregar resto da página
-            driver.execute_script("window.scrollTo(0, 800);")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, 1500);")
-            time.sleep(1)
-            
-            try:
-                btns = driver.find_elements(By.TAG_NAME, "button")
-                for btn in btns:
-                    if "ver mais" in btn.text.lower():
-                        driver.execute_script("arguments[0].click();", btn)
-                        break
-            except: pass
+            h1_bs = soup.find("h1", attrs={"data-testid": "heading"})
+            if not h1_bs: h1_bs = soup.find("h1")
+
+            if h1_bs and len(h1_bs.get_text()) > 5:
+                titulo = self.limpar_texto(h1_bs.get_text())
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            # Fallback JSON
+            if titulo == "Produto Magalu" or len(titulo) < 5 or "magazine luiza" in titulo.lower():
+                if estruturados['titulo']:
+                    titulo = self.limpar_texto(estruturados['titulo'])
 
-            # 2. PLANO B: BeautifulSoup (H1 genérico, JSON-LD ou Title da página)
+            # Fallback TAG <TITLE>
             if titulo == "Produto Magalu" or len(titulo) < 5 or "magazine luiza" in titulo.lower():
-                
-                # Fallback H1
-                h1_bs = soup.find("h1", attrs={"data-testid": "heading"})
-                if not h1_bs: h1_bs = soup.find("h1")
-                
-                if h1_bs and len(h1_bs.get_text()) > 5:
-                    titulo = self.limpar_texto(h1_bs.get_text())
-
-                # Fallback JSON
-                if titulo == "Produto Magalu" or len(titulo) < 5 or "magazine luiza" in titulo.lower():
-                    scripts = soup.find_all("script", type="application/ld+json")
-                    for script in scripts:
-                        try:
-                            data = json.loads(script.string)
-                            if isinstance(data, dict) and data.get("@type") == "Product":
-                                if data.get("name"):
-                                    titulo = self.limpar_texto(data.get("name"))
-                                    break
-                        except: pass
-
-                # Fallback TAG <TITLE>
-                if titulo == "Produto Magalu" or len(titulo) < 5 or "magazine luiza" in titulo.lower():
-                    if soup.title:
-                        t = soup.title.get_text()
-                        # Tira a parte "| Magazine Luiza" e pega só o nome do item
-                        titulo = self.limpar_texto(t.split('|')[0].replace("Magazine Luiza", "").strip())
+                if soup.title:
+                    t = soup.title.get_text()
+                    # Tira a parte "| Magazine Luiza" e pega só o nome do item
+                    titulo = self.limpar_texto(t.split('|')[0].replace("Magazine Luiza", "").strip())
 
             print(f"   [DEBUG] Título capturado: {titulo}")
 
@@ -104,16 +73,7 @@ class MagaluScraper(BaseScraper):
             if meta_img: url_img = meta_img["content"]
             
             if not url_img:
-                scripts = soup.find_all("script", type="application/ld+json")
-                for script in scripts:
-                    try:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict) and "image" in data:
-                            imgs = data["image"]
-                            if isinstance(imgs, list): url_img = imgs[0]
-                            else: url_img = imgs
-                            break
-                    except: pass
+                url_img = estruturados['imagem']
 
             # --- DESCRIÇÃO ---
             descricao_bruta = ""
@@ -138,13 +98,7 @@ class MagaluScraper(BaseScraper):
                 descricao_bruta = container_desc.get_text(separator="\n")
             
             if not descricao_bruta:
-                scripts = soup.find_all("script", type="application/ld+json")
-                for script in scripts:
-                    try:
-                        data = json.loads(script.string)
-                        if data.get("@type") == "Product":
-                            descricao_bruta = data.get("description", "")
-                    except: pass
+                descricao_bruta = estruturados['descricao']
 
             descricao = self.limpar_descricao_sem_precos(descricao_bruta)
 
@@ -177,12 +131,12 @@ class MagaluScraper(BaseScraper):
                         
                     specs[k] = v
 
+            # Marca/EAN/etc. do JSON-LD completam a ficha quando a página não tem
+            for k, v in estruturados['specs'].items():
+                specs.setdefault(k, v)
+
             # Filtros Finais
-            specs_limpas = {}
-            ignorar = ["garantia", "sac", "código", "vendido por", "entregue por", "ver mais", "parcelas", "juros", "meses"]
-            for k, v in specs.items():
-                if not any(x in k.lower() for x in ignorar):
-                    specs_limpas[k] = v
+            specs_limpas = self.filtrar_specs_magalu(specs)
 
             print(f"   ✅ Specs encontradas: {len(specs_limpas)} itens.")
 
@@ -206,13 +160,36 @@ class MagaluScraper(BaseScraper):
 
         except Exception as e:
             print(f"   ❌ [ERRO MAGALU] {e}")
-            if driver: driver.quit()
+            if driver: self.fechar_navegador(driver)
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
+    def renderizar_magalu(self, driver):
+        """Espera o título, rola a página e abre o "ver mais" da descrição"""
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "h1[data-testid='heading']"))
+            )
+        except:
+            print("   [Magalu] Aviso: h1 principal demorou a carregar.")
+
+        # Scroll para carregar resto da página
+        driver.execute_script("window.scrollTo(0, 800);")
+        time.sleep(1)
+        driver.execute_script("window.scrollTo(0, 1500);")
+        time.sleep(1)
+
+        try:
+            btns = driver.find_elements(By.TAG_NAME, "button")
+            for btn in btns:
+                if "ver mais" in btn.text.lower():
+                    driver.execute_script("arguments[0].click();", btn)
+                    break
+        except: pass
+
     def e_texto_financeiro(self, texto):
         if not texto: return False
         regex_lixo = re.compile(r'(R\$\s*\d)|(\d{1,2}x\s*de)|(sem\s*juros)|(com\s*juros)|(parcelas)|(à\s*vista)|(cartão)', re.IGNORECASE)
@@ -230,4 +207,12 @@ class MagaluScraper(BaseScraper):
             if self.e_texto_financeiro(linha_clean): continue
             linhas_limpas.append(linha_clean)
 
-        return "\n\n".join(linhas_limpas)
\ No newline at end of file
+        return "\n\n".join(linhas_limpas)
+
+    def filtrar_specs_magalu(self, specs):
+        specs_limpas = {}
+        ignorar = ["garantia", "sac", "código", "vendido por", "entregue por", "ver mais", "parcelas", "juros", "meses"]
+        for k, v in specs.items():
+            if not any(x in k.lower() for x in ignorar):
+                specs_limpas[k] = v
+        return specs_limpas
\ No newline at end of file
@@ -1,5 +1,4 @@
 # scrapers/magalu_empresas.py
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -24,7 +23,7 @@ class MagaluEmpresasScraper(BaseScraper):
             opts.add_argument('--ignore-certificate-errors')
             opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36")
 
-            driver = webdriver.Chrome(options=opts)
+            driver = self.abrir_navegador(opts, undetected=False)
             driver.get(self.url)
 
             # 1. Espera
@@ -49,7 +48,7 @@ class MagaluEmpresasScraper(BaseScraper):
                         }
                     });
                 """)
-                time.sleep(2)
+                self.aguardar_pagina(driver, profundidade=0)
             except: pass
             
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
@@ -213,7 +212,7 @@ class MagaluEmpresasScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                driver.quit()
+                self.fechar_navegador(driver)
 
     def _parse_size(self, val):
         """Converte '110px', '100%', 'auto' para int ou 0"""
@@ -7,10 +7,13 @@ from bs4 import BeautifulSoup
 import time
 import os
 import re
-from .base import BaseScraper
+from .plataformas.vtex import ScraperVTEX
 
-class MartinsFontesScraper(BaseScraper):
-    def executar(self):
+class MartinsFontesScraper(ScraperVTEX):
+    # Muitos não querem o peso e medidas de um livro na ficha final, mas se quiser, pode remover as últimas 4 palavras abaixo.
+    TERMOS_IGNORADOS_SPECS = ("garantia", "sac", "altura", "largura", "peso", "profundidade")
+
+    def executar_navegador(self):
         driver = None
         try:
             print(f"   [Martins Fontes] A iniciar Scraper (Motor VTEX Clássico para Livrarias)...")
@@ -30,7 +33,7 @@ class MartinsFontesScraper(BaseScraper):
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.set_window_size(1920, 1080)
             
             print(f"   [Martins Fontes] A aceder a: {self.url}")
@@ -48,9 +51,7 @@ class MartinsFontesScraper(BaseScraper):
             
             # --- ROLAGEM PROGRESSIVA ---
             print("   [Martins Fontes] A executar rolagem para garantir o carregamento do conteúdo...")
-            for i in range(4):
-                driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=2000)
             
             # --- AUTO-CLICKER ---
             print("   [Martins Fontes] A expandir sinopse e especificações...")
@@ -72,7 +73,7 @@ class MartinsFontesScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(1.5)
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
@@ -141,8 +142,7 @@ class MartinsFontesScraper(BaseScraper):
                         valor_limpo = self.limpar_texto(v)
                         
                         ignorar = False
-                        termos_proibidos = ["garantia", "sac", "altura", "largura", "peso", "profundidade"]
-                        # Muitos não querem o peso e medidas de um livro na ficha final, mas se quiser, pode remover as últimas 4 palavras acima.
+                        termos_proibidos = self.TERMOS_IGNORADOS_SPECS
                         if any(t in chave_limpa.lower() for t in termos_proibidos):
                             ignorar = True
                             
@@ -189,12 +189,9 @@ class MartinsFontesScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "#image-main, .sku-rich-image-main")
                     if el_img:
-                        filename = f"temp_img_martins_{int(time.time())}.png"
+                        filename = f"temp_img_martins_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -224,5 +221,9 @@ class MartinsFontesScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
-                except: pass
\ No newline at end of file
+                try: self.fechar_navegador(driver)
+                except: pass
+
+    def limpar_descricao_vtex(self, texto):
+        # Sinopse vai inteira, como no caminho do navegador
+        return texto.strip() if len(texto.strip()) > 10 else "Sinopse indisponível."
@@ -1,15 +1,10 @@
 # scrapers/mazer.py
-import requests
 import re
 import html as html_lib
-from bs4 import BeautifulSoup
 from .base import BaseScraper
-import urllib3
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 class MazerScraper(BaseScraper):
-    def executar(self):
+    async def executar_async(self):
         try:
             print(f"   [Mazer] Iniciando Scraper (V23 - Limpeza de Interface)...")
             
@@ -19,14 +14,14 @@ class MazerScraper(BaseScraper):
             }
 
             # 1. Download
-            response = requests.get(self.url, headers=headers, timeout=20, verify=False)
+            response = await self.http_get_async(self.url, headers=headers, timeout=20)
             response.encoding = response.apparent_encoding
             
             if response.status_code != 200:
                 raise Exception(f"Erro HTTP {response.status_code}")
 
             html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = await self.parsear_html_async(html_content)
 
             # --- TÍTULO ---
             titulo = "Produto Mazer"
@@ -62,6 +57,9 @@ class MazerScraper(BaseScraper):
                     if url_img.startswith("//"): url_img = "https:" + url_img
                     else: url_img = "https://www.mazer.com.br" + url_img
 
+            # A imagem já começa a baixar enquanto o resto da página é lido
+            tarefa_imagem = self.iniciar_download_imagem(url_img)
+
             # --- DESCRIÇÃO (FATIADOR V2) ---
             descricao_bruta = ""
             
@@ -128,10 +126,10 @@ class MazerScraper(BaseScraper):
                 "titulo": titulo,
                 "descricao": descricao,
                 "caracteristicas": specs,
-                "caminho_imagem_temp": self.baixar_imagem_temp(url_img)
+                "caminho_imagem_temp": await tarefa_imagem
             }
 
-            arquivos = self.gerar_arquivos_finais(dados)
+            arquivos = await self.gerar_arquivos_finais_async(dados)
 
             return {
                 'sucesso': True,
@@ -4,11 +4,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
-import time
 import os
 import re
 from .base import BaseScraper
 
+UA_GOOGLEBOT = "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)"
+
 class MercadoLivreScraper(BaseScraper):
     def executar(self):
         driver = None
@@ -20,39 +21,32 @@ class MercadoLivreScraper(BaseScraper):
             if not os.path.exists(self.output_folder): 
                 os.makedirs(self.output_folder)
 
-            # --- Configuração Selenium com Camuflagem de SEO (Googlebot) ---
+            # O SEGREDO: A assinatura exata do rastreador do Google! O ML é obrigado a deixar passar.
+            # Como o Googlebot recebe o HTML de SEO já renderizado no servidor, um GET simples
+            # costuma bastar; o navegador só é aberto se o título não vier no HTML.
+            headers_googlebot = dict(self.headers)
+            headers_googlebot['User-Agent'] = UA_GOOGLEBOT
+
+            # --- Configuração Selenium com Camuflagem de SEO (Googlebot), só se precisar ---
             options = uc.ChromeOptions()
             options.page_load_strategy = 'eager'
             options.add_argument("--no-first-run")
             options.add_argument("--password-store=basic")
-            
-            # O SEGREDO: A assinatura exata do rastreador do Google! O ML é obrigado a deixar passar.
-            options.add_argument("--user-agent=Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)")
-            
+            options.add_argument(f"--user-agent={UA_GOOGLEBOT}")
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
-            
-            driver = uc.Chrome(options=options, version_main=109)
-            driver.set_window_size(1920, 1080)
 
             print(f"   [Mercado Livre] Acessando URL como Googlebot: {self.url}")
-            driver.get(self.url)
-
-            # 1. Espera o título carregar
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "h1.ui-pdp-title"))
-                )
-            except:
-                print("   [Mercado Livre] Aviso: Timeout esperando título. A extrair o que foi carregado...")
-
-            # 2. Scroll leve para garantir carregamento
-            driver.execute_script("window.scrollTo(0, 800);")
-            time.sleep(2)
+            html, driver = self.obter_html(
+                obrigatorios=["h1.ui-pdp-title"],
+                headers=headers_googlebot,
+                renderizar=self.renderizar_pagina,
+                options=options
+            )
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
 
             # --- 1. TÍTULO ---
             titulo = "Produto Mercado Livre"
@@ -144,9 +138,20 @@ class MercadoLivreScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
+    def renderizar_pagina(self, driver):
+        """Camada navegador: espera o título e carrega a galeria"""
+        driver.set_window_size(1920, 1080)
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "h1.ui-pdp-title"))
+            )
+        except:
+            print("   [Mercado Livre] Aviso: Timeout esperando título. A extrair o que foi carregado...")
+        self.aguardar_pagina(driver, profundidade=800)
+
     def limpar_descricao_ml(self, texto_bruto):
         if not texto_bruto: return "Descrição indisponível."
         linhas = texto_bruto.splitlines()
@@ -30,7 +30,7 @@ class MideaScraper(BaseScraper):
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.set_window_size(1920, 1080)
             
             print(f"   [Midea] A aceder a: {self.url}")
@@ -47,9 +47,7 @@ class MideaScraper(BaseScraper):
             
             # --- ROLAGEM PROGRESSIVA ---
             print("   [Midea] A vasculhar a página para contornar o Lazy Load...")
-            for i in range(5):
-                driver.execute_script("window.scrollBy(0, 600);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=3000)
             
             # --- AUTO-CLICKER ---
             print("   [Midea] A expandir Descrição e Especificações Técnicas...")
@@ -73,7 +71,7 @@ class MideaScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(2) # Aguarda a animação de abertura
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 300);")
             time.sleep(0.5)
@@ -201,12 +199,9 @@ class MideaScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "div[class*='components_imageViewerWrapper'] img")
                     if el_img:
-                        filename = f"temp_img_midea_{int(time.time())}.png"
+                        filename = f"temp_img_midea_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -236,7 +231,7 @@ class MideaScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_midea(self, texto_bruto):
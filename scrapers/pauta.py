@@ -29,7 +29,7 @@ class PautaScraper(BaseScraper):
             opts.add_argument("--disable-dev-shm-usage")
             opts.add_argument("--disable-gpu")
 
-            driver = uc.Chrome(options=opts, version_main=109)
+            driver = self.abrir_navegador(opts)
             driver.minimize_window()
 
             print(f"   [Pauta] Acessando: {self.url}")
@@ -43,9 +43,7 @@ class PautaScraper(BaseScraper):
 
             # --- ROLAGEM PROGRESSIVA (Lazy Load) ---
             print("   [Pauta] Vasculhando a página...")
-            for i in range(4):
-                driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=2000)
                 
             driver.execute_script("window.scrollTo(0, 400);")
             time.sleep(0.5)
@@ -134,11 +132,9 @@ class PautaScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img#cloudZoomImage, img[class*='product-image']")
                     if el_img:
-                        filename = f"temp_img_pauta_{int(time.time())}.png"
+                        filename = f"temp_img_pauta_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -224,7 +220,7 @@ class PautaScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
     def limpar_descricao_cirurgica(self, texto_bruto):
@@ -20,60 +20,21 @@ class PichauScraper(BaseScraper):
             if not os.path.exists(self.output_folder): 
                 os.makedirs(self.output_folder)
 
-            options = uc.ChromeOptions()
-            options.page_load_strategy = 'eager'
-            options.add_argument("--no-first-run")
-            options.add_argument("--password-store=basic")
-            options.add_argument("--disable-http2")
-            options.add_argument(f'--user-agent={self.headers.get("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")}')
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920,1080")
-            
-            driver = uc.Chrome(options=options, version_main=109)
-            driver.set_window_size(1920, 1080)
-            
-            print(f"   [Pichau] A aceder a: {self.url}")
-            driver.set_page_load_timeout(30)
-            driver.get(self.url)
-            
-            print("   [Pichau] A aguardar renderização inicial...")
-            try:
-                # Aguarda o carregamento do título pelo data-cy ou classe da Pichau
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-cy='product-page-title'], h1"))
-                )
-            except:
-                print("   ⚠️ Aviso: Título não encontrado rapidamente. A forçar continuação.")
-            
-            # --- ROLAGEM PROGRESSIVA ---
-            print("   [Pichau] A executar rolagem profunda para carregar conteúdo Lazy Load...")
-            for i in range(7):
-                driver.execute_script("window.scrollBy(0, 700);")
-                time.sleep(1)
-            
-            driver.execute_script("window.scrollTo(0, 400);")
-            time.sleep(0.5)
-
-            # --- SISTEMA DE ESPERA INTELIGENTE (SMART WAIT) ---
-            print("   [Pichau] A verificar se os dados do produto já foram renderizados...")
-            for tentativa in range(3):
-                soup_temp = BeautifulSoup(driver.page_source, 'html.parser')
-                tem_descricao = soup_temp.find('div', class_=re.compile(r'description-rich-text'))
-                tem_tabela = soup_temp.find('table', class_=re.compile(r'table-specification|table'))
-                
-                # Se encontrou as informações cruciais, sai do loop de espera
-                if tem_descricao or tem_tabela:
-                    print("   ✅ Dados detetados no HTML! Avançando para extração.")
-                    break
-                else:
-                    print(f"   ⏳ Site lento. Conteúdo não detetado (Tentativa {tentativa + 1}/3). A aguardar mais 4 segundos...")
-                    time.sleep(4)
-                    driver.execute_script("window.scrollBy(0, 300);") # Um pequeno empurrão para forçar o React
+            # Snapshot do DOM renderizado (job repetido/reprocessado): pula o navegador
+            html = self.ler_snapshot()
+            if not html:
+                # O JSON de hidratação do HTML cru já traz o produto: um GET, sem navegador
+                estado = self.buscar_estado_hidratacao()
+                if estado:
+                    return self.finalizar_estruturados(
+                        estado, filtro_specs=self.filtrar_specs_pichau,
+                        descricao=self.limpar_descricao_pichau(estado['descricao'])
+                    )
+                driver = self.renderizar_pichau()
+                html = driver.page_source
             
             # Agora sim, carrega o HTML definitivo para fazer o que for possível
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
 
             # --- TÍTULO ---
             titulo = "Produto Pichau"
@@ -139,14 +100,7 @@ class PichauScraper(BaseScraper):
                                 specs[chave] = valor
 
                 # Limpeza rigorosa
-                specs_limpas = {}
-                termos_proibidos_specs = ["garantia", "ean", "sku"]
-                for k, v in specs.items():
-                    k_lower = k.lower()
-                    if not any(t in k_lower for t in termos_proibidos_specs):
-                        specs_limpas[k] = v
-                
-                specs = specs_limpas
+                specs = self.filtrar_specs_pichau(specs)
                 if hasattr(self, 'filtrar_specs'):
                     specs = self.filtrar_specs(specs)
                     
@@ -175,18 +129,16 @@ class PichauScraper(BaseScraper):
                 print(f"   [Pichau] URL da imagem encontrada: {url_img}")
                 caminho_imagem = self.baixar_imagem_temp(url_img)
 
-            if not caminho_imagem or not os.path.exists(caminho_imagem):
+            imagem_por_url = bool(caminho_imagem)
+            if driver and (not caminho_imagem or not os.path.exists(caminho_imagem)):
                 print("   [Pichau] A recorrer ao Screenshot da imagem principal...")
                 try:
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img[class*='slideImage'], img[data-cy='product-image']")
                     if el_img:
-                        filename = f"temp_img_pichau_{int(time.time())}.png"
+                        filename = f"temp_img_pichau_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -202,6 +154,10 @@ class PichauScraper(BaseScraper):
             print("   [Pichau] A gerar ficheiros PDF/Word...")
             arquivos = self.gerar_arquivos_finais(dados)
 
+            # Só guarda o snapshot se ele reproduz o job inteiro (a captura de tela precisa do navegador)
+            if driver and imagem_por_url:
+                self.guardar_snapshot(html)
+
             return {
                 'sucesso': True,
                 'titulo': titulo,
@@ -216,9 +172,63 @@ class PichauScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
 
+    def renderizar_pichau(self):
+        """Abre o Chrome, rola a página e espera o React montar descrição/ficha técnica"""
+        options = uc.ChromeOptions()
+        options.page_load_strategy = 'eager'
+        options.add_argument("--no-first-run")
+        options.add_argument("--password-store=basic")
+        options.add_argument("--disable-http2")
+        options.add_argument(f'--user-agent={self.headers.get("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")}')
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+
+        driver = self.abrir_navegador(options)
+        driver.set_window_size(1920, 1080)
+
+        print(f"   [Pichau] A aceder a: {self.url}")
+        driver.set_page_load_timeout(30)
+        driver.get(self.url)
+
+        print("   [Pichau] A aguardar renderização inicial...")
+        try:
+            # Aguarda o carregamento do título pelo data-cy ou classe da Pichau
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-cy='product-page-title'], h1"))
+            )
+        except:
+            print("   ⚠️ Aviso: Título não encontrado rapidamente. A forçar continuação.")
+
+        # --- ROLAGEM PROGRESSIVA ---
+        print("   [Pichau] A executar rolagem profunda para carregar conteúdo Lazy Load...")
+        self.aguardar_pagina(driver, profundidade=4900)
+
+        driver.execute_script("window.scrollTo(0, 400);")
+        time.sleep(0.5)
+
+        # --- SISTEMA DE ESPERA INTELIGENTE (SMART WAIT) ---
+        print("   [Pichau] A verificar se os dados do produto já foram renderizados...")
+        for tentativa in range(3):
+            soup_temp = BeautifulSoup(driver.page_source, 'html.parser')
+            tem_descricao = soup_temp.find('div', class_=re.compile(r'description-rich-text'))
+            tem_tabela = soup_temp.find('table', class_=re.compile(r'table-specification|table'))
+
+            # Se encontrou as informações cruciais, sai do loop de espera
+            if tem_descricao or tem_tabela:
+                print("   ✅ Dados detetados no HTML! Avançando para extração.")
+                break
+            else:
+                print(f"   ⏳ Site lento. Conteúdo não detetado (Tentativa {tentativa + 1}/3). A aguardar mais 4 segundos...")
+                time.sleep(4)
+                driver.execute_script("window.scrollBy(0, 300);") # Um pequeno empurrão para forçar o React
+
+        return driver
+
     def limpar_descricao_pichau(self, texto_bruto):
         if not texto_bruto: return "Descrição indisponível."
 
@@ -249,4 +259,12 @@ class PichauScraper(BaseScraper):
         resultado = "\n".join(linhas_limpas)
         resultado = re.sub(r'\n{3,}', '\n\n', resultado)
         
-        return resultado.strip()
\ No newline at end of file
+        return resultado.strip()
+
+    def filtrar_specs_pichau(self, specs):
+        specs_limpas = {}
+        ignorar = ["garantia", "ean", "sku"]
+        for k, v in specs.items():
+            if not any(x in k.lower() for x in ignorar):
+                specs_limpas[k] = v
+        return specs_limpas
\ No newline at end of file
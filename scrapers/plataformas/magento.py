@@ -0,0 +1,107 @@
+# scrapers/plataformas/magento.py
+"""
+Motor comum das lojas Magento 2. O servidor já manda no HTML todas as abas da página
+de produto (a de "Informações adicionais" só fica escondida por CSS) e a galeria
+inteira no JSON do <script type="text/x-magento-init"> que o fotorama lê depois.
+Um GET resolve título, descrição, atributos e imagem em tamanho original: nada de
+Chrome, rolagem ou clique em a.data.switch.
+
+Os scrapers Magento herdam de ScraperMagento e só sobrescrevem os ganchos
+extrair_descricao_magento / extrair_specs_magento / filtrar_specs_magento quando a
+loja foge do layout padrão.
+"""
+import json
+import asyncio
+from bs4 import BeautifulSoup
+from utils.perfis_navegador import parece_desafio
+from ..base import BaseScraper
+
+
+def _galeria(dado):
+    """Procura a chave 'mage/gallery/gallery' em qualquer nível do JSON do x-magento-init"""
+    if isinstance(dado, dict):
+        if 'mage/gallery/gallery' in dado:
+            return (dado['mage/gallery/gallery'] or {}).get('data') or []
+        for valor in dado.values():
+            imagens = _galeria(valor)
+            if imagens: return imagens
+    elif isinstance(dado, list):
+        for valor in dado:
+            imagens = _galeria(valor)
+            if imagens: return imagens
+    return []
+
+
+class ScraperMagento(BaseScraper):
+    async def executar_async(self):
+        try:
+            print(f"   [Magento] Acessando: {self.url}")
+            res = await self.http_get_async(self.url, headers=self.headers, timeout=20)
+            if res.status_code != 200:
+                raise Exception(f"Erro HTTP {res.status_code}")
+            if parece_desafio(res.text[:20000]):
+                raise Exception("Página de bloqueio em vez do produto")
+
+            # Parsing e mapeamento fora do loop (páginas Magento passam fácil de 500 KB)
+            dados = await asyncio.to_thread(lambda: self.mapear_pagina_magento(BeautifulSoup(res.content, 'html.parser')))
+            print(f"   ✅ Specs encontradas: {len(dados['caracteristicas'])} itens.")
+            return await self.finalizar_async(dados, dados.pop('url_imagem'))
+
+        except Exception as e:
+            print(f"   [ERRO MAGENTO] {e}")
+            return {'sucesso': False, 'erro': str(e)}
+
+    def mapear_pagina_magento(self, soup):
+        """HTML do produto -> dict `dados` (com 'url_imagem' no lugar do arquivo)"""
+        titulo = "Produto"
+        span_titulo = soup.find("span", attrs={"data-ui-id": "page-title-wrapper"})
+        h1 = span_titulo or soup.find(class_="page-title")
+        if h1: titulo = self.limpar_texto(h1.get_text())
+
+        return {
+            "titulo": titulo,
+            "descricao": self.extrair_descricao_magento(soup),
+            "caracteristicas": self.filtrar_specs_magento(self.extrair_specs_magento(soup)),
+            "url_imagem": self.imagem_magento(soup)
+        }
+
+    def imagem_magento(self, soup):
+        """Imagem principal da galeria (JSON do x-magento-init), senão og:image"""
+        for script in soup.find_all("script", type="text/x-magento-init"):
+            try:
+                imagens = _galeria(json.loads(script.string or script.get_text()))
+            except ValueError:
+                continue
+            if imagens:
+                principal = next((i for i in imagens if i.get('isMain')), imagens[0])
+                url = principal.get('full') or principal.get('img')
+                if url: return url.split('?')[0]
+
+        meta_img = soup.find("meta", property="og:image")
+        return meta_img.get("content") if meta_img else None
+
+    def extrair_descricao_magento(self, soup):
+        desc_div = soup.find("div", class_="product attribute description")
+        if not desc_div:
+            return "Descrição detalhada não disponível."
+        alvo = desc_div.find("div", class_="value") or desc_div
+        return self.limpar_lixo_comercial(alvo.get_text(separator="\n", strip=True))
+
+    def extrair_specs_magento(self, soup):
+        """Aba 'Informações adicionais': tabela padrão ou o layout em colunas (.col.data)"""
+        specs = {}
+        for linha in soup.select("#product-attribute-specs-table tr, table.additional-attributes tr"):
+            th, td = linha.find("th"), linha.find("td")
+            if th and td:
+                k, v = self.limpar_texto(th.get_text()).rstrip(':'), self.limpar_texto(td.get_text())
+                if k and v: specs[k] = v
+
+        for item in soup.select(".additional-attributes .col.data, #additional-new .col.data, .col.data.two"):
+            lbl, val = item.select_one(".label"), item.select_one(".data")
+            if lbl and val:
+                k, v = self.limpar_texto(lbl.get_text()).rstrip(':'), self.limpar_texto(val.get_text())
+                if k and v: specs.setdefault(k, v)
+        return specs
+
+    def filtrar_specs_magento(self, specs):
+        return self.filtrar_specs(specs)
@@ -0,0 +1,132 @@
+# scrapers/plataformas/vtex.py
+"""
+Motor comum das lojas VTEX. Toda loja VTEX publica o produto (nome, descrição HTML,
+grupos de especificação, imagens dos SKUs) na API pública de catálogo:
+
+    /api/catalog_system/pub/products/search/<slug>/p
+
+Um GET nessa API substitui o navegador, as esperas de renderização e os cliques nas
+abas. Os scrapers VTEX herdam de ScraperVTEX e deixam o caminho antigo (navegador ou
+HTML) em executar_navegador / executar_pagina_vtex, usado só quando a API falha.
+"""
+import re
+import asyncio
+from urllib.parse import urlsplit, parse_qs
+from bs4 import BeautifulSoup
+from ..base import BaseScraper
+from utils.motor_async import obter_motor
+
+# Grupos que a API devolve mas não são ficha técnica
+GRUPOS_IGNORADOS = ('allSpecifications', 'allSpecificationsGroups')
+
+
+class ScraperVTEX(BaseScraper):
+    # Termos que derrubam uma linha da ficha (chave ou valor), além do filtrar_specs
+    TERMOS_IGNORADOS_SPECS = ()
+
+    def url_catalogo(self):
+        """URL da API de catálogo para a página de produto (None se a URL não for de produto VTEX)"""
+        partes = urlsplit(self.url)
+        base = f"{partes.scheme or 'https'}://{partes.netloc}/api/catalog_system/pub/products/search"
+        sku = parse_qs(partes.query).get('skuId')
+        if sku:
+            return f"{base}?fq=skuId:{sku[0]}"
+        slug = re.search(r'/([^/]+)/p/?$', partes.path)
+        if slug:
+            return f"{base}/{slug.group(1)}/p"
+        return None
+
+    async def executar_async(self):
+        try:
+            url_api = self.url_catalogo()
+            if not url_api:
+                raise Exception("URL não segue o padrão de produto VTEX (/<slug>/p)")
+
+            headers = dict(self.headers, Accept='application/json')
+            res = await self.http_get_async(url_api, headers=headers, timeout=15)
+            if res.status_code not in (200, 206):
+                raise Exception(f"API de catálogo respondeu HTTP {res.status_code}")
+            produtos = res.json()
+            if not produtos:
+                raise Exception("API de catálogo não encontrou o produto")
+            produto = produtos[0]
+        except Exception as e:
+            print(f"   🪜 [VTEX] Catálogo indisponível ({e}). Usando a página do produto...")
+            return await self.executar_pagina_vtex()
+
+        print("   ⚡ [VTEX] Produto resolvido pela API de catálogo (sem navegador).")
+        dados = await asyncio.to_thread(self.mapear_produto_vtex, produto)
+        return await self.finalizar_async(dados, dados.pop('url_imagem'))
+
+    def mapear_produto_vtex(self, produto):
+        """Produto da API de catálogo -> dict `dados` (com 'url_imagem' no lugar do arquivo)"""
+        titulo = self.limpar_texto(produto.get('productName') or produto.get('productTitle'))
+        if not titulo:
+            raise Exception("Produto sem nome na API de catálogo")
+
+        html_descricao = produto.get('description') or produto.get('metaTagDescription') or ""
+        texto = BeautifulSoup(html_descricao, 'html.parser').get_text(separator="\n", strip=True)
+        descricao = self.limpar_descricao_vtex(texto)
+
+        specs = {}
+        for chave, valor in self._specs_vtex(produto):
+            chave_limpa, valor_limpo = self.limpar_texto(chave), self.limpar_texto(valor)
+            if not chave_limpa or not valor_limpo:
+                continue
+            if any(t in chave_limpa.lower() or t in valor_limpo.lower() for t in self.TERMOS_IGNORADOS_SPECS):
+                continue
+            specs.setdefault(chave_limpa, valor_limpo)
+        specs = self.filtrar_specs(specs)
+        print(f"   ✅ Specs encontradas: {len(specs)} itens.")
+
+        return {
+            "titulo": titulo,
+            "descricao": descricao,
+            "caracteristicas": specs,
+            "url_imagem": self._imagem_vtex(produto)
+        }
+
+    def limpar_descricao_vtex(self, texto):
+        """Limpeza da descrição vinda da API; os scrapers com limpeza própria sobrescrevem"""
+        return self.limpar_lixo_comercial(texto)
+
+    async def executar_pagina_vtex(self):
+        """
+        Caminho antigo, só quando a API falha. Padrão: o executar_navegador do scraper, na
+        pool de navegador do motor (a espera pelo governador não ocupa o executor padrão).
+        """
+        return await obter_motor().em_thread_navegador(self.executar_navegador)
+
+    def executar_navegador(self):
+        raise NotImplementedError
+
+    def _specs_vtex(self, produto):
+        grupos = [g for g in produto.get('specificationGroups') or [] if g.get('name') not in GRUPOS_IGNORADOS]
+        if grupos:
+            for grupo in grupos:
+                for spec in grupo.get('specifications') or []:
+                    yield spec.get('name'), self._valor_vtex(spec.get('values'))
+            return
+        # Lojas sem grupos: cada nome de allSpecifications é uma chave do próprio produto
+        for nome in produto.get('allSpecifications') or []:
+            yield nome, self._valor_vtex(produto.get(nome))
+
+    def _valor_vtex(self, valores):
+        if isinstance(valores, list):
+            valores = ", ".join(str(v) for v in valores if v)
+        valor = str(valores or "")
+        if '<' in valor and '>' in valor:
+            valor = BeautifulSoup(valor, 'html.parser').get_text(separator=" ", strip=True)
+        return valor
+
+    def _imagem_vtex(self, produto):
+        itens = produto.get('items') or []
+        sku = parse_qs(urlsplit(self.url).query).get('skuId')
+        if sku:
+            itens = [i for i in itens if str(i.get('itemId')) == sku[0]] or itens
+        for item in itens:
+            for imagem in item.get('images') or []:
+                if imagem.get('imageUrl'):
+                    # Sem os parâmetros de versão/redimensionamento: vem a imagem original
+                    return imagem['imageUrl'].split('?')[0]
+        return None
@@ -0,0 +1,102 @@
+# scrapers/plataformas/woocommerce.py
+"""
+Motor comum das lojas WordPress/WooCommerce. A Store API pública do WooCommerce
+devolve o produto pelo slug do permalink, já com nome, descrição HTML, atributos e
+as imagens em tamanho original:
+
+    /wp-json/wc/store/v1/products?slug=<slug>
+
+Com ela não há Chrome, lazy load (LiteSpeed, Avada...) nem captura de tela. Os
+scrapers WooCommerce herdam de ScraperWooCommerce e deixam o caminho antigo em
+executar_navegador / executar_pagina_woocommerce, usado só quando a API falha.
+"""
+import re
+import html
+import asyncio
+from urllib.parse import urlsplit
+from bs4 import BeautifulSoup
+from ..base import BaseScraper
+from utils.motor_async import obter_motor
+
+# Lojas com WooCommerce anterior ao 6.x só têm a rota sem versão
+ROTAS_STORE_API = ('/wp-json/wc/store/v1/products', '/wp-json/wc/store/products')
+
+
+class ScraperWooCommerce(BaseScraper):
+    def urls_store_api(self):
+        """URLs da Store API para o permalink do produto (último trecho do caminho é o slug)"""
+        partes = urlsplit(self.url)
+        trechos = [t for t in partes.path.split('/') if t]
+        if not trechos:
+            return []
+        origem = f"{partes.scheme or 'https'}://{partes.netloc}"
+        return [f"{origem}{rota}?slug={trechos[-1]}" for rota in ROTAS_STORE_API]
+
+    async def executar_async(self):
+        produto = None
+        headers = dict(self.headers, Accept='application/json')
+        for url_api in self.urls_store_api():
+            try:
+                res = await self.http_get_async(url_api, headers=headers, timeout=15)
+                if res.status_code == 200 and res.json():
+                    produto = res.json()[0]
+                    break
+            except Exception as e:
+                print(f"   ⚠️ [WooCommerce] {url_api}: {e}")
+
+        dados = await asyncio.to_thread(self.mapear_produto_woocommerce, produto) if produto else None
+        if not dados:
+            print("   🪜 [WooCommerce] Store API não trouxe o produto. Usando a página...")
+            return await self.executar_pagina_woocommerce()
+
+        print("   ⚡ [WooCommerce] Produto resolvido pela Store API (sem navegador).")
+        return await self.finalizar_async(dados, dados.pop('url_imagem'))
+
+    def mapear_produto_woocommerce(self, produto):
+        """Produto da Store API -> dict `dados` (None se faltar o essencial)"""
+        titulo = self.limpar_texto(html.unescape(produto.get('name') or ""))
+        html_descricao = produto.get('description') or produto.get('short_description') or ""
+        descricao, specs = self.separar_descricao_woocommerce(BeautifulSoup(html_descricao, 'html.parser'))
+
+        for atributo in produto.get('attributes') or []:
+            nome = self.limpar_texto(html.unescape(atributo.get('name') or ""))
+            valores = [html.unescape(t.get('name', "")) for t in atributo.get('terms') or []]
+            valor = self.limpar_texto(", ".join(v for v in valores if v))
+            if nome and valor:
+                specs.setdefault(nome, valor)
+        if produto.get('sku'):
+            specs.setdefault('SKU', produto['sku'])
+        specs = self.filtrar_specs(specs)
+
+        if not titulo or (not html_descricao and not specs):
+            return None
+        print(f"   ✅ Specs encontradas: {len(specs)} itens.")
+
+        imagens = produto.get('images') or []
+        return {
+            "titulo": titulo,
+            "descricao": descricao,
+            "caracteristicas": specs,
+            "url_imagem": imagens[0].get('src') if imagens else None
+        }
+
+    def separar_descricao_woocommerce(self, soup_descricao):
+        """
+        Descrição (HTML já em soup) -> (texto, specs). Padrão: texto limpo e nenhuma spec;
+        lojas que escrevem a ficha dentro da descrição sobrescrevem.
+        """
+        for br in soup_descricao.find_all("br"):
+            br.replace_with("\n")
+        texto = soup_descricao.get_text(separator="\n")
+        linhas = [re.sub(r'[ \t]+', ' ', l).strip() for l in texto.split('\n')]
+        return self.limpar_lixo_comercial("\n".join(l for l in linhas if l)), {}
+
+    async def executar_pagina_woocommerce(self):
+        """
+        Caminho antigo, só quando a API falha. Padrão: o executar_navegador do scraper, na
+        pool de navegador do motor (a espera pelo governador não ocupa o executor padrão).
+        """
+        return await obter_motor().em_thread_navegador(self.executar_navegador)
+
+    def executar_navegador(self):
+        raise NotImplementedError
@@ -25,7 +25,7 @@ class ProjetelasScraper(BaseScraper):
             options.add_argument("--password-store=basic")
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             
             print(f"   [Projetelas] A aceder a: {self.url}")
             driver.set_page_load_timeout(30)
@@ -103,5 +103,5 @@ class ProjetelasScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
\ No newline at end of file
@@ -1,14 +1,9 @@
 # scrapers/quasetudo.py
-import requests
-from bs4 import BeautifulSoup
-from .base import BaseScraper
-import urllib3
+from .plataformas.woocommerce import ScraperWooCommerce
 
-# Desabilita avisos de segurança SSL (comum em alguns sites menores)
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-class QuaseTudoScraper(BaseScraper):
-    def executar(self):
+class QuaseTudoScraper(ScraperWooCommerce):
+    async def executar_pagina_woocommerce(self):
         try:
             print(f"   [QuaseTudo] Iniciando Scraper...")
             
@@ -18,12 +13,12 @@ class QuaseTudoScraper(BaseScraper):
             }
 
             # 1. Requisição Simples (Jeito Antigo)
-            response = requests.get(self.url, headers=headers, timeout=20, verify=False)
+            response = await self.http_get_async(self.url, headers=headers, timeout=20)
             
             if response.status_code != 200:
                 raise Exception(f"Erro HTTP {response.status_code}")
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self.parsear_html_async(response.text)
 
             # --- TÍTULO ---
             # Baseado no arquivo: <h1 itemprop="name" class="product_title ...">
@@ -45,6 +40,9 @@ class QuaseTudoScraper(BaseScraper):
                 img_tag = soup.find("img", class_="wp-post-image")
                 if img_tag: url_img = img_tag.get("src")
 
+            # A imagem já começa a baixar enquanto o resto da página é lido
+            tarefa_imagem = self.iniciar_download_imagem(url_img)
+
             # --- DESCRIÇÃO E FICHA TÉCNICA ---
             # O site mistura tudo dentro de <div class="post-content">
             descricao = "Descrição indisponível."
@@ -55,40 +53,16 @@ class QuaseTudoScraper(BaseScraper):
             if div_content:
                 # Pega o texto preservando quebras de linha
                 texto_bruto = div_content.get_text(separator="\n", strip=True)
-                linhas = texto_bruto.splitlines()
-                
-                buffer_desc = []
-                
-                for linha in linhas:
-                    linha = linha.strip()
-                    if not linha: continue
-                    
-                    # Lógica de Separação baseada no padrão do site:
-                    # Ex: "– MARCA: SHINKA"
-                    # Verifica se começa com traço (– ou -) e tem dois pontos (:)
-                    if (linha.startswith("–") or linha.startswith("-")) and ":" in linha:
-                        # Remove o traço do início
-                        linha_limpa = linha.lstrip("–- ").strip()
-                        if ":" in linha_limpa:
-                            chave, valor = linha_limpa.split(":", 1)
-                            specs[chave.strip()] = valor.strip()
-                    else:
-                        # Se não for spec, é descrição
-                        # Removemos títulos óbvios como "CARACTERÍSTICAS" ou separadores "----"
-                        if "CARACTERÍSTICAS" in linha.upper() or "----" in linha:
-                            continue
-                        buffer_desc.append(linha)
-                
-                descricao = "\n".join(buffer_desc)
+                descricao, specs = self.separar_linhas_quasetudo(texto_bruto)
 
             dados = {
                 "titulo": titulo,
                 "descricao": descricao,
                 "caracteristicas": specs,
-                "caminho_imagem_temp": self.baixar_imagem_temp(url_img)
+                "caminho_imagem_temp": await tarefa_imagem
             }
 
-            arquivos = self.gerar_arquivos_finais(dados)
+            arquivos = await self.gerar_arquivos_finais_async(dados)
 
             return {
                 'sucesso': True,
@@ -101,4 +75,37 @@ class QuaseTudoScraper(BaseScraper):
 
         except Exception as e:
             print(f"   [ERRO QUASETUDO] {e}")
-            return {'sucesso': False, 'erro': str(e)}
\ No newline at end of file
+            return {'sucesso': False, 'erro': str(e)}
+
+    def separar_descricao_woocommerce(self, soup_descricao):
+        # Na Store API a descrição é o mesmo HTML do post-content
+        return self.separar_linhas_quasetudo(soup_descricao.get_text(separator="\n", strip=True))
+
+    def separar_linhas_quasetudo(self, texto_bruto):
+        """Linhas '– CHAVE: VALOR' viram specs; o resto é descrição"""
+        specs = {}
+        linhas = texto_bruto.splitlines()
+        
+        buffer_desc = []
+        
+        for linha in linhas:
+            linha = linha.strip()
+            if not linha: continue
+            
+            # Lógica de Separação baseada no padrão do site:
+            # Ex: "– MARCA: SHINKA"
+            # Verifica se começa com traço (– ou -) e tem dois pontos (:)
+            if (linha.startswith("–") or linha.startswith("-")) and ":" in linha:
+                # Remove o traço do início
+                linha_limpa = linha.lstrip("–- ").strip()
+                if ":" in linha_limpa:
+                    chave, valor = linha_limpa.split(":", 1)
+                    specs[chave.strip()] = valor.strip()
+            else:
+                # Se não for spec, é descrição
+                # Removemos títulos óbvios como "CARACTERÍSTICAS" ou separadores "----"
+                if "CARACTERÍSTICAS" in linha.upper() or "----" in linha:
+                    continue
+                buffer_desc.append(linha)
+        
+        return "\n".join(buffer_desc), specs
@@ -1,14 +1,10 @@
 # scrapers/router66.py
-import requests
 import re
 from bs4 import BeautifulSoup
 from .base import BaseScraper
-import urllib3
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 class Router66Scraper(BaseScraper):
-    def executar(self):
+    async def executar_async(self):
         try:
             print(f"   [Route66] Iniciando Scraper (V5 - Pontuação e Regex)...")
             
@@ -17,14 +13,14 @@ class Router66Scraper(BaseScraper):
                 "Referer": "https://www.google.com/"
             }
 
-            response = requests.get(self.url, headers=headers, timeout=20, verify=False)
+            response = await self.http_get_async(self.url, headers=headers, timeout=20)
             response.encoding = response.apparent_encoding
             
             if response.status_code != 200:
                 raise Exception(f"Erro HTTP {response.status_code}")
 
             html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = await self.parsear_html_async(html_content)
 
             # --- TÍTULO ---
             titulo = "Produto Route66"
@@ -41,6 +37,9 @@ class Router66Scraper(BaseScraper):
                 if url_img:
                     url_img = re.sub(r'/\d{3}/', '/1000/', url_img)
 
+            # A imagem já começa a baixar enquanto o resto da página é lido
+            tarefa_imagem = self.iniciar_download_imagem(url_img)
+
             # --- DESCRIÇÃO (ESTRATÉGIA DE PONTUAÇÃO) ---
             descricao_bruta = ""
             
@@ -115,10 +114,10 @@ class Router66Scraper(BaseScraper):
                 "titulo": titulo,
                 "descricao": descricao,
                 "caracteristicas": specs,
-                "caminho_imagem_temp": self.baixar_imagem_temp(url_img)
+                "caminho_imagem_temp": await tarefa_imagem
             }
 
-            arquivos = self.gerar_arquivos_finais(dados)
+            arquivos = await self.gerar_arquivos_finais_async(dados)
 
             return {
                 'sucesso': True,
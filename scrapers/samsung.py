@@ -6,7 +6,6 @@ from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 import time
 import os
-import json
 import re
 from .base import BaseScraper
 
@@ -29,40 +28,20 @@ class SamsungScraper(BaseScraper):
             options.add_argument("--disable-http2")
             options.page_load_strategy = 'eager'
 
-            # CRÍTICO: Versão 109 para rodar no Windows Server 2012 R2
-            driver = uc.Chrome(options=options, version_main=109)
-            
-            # 1. ACESSO
+            # 1. ACESSO (GET simples primeiro: JSON-LD completo dispensa o Chrome)
             print(f"   [Samsung] Acessando: {self.url}")
-            driver.set_page_load_timeout(30)
-            driver.get(self.url)
-
-            # Aguarda o elemento de Título específico
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "h1"))
-                )
-            except: pass
-
-            # 2. Scroll para carregar conteúdo e imagens (Lazy Load)
-            driver.execute_script("window.scrollTo(0, 800);")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, 2000);")
-            time.sleep(1.5)
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-            
-            # Tenta expandir botões de "Ver mais" ou "Especificações"
-            try:
-                btns = driver.find_elements(By.TAG_NAME, "button")
-                for btn in btns:
-                    txt = btn.text.lower()
-                    if "especifica" in txt or "ver mais" in txt or "mostrar mais" in txt or "expandir" in txt:
-                        driver.execute_script("arguments[0].click();", btn)
-                        time.sleep(0.5)
-            except: pass
-
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            html, driver = self.obter_html(
+                renderizar=self.renderizar_samsung,
+                options=options,
+                aceitar_estruturados=True
+            )
+
+            soup = BeautifulSoup(html, 'html.parser')
+
+            # obter_html já leu os dados estruturados da página (GET ou navegador)
+            estruturados = self.estruturados or self.ler_dados_estruturados(soup)
+            if estruturados['completo']:
+                return self.finalizar_estruturados(estruturados, filtro_specs=self.filtrar_specs_samsung)
 
             # --- TÍTULO ---
             titulo = "Produto Samsung"
@@ -74,16 +53,8 @@ class SamsungScraper(BaseScraper):
             if h1: 
                 titulo = self.limpar_texto(h1.get_text())
 
-            if titulo == "Produto Samsung" or len(titulo) < 5:
-                scripts = soup.find_all("script", type="application/ld+json")
-                for script in scripts:
-                    try:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict) and data.get("@type") == "Product":
-                            if data.get("name"):
-                                titulo = self.limpar_texto(data.get("name"))
-                                break
-                    except: pass
+            if (titulo == "Produto Samsung" or len(titulo) < 5) and estruturados['titulo']:
+                titulo = self.limpar_texto(estruturados['titulo'])
                     
             print(f"   [DEBUG] Título capturado: {titulo}")
 
@@ -119,17 +90,9 @@ class SamsungScraper(BaseScraper):
             
             # TENTATIVA 3: JSON-LD (Último recurso)
             if not url_img:
-                scripts = soup.find_all("script", type="application/ld+json")
-                for script in scripts:
-                    try:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict) and "image" in data:
-                            imgs = data["image"]
-                            candidato = imgs[0] if isinstance(imgs, list) else imgs
-                            if isinstance(candidato, str) and "logo" not in candidato.lower():
-                                url_img = candidato
-                                break
-                    except: pass
+                candidato = estruturados['imagem']
+                if candidato and "logo" not in candidato.lower():
+                    url_img = candidato
                     
             if url_img and url_img.startswith("//"): 
                 url_img = "https:" + url_img
@@ -157,16 +120,8 @@ class SamsungScraper(BaseScraper):
             if blocos_desc:
                 descricao_bruta = "\n\n".join(blocos_desc)
                 descricao = self.limpar_lixo_comercial(descricao_bruta)
-            else:
-                scripts = soup.find_all("script", type="application/ld+json")
-                for script in scripts:
-                    try:
-                        data = json.loads(script.string)
-                        if data.get("@type") == "Product":
-                            descricao_bruta = data.get("description", "")
-                            if descricao_bruta:
-                                descricao = self.limpar_lixo_comercial(descricao_bruta)
-                    except: pass
+            elif estruturados['descricao']:
+                descricao = self.limpar_lixo_comercial(estruturados['descricao'])
 
             # --- FICHA TÉCNICA ---
             specs = {}
@@ -194,12 +149,12 @@ class SamsungScraper(BaseScraper):
                             if k and v and len(k) < 60: 
                                 specs[k] = v
 
+            # Marca/EAN/etc. do JSON-LD completam a ficha quando a página não tem
+            for k, v in estruturados['specs'].items():
+                specs.setdefault(k, v)
+
             # Filtros Finais
-            specs_limpas = {}
-            ignorar = ["garantia", "suporte", "sac", "parcelas", "juros", "meses"]
-            for k, v in specs.items():
-                if not any(x in k.lower() for x in ignorar):
-                    specs_limpas[k] = v
+            specs_limpas = self.filtrar_specs_samsung(specs)
 
             print(f"   ✅ Specs encontradas: {len(specs_limpas)} itens.")
 
@@ -223,9 +178,44 @@ class SamsungScraper(BaseScraper):
 
         except Exception as e:
             print(f"   ❌ [ERRO SAMSUNG] {e}")
-            if driver: driver.quit()
+            if driver: self.fechar_navegador(driver)
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
-                except: pass
\ No newline at end of file
+                try: self.fechar_navegador(driver)
+                except: pass
+
+    def renderizar_samsung(self, driver):
+        """Espera o título, rola a página (lazy load) e expande as especificações"""
+        # Aguarda o elemento de Título específico
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.TAG_NAME, "h1"))
+            )
+        except: pass
+
+        # Scroll para carregar conteúdo e imagens (Lazy Load)
+        driver.execute_script("window.scrollTo(0, 800);")
+        time.sleep(1)
+        driver.execute_script("window.scrollTo(0, 2000);")
+        time.sleep(1.5)
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        time.sleep(1)
+
+        # Tenta expandir botões de "Ver mais" ou "Especificações"
+        try:
+            btns = driver.find_elements(By.TAG_NAME, "button")
+            for btn in btns:
+                txt = btn.text.lower()
+                if "especifica" in txt or "ver mais" in txt or "mostrar mais" in txt or "expandir" in txt:
+                    driver.execute_script("arguments[0].click();", btn)
+                    time.sleep(0.5)
+        except: pass
+
+    def filtrar_specs_samsung(self, specs):
+        specs_limpas = {}
+        ignorar = ["garantia", "suporte", "sac", "parcelas", "juros", "meses"]
+        for k, v in specs.items():
+            if not any(x in k.lower() for x in ignorar):
+                specs_limpas[k] = v
+        return specs_limpas
@@ -19,7 +19,7 @@ class TambasaScraper(BaseScraper):
             if not os.path.exists(self.output_folder): 
                 os.makedirs(self.output_folder)
 
-            # --- SETUP (Proteção Server 2012 R2 - V109) ---
+            # --- SETUP ---
             options = uc.ChromeOptions()
             options.add_argument("--headless=new") 
             options.page_load_strategy = 'eager'
@@ -31,7 +31,7 @@ class TambasaScraper(BaseScraper):
             options.add_argument("--disable-dev-shm-usage") 
             options.add_argument("--disable-gpu") 
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             
             # 1. ACESSO COM TRATAMENTO DE TIMEOUT
             print(f"   [Tambasa] Acessando: {self.url}")
@@ -85,11 +85,9 @@ class TambasaScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.CSS_SELECTOR, "img.product-detail__large-image")
                     if el_img:
-                        filename = f"temp_img_tambasa_{int(time.time())}.png"
+                        filename = f"temp_img_tambasa_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1.5)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except Exception as e:
                     print(f"   ⚠️ Erro ao salvar imagem: {e}")
@@ -190,5 +188,5 @@ class TambasaScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
\ No newline at end of file
@@ -30,7 +30,7 @@ class TravessaScraper(BaseScraper):
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.set_window_size(1920, 1080)
             
             print(f"   [Travessa] A aceder a: {self.url}")
@@ -47,9 +47,7 @@ class TravessaScraper(BaseScraper):
             
             # --- ROLAGEM PROGRESSIVA ---
             print("   [Travessa] A executar rolagem para acionar imagens preguiçosas (Lazy Load)...")
-            for i in range(4):
-                driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(1)
+            self.aguardar_pagina(driver, profundidade=2000)
             
             # --- AUTO-CLICKER ---
             print("   [Travessa] A expandir Sinopse completa...")
@@ -64,7 +62,7 @@ class TravessaScraper(BaseScraper):
                     }
                 }
             """)
-            time.sleep(1.5)
+            self.aguardar_pagina(driver, profundidade=0)
             
             driver.execute_script("window.scrollTo(0, 200);")
             time.sleep(0.5)
@@ -169,12 +167,9 @@ class TravessaScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, 0);")
                     el_img = driver.find_element(By.ID, "imgArtigo")
                     if el_img:
-                        filename = f"temp_img_travessa_{int(time.time())}.png"
+                        filename = f"temp_img_travessa_{int(time.time())}.jpg"
                         caminho_imagem = os.path.join(self.output_folder, filename)
-                        
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_img)
-                        time.sleep(1)
-                        el_img.screenshot(caminho_imagem)
+                        self.salvar_captura(driver, el_img, caminho_imagem)
                         print("   ✅ Imagem salva via screenshot!")
                 except:
                     pass
@@ -204,5 +199,5 @@ class TravessaScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                try: driver.quit()
+                try: self.fechar_navegador(driver)
                 except: pass
\ No newline at end of file
@@ -1,5 +1,4 @@
 # scrapers/vonder.py
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -7,31 +6,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 import time
 import re
-import requests
 import os
 import uuid
-import ssl
 import subprocess
-from requests.adapters import HTTPAdapter
-from urllib3.poolmanager import PoolManager
 from .base import BaseScraper
-
-# --- ADAPTADOR SSL (SECLEVEL=0) ---
-class UnsafeSSLAdapter(HTTPAdapter):
-    def init_poolmanager(self, connections, maxsize, block=False):
-        ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        try:
-            ctx.set_ciphers('ALL:@SECLEVEL=0') 
-        except:
-            ctx.set_ciphers('DEFAULT')
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-        self.poolmanager = PoolManager(
-            num_pools=connections,
-            maxsize=maxsize,
-            block=block,
-            ssl_context=ctx
-        )
+from utils.sessoes_http import http_get
 
 class VonderScraper(BaseScraper):
     def executar(self):
@@ -47,7 +26,7 @@ class VonderScraper(BaseScraper):
             opts.add_argument('--ignore-certificate-errors')
             opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36")
 
-            driver = webdriver.Chrome(options=opts)
+            driver = self.abrir_navegador(opts, undetected=False)
             driver.get(self.url)
 
             # 1. Espera Título
@@ -152,7 +131,7 @@ class VonderScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                driver.quit()
+                self.fechar_navegador(driver)
 
     def baixar_imagem_validada(self, url):
         """Baixa e verifica se o arquivo é realmente uma imagem"""
@@ -206,11 +185,8 @@ class VonderScraper(BaseScraper):
             "Referer": "https://www.vonder.com.br/"
         }
         try:
-            session = requests.Session()
-            session.mount('https://', UnsafeSSLAdapter())
-            import urllib3
-            urllib3.disable_warnings()
-            response = session.get(url, headers=headers, timeout=15, verify=False)
+            # Sessão compartilhada com o adaptador SSL legado (SECLEVEL=0, sem verificação)
+            response = http_get(url, tls='legado', headers=headers, timeout=15)
             if response.status_code == 200:
                 with open(filepath, 'wb') as f:
                     f.write(response.content)
@@ -1,5 +1,4 @@
 # scrapers/weg.py
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -23,7 +22,7 @@ class WegScraper(BaseScraper):
             opts.add_argument("--window-size=1920,1080")
             opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36")
 
-            driver = webdriver.Chrome(options=opts)
+            driver = self.abrir_navegador(opts, undetected=False)
             
             print(f"   [WEG] Acessando: {self.url}")
             driver.get(self.url)
@@ -137,15 +136,16 @@ class WegScraper(BaseScraper):
             return {'sucesso': False, 'erro': str(e)}
         finally:
             if driver:
-                driver.quit()
+                self.fechar_navegador(driver)
 
     def baixar_imagem_navegando(self, driver, url):
         """Abre nova aba, vai até a imagem e tira screenshot (Anti-403)"""
         if not url: return None
+        # Guarda a aba do job: no modo abas o navegador tem abas de outros jobs também
+        aba_original = driver.current_window_handle
         try:
             print(f"   [DOWNLOAD] Navegando até a imagem: {url}")
-            driver.execute_script("window.open('');")
-            driver.switch_to.window(driver.window_handles[-1])
+            driver.switch_to.new_window('tab')
             driver.get(url)
             
             try:
@@ -153,26 +153,24 @@ class WegScraper(BaseScraper):
                     EC.presence_of_element_located((By.TAG_NAME, "img"))
                 )
                 
-                ext = "jpg"
-                if "png" in url.lower(): ext = "png"
-                if "webp" in url.lower(): ext = "webp"
-                filename = f"temp_img_weg.{ext}"
+                # A captura sai sempre em JPEG, qualquer que seja o formato original
+                filename = "temp_img_weg.jpg"
                 caminho = os.path.join(self.pasta_saida if hasattr(self, 'pasta_saida') else "output", filename)
                 
-                img_element.screenshot(caminho)
+                self.salvar_captura(driver, img_element, caminho)
                 
                 driver.close()
-                driver.switch_to.window(driver.window_handles[0])
+                driver.switch_to.window(aba_original)
                 return caminho
                 
             except Exception as e:
                 print(f"   ⚠️ Erro render imagem: {e}")
                 driver.close()
-                driver.switch_to.window(driver.window_handles[0])
+                driver.switch_to.window(aba_original)
                 return None
 
         except Exception as e:
             print(f"   ⚠️ Erro navegação img: {e}")
-            try: driver.switch_to.window(driver.window_handles[0])
+            try: driver.switch_to.window(aba_original)
             except: pass
             return None
\ No newline at end of file
@@ -26,7 +26,7 @@ class XbzScraper(BaseScraper):
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
             
-            driver = uc.Chrome(options=options, version_main=109)
+            driver = self.abrir_navegador(options)
             driver.minimize_window() 
             
             print(f"   [XBZ] Acedendo: {self.url}")
@@ -102,4 +102,4 @@ class XbzScraper(BaseScraper):
             print(f"   ❌ [ERRO XBZ] {e}")
             return {'sucesso': False, 'erro': str(e)}
         finally:
-            if driver: driver.quit()
\ No newline at end of file
+            if driver: self.fechar_navegador(driver)
\ No newline at end of file
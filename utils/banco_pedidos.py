@@ -0,0 +1,228 @@
+# utils/banco_pedidos.py
+"""
+Estado dos pedidos da API em SQLite (pedidos/pedidos.db, modo WAL), no lugar do
+dict em memória que crescia para sempre e se perdia a cada reinício.
+
+- /api/status/<id> vira uma busca pela chave primária e funciona depois de reiniciar;
+- pedidos que estavam na fila ou em processamento quando o serviço caiu são
+  devolvidos por pendentes() para a API reenfileirar;
+- pedidos terminados saem depois do TTL (limpeza periódica pelo índice de criado_em);
+- /health lê contadores por status mantidos em memória, sem varrer a tabela;
+- a tabela 'resultados' guarda, por URL canônica, o último resultado com sucesso
+  (nomes do Word/PDF em OUTPUT_DIR): um link repetido dentro do 'resultado_ttl' do
+  site é respondido sem raspar de novo.
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from utils.url_canonica import canonicalizar_url
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_PEDIDOS = os.path.join(BASE_DIR, 'pedidos')
+
+STATUS_ABERTOS = ('na_fila', 'processando')
+COLUNAS = ('id', 'url', 'status', 'origem', 'custom_id', 'codigo_tarefa', 'webhook', 'criado_em', 'atualizado_em', 'resultado')
+
+
+class BancoPedidos:
+    def __init__(self, pasta=PASTA_PEDIDOS, ttl=7 * 24 * 3600, resultado_ttl_padrao=24 * 3600, limpar_a_cada=500):
+        self.pasta = pasta
+        self.ttl = ttl
+        self.resultado_ttl_padrao = resultado_ttl_padrao
+        self.limpar_a_cada = limpar_a_cada
+        self._lock = threading.Lock()
+        self._conexao = None
+        self._contadores = {}     # status -> quantidade
+        self._registros = 0
+
+    def configurar(self, **opcoes):
+        for chave, valor in opcoes.items():
+            if not hasattr(self, chave) or chave.startswith('_'):
+                raise ValueError(f"Opção do banco de pedidos desconhecida: {chave}")
+            setattr(self, chave, valor)
+
+    # ------------------------------------------------------------------
+    # CONEXÃO
+    # ------------------------------------------------------------------
+    def _banco(self):
+        # Chamado sempre com o lock
+        if self._conexao is None:
+            os.makedirs(self.pasta, exist_ok=True)
+            conexao = sqlite3.connect(os.path.join(self.pasta, 'pedidos.db'), check_same_thread=False)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            conexao.execute("""
+                CREATE TABLE IF NOT EXISTS pedidos (
+                    id TEXT PRIMARY KEY,
+                    url TEXT,
+                    status TEXT,
+                    origem TEXT,
+                    custom_id TEXT,
+                    codigo_tarefa TEXT,
+                    webhook TEXT,
+                    criado_em REAL,
+                    atualizado_em REAL,
+                    resultado TEXT
+                )
+            """)
+            conexao.execute("CREATE INDEX IF NOT EXISTS idx_status ON pedidos (status)")
+            conexao.execute("CREATE INDEX IF NOT EXISTS idx_criado ON pedidos (criado_em)")
+            conexao.execute("""
+                CREATE TABLE IF NOT EXISTS resultados (
+                    url TEXT PRIMARY KEY,
+                    resultado TEXT,
+                    gerado_em REAL
+                )
+            """)
+            conexao.commit()
+            self._contadores = dict(conexao.execute("SELECT status, COUNT(*) FROM pedidos GROUP BY status").fetchall())
+            self._conexao = conexao
+        return self._conexao
+
+    def _somar(self, status, quantidade):
+        # Chamado com o lock
+        self._contadores[status] = self._contadores.get(status, 0) + quantidade
+        if self._contadores[status] <= 0:
+            del self._contadores[status]
+
+    # ------------------------------------------------------------------
+    # ESCRITA
+    # ------------------------------------------------------------------
+    def registrar_lote(self, pedidos):
+        """pedidos: dicts com id, url, origem, custom_id, codigo_tarefa, webhook. Entram 'na_fila'."""
+        agora = time.time()
+        linhas = [(p['id'], p['url'], 'na_fila', p.get('origem'), p.get('custom_id'), p.get('codigo_tarefa'),
+                   p.get('webhook'), agora, agora, None) for p in pedidos]
+        with self._lock:
+            banco = self._banco()
+            banco.executemany(f"INSERT INTO pedidos VALUES ({', '.join('?' * len(COLUNAS))})", linhas)
+            banco.commit()
+            self._somar('na_fila', len(linhas))
+            self._registros += len(linhas)
+            limpar = self._registros >= self.limpar_a_cada
+            if limpar:
+                self._registros = 0
+        if limpar:
+            self.limpar_expirados()
+
+    def remover(self, ids):
+        with self._lock:
+            banco = self._banco()
+            for id_pedido in ids:
+                linha = banco.execute("SELECT status FROM pedidos WHERE id = ?", (id_pedido,)).fetchone()
+                if linha:
+                    banco.execute("DELETE FROM pedidos WHERE id = ?", (id_pedido,))
+                    self._somar(linha[0], -1)
+            banco.commit()
+
+    def atualizar_status(self, id_pedido, status, resultado=None):
+        """Troca o status (e grava o payload final, se houver)"""
+        with self._lock:
+            banco = self._banco()
+            linha = banco.execute("SELECT status FROM pedidos WHERE id = ?", (id_pedido,)).fetchone()
+            if not linha:
+                return
+            banco.execute(
+                "UPDATE pedidos SET status = ?, resultado = COALESCE(?, resultado), atualizado_em = ? WHERE id = ?",
+                (status, json.dumps(resultado) if resultado is not None else None, time.time(), id_pedido)
+            )
+            banco.commit()
+            self._somar(linha[0], -1)
+            self._somar(status, 1)
+
+    def limpar_expirados(self):
+        """Apaga pedidos terminados (e resultados guardados) mais velhos que o TTL; os abertos nunca saem"""
+        if not self.ttl:
+            return
+        limite = time.time() - self.ttl
+        filtro = f"criado_em < ? AND status NOT IN ({', '.join('?' * len(STATUS_ABERTOS))})"
+        with self._lock:
+            banco = self._banco()
+            # Nenhum 'resultado_ttl' passa do TTL dos pedidos: o cache de resultados sai junto
+            banco.execute("DELETE FROM resultados WHERE gerado_em < ?", (limite,))
+            banco.commit()
+            removidos = banco.execute(f"SELECT status, COUNT(*) FROM pedidos WHERE {filtro} GROUP BY status",
+                                      (limite, *STATUS_ABERTOS)).fetchall()
+            if not removidos:
+                return
+            banco.execute(f"DELETE FROM pedidos WHERE {filtro}", (limite, *STATUS_ABERTOS))
+            banco.commit()
+            for status, quantidade in removidos:
+                self._somar(status, -quantidade)
+        print(f"   🧹 [PEDIDOS] {sum(q for _, q in removidos)} pedido(s) expirado(s) removido(s).")
+
+    def guardar_resultado(self, url, resultado):
+        """Resultado com sucesso do scraper (com 'arquivos') vira o cache da URL canônica"""
+        with self._lock:
+            banco = self._banco()
+            banco.execute(
+                "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?)",
+                (canonicalizar_url(url), json.dumps(resultado, default=str), time.time())
+            )
+            banco.commit()
+
+    def descartar_resultado(self, url):
+        with self._lock:
+            banco = self._banco()
+            banco.execute("DELETE FROM resultados WHERE url = ?", (canonicalizar_url(url),))
+            banco.commit()
+
+    # ------------------------------------------------------------------
+    # LEITURA
+    # ------------------------------------------------------------------
+    def _dict(self, linha):
+        pedido = dict(zip(COLUNAS, linha))
+        pedido['resultado'] = json.loads(pedido['resultado']) if pedido['resultado'] else None
+        pedido['criado_em'] = datetime.fromtimestamp(pedido['criado_em']).isoformat()
+        pedido['atualizado_em'] = datetime.fromtimestamp(pedido['atualizado_em']).isoformat()
+        return pedido
+
+    def obter(self, id_pedido):
+        with self._lock:
+            linha = self._banco().execute(
+                f"SELECT {', '.join(COLUNAS)} FROM pedidos WHERE id = ?", (id_pedido,)
+            ).fetchone()
+        return self._dict(linha) if linha else None
+
+    def resultado_recente(self, url, ttl=None):
+        """Resultado guardado da URL se tiver menos de `ttl` segundos (None = resultado_ttl_padrao; 0 = nunca)"""
+        ttl = self.resultado_ttl_padrao if ttl is None else ttl
+        if not ttl:
+            return None
+        with self._lock:
+            linha = self._banco().execute(
+                "SELECT resultado, gerado_em FROM resultados WHERE url = ?", (canonicalizar_url(url),)
+            ).fetchone()
+        if not linha or time.time() - linha[1] > ttl:
+            return None
+        return json.loads(linha[0])
+
+    def pendentes(self):
+        """Pedidos que ficaram na fila/em processamento quando o serviço parou (mais antigos primeiro)"""
+        with self._lock:
+            linhas = self._banco().execute(
+                f"SELECT {', '.join(COLUNAS)} FROM pedidos "
+                f"WHERE status IN ({', '.join('?' * len(STATUS_ABERTOS))}) ORDER BY criado_em",
+                STATUS_ABERTOS
+            ).fetchall()
+        return [self._dict(linha) for linha in linhas]
+
+    def contar(self, status):
+        with self._lock:
+            self._banco()
+            return self._contadores.get(status, 0)
+
+    def estatisticas(self):
+        with self._lock:
+            self._banco()
+            return dict(self._contadores, total=sum(self._contadores.values()))
+
+
+_banco_pedidos = BancoPedidos()
+
+
+def obter_banco_pedidos():
+    return _banco_pedidos
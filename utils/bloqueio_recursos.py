@@ -0,0 +1,65 @@
+# utils/bloqueio_recursos.py
+"""
+Bloqueio de recursos via Chrome DevTools Protocol (Network.setBlockedURLs).
+O HTML e os scripts da loja continuam carregando normalmente; só deixamos de baixar
+o que não é usado na extração (fontes, vídeos, rastreadores e, se o site permitir, imagens).
+"""
+
+CATEGORIAS_BLOQUEIO = {
+    'fontes': [
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+        "*fonts.googleapis.com*", "*fonts.gstatic.com*", "*use.typekit.net*"
+    ],
+    'midia': [
+        "*.mp4", "*.webm", "*.m3u8", "*.mov", "*.mp3",
+        "*youtube.com/embed*", "*player.vimeo.com*"
+    ],
+    'rastreadores': [
+        "*google-analytics.com*", "*googletagmanager.com*", "*googleadservices.com*",
+        "*doubleclick.net*", "*googlesyndication.com*", "*connect.facebook.net*",
+        "*facebook.com/tr*", "*hotjar.com*", "*clarity.ms*", "*criteo.com*", "*criteo.net*",
+        "*analytics.tiktok.com*", "*bat.bing.com*", "*taboola.com*", "*outbrain.com*",
+        "*newrelic.com*", "*nr-data.net*", "*rdstation.com.br*", "*zendesk.com*",
+        "*smartlook.com*", "*onesignal.com*", "*scorecardresearch.com*"
+    ],
+    'imagens': [
+        "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+        "*.jpg?*", "*.jpeg?*", "*.png?*", "*.webp?*", "*.avif?*"
+    ],
+}
+
+# Usado quando o site não define 'bloquear_recursos' no config.
+# Imagens ficam liberadas por padrão porque vários scrapers recorrem ao screenshot.
+BLOQUEIO_PADRAO = ['fontes', 'midia', 'rastreadores']
+
+
+def montar_padroes(categorias):
+    padroes = []
+    for categoria in categorias or []:
+        padroes.extend(CATEGORIAS_BLOQUEIO.get(categoria, []))
+    return padroes
+
+
+def aplicar_bloqueio(driver, categorias=None):
+    """Ativa o bloqueio na aba atual do driver. Retorna a lista de padrões aplicada."""
+    if categorias is None:
+        categorias = BLOQUEIO_PADRAO
+    padroes = montar_padroes(categorias)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": padroes})
+        driver.categorias_bloqueadas = list(categorias)
+    except Exception as e:
+        print(f"   ⚠️ [BLOQUEIO] Não foi possível aplicar o bloqueio de recursos: {e}")
+        return []
+    return padroes
+
+
+def remover_bloqueio(driver, categorias=None):
+    """Remove as categorias informadas (ou todas) do bloqueio ativo"""
+    ativas = getattr(driver, 'categorias_bloqueadas', [])
+    restantes = [c for c in ativas if categorias is not None and c not in categorias]
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": montar_padroes(restantes)})
+        driver.categorias_bloqueadas = restantes
+    except: pass
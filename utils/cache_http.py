@@ -0,0 +1,267 @@
+# utils/cache_http.py
+"""
+Cache HTTP em disco, por baixo das sessões compartilhadas (utils/sessoes_http.py e
+utils/motor_async.py). O bot pede o datasheet do mesmo produto em dias diferentes:
+com o cache, a página e a imagem guardadas são revalidadas com If-None-Match /
+If-Modified-Since e, se o servidor responder 304, nada é baixado de novo.
+
+Índice em SQLite (cache_http/indice.db) + um arquivo por corpo de resposta. O tamanho
+total é limitado; quando passa do teto, saem as entradas acessadas há mais tempo (LRU).
+Só entram respostas 200 com validador (ETag/Last-Modified) ou de sites com 'cache_ttl'
+no SITES_CONFIG: dentro do TTL a resposta sai do disco sem tocar a rede.
+
+A chave é a URL mais os cabeçalhos da requisição que mudam a resposta (User-Agent do
+Googlebot, Accept: application/json das APIs VTEX/WooCommerce...). Cabeçalhos listados
+no Vary da resposta também são guardados e conferidos antes de reaproveitar a entrada.
+"""
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_CACHE = os.path.join(BASE_DIR, 'cache_http')
+
+# O corpo é guardado já descomprimido: esses cabeçalhos não valem mais para ele
+CABECALHOS_DESCARTADOS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie')
+
+# Cabeçalhos da requisição que entram na chave (mesma URL, respostas diferentes)
+CABECALHOS_DA_CHAVE = ('user-agent', 'accept', 'accept-language')
+
+
+def _minusculos(headers):
+    return {str(k).lower(): str(v) for k, v in (headers or {}).items()}
+
+
+class CacheHTTP:
+    def __init__(self, pasta=PASTA_CACHE, tamanho_maximo_mb=500, ttl_padrao=0, ativo=True):
+        self.pasta = pasta
+        self.tamanho_maximo_mb = tamanho_maximo_mb
+        self.ttl_padrao = ttl_padrao
+        self.ativo = ativo
+        self._lock = threading.Lock()
+        self._conexao = None
+        self._tamanho_total = 0
+        self._contadores = {'hits': 0, 'revalidados': 0, 'baixados': 0, 'bytes_economizados': 0}
+
+    def configurar(self, **opcoes):
+        for chave, valor in opcoes.items():
+            if not hasattr(self, chave):
+                raise ValueError(f"Opção de cache desconhecida: {chave}")
+            setattr(self, chave, valor)
+
+    # ------------------------------------------------------------------
+    # ÍNDICE
+    # ------------------------------------------------------------------
+    def _banco(self):
+        # Chamado sempre com o lock
+        if self._conexao is None:
+            os.makedirs(self.pasta, exist_ok=True)
+            conexao = sqlite3.connect(os.path.join(self.pasta, 'indice.db'), check_same_thread=False)
+            conexao.execute("""
+                CREATE TABLE IF NOT EXISTS entradas (
+                    chave TEXT PRIMARY KEY,
+                    url TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    cabecalhos TEXT,
+                    tamanho INTEGER,
+                    gravado_em REAL,
+                    acessado_em REAL
+                )
+            """)
+            conexao.execute("CREATE INDEX IF NOT EXISTS idx_acessado ON entradas (acessado_em)")
+            try:
+                # Índices criados antes do Vary: a coluna entra vazia
+                conexao.execute("ALTER TABLE entradas ADD COLUMN variacao TEXT")
+            except sqlite3.OperationalError:
+                pass
+            conexao.commit()
+            self._tamanho_total = conexao.execute("SELECT COALESCE(SUM(tamanho), 0) FROM entradas").fetchone()[0]
+            self._conexao = conexao
+        return self._conexao
+
+    def _chave(self, url, headers=None):
+        cabecalhos = _minusculos(headers)
+        variante = "\n".join(f"{nome}: {cabecalhos.get(nome, '')}" for nome in CABECALHOS_DA_CHAVE)
+        return hashlib.sha1(f"{url}\n{variante}".encode('utf-8')).hexdigest()
+
+    def _arquivo(self, chave):
+        return os.path.join(self.pasta, chave[:2], chave)
+
+    def _buscar(self, url, headers=None):
+        chave = self._chave(url, headers)
+        with self._lock:
+            linha = self._banco().execute(
+                "SELECT etag, last_modified, cabecalhos, tamanho, gravado_em, variacao FROM entradas WHERE chave = ?",
+                (chave,)
+            ).fetchone()
+        if not linha:
+            return None
+        etag, last_modified, cabecalhos, tamanho, gravado_em, variacao = linha
+        # Vary: a entrada só vale se a requisição repetir os cabeçalhos que o servidor listou
+        pedidos = _minusculos(headers)
+        if any(pedidos.get(nome, '') != valor for nome, valor in json.loads(variacao or '{}').items()):
+            return None
+        return {'chave': chave, 'etag': etag, 'last_modified': last_modified,
+                'cabecalhos': json.loads(cabecalhos), 'tamanho': tamanho, 'gravado_em': gravado_em}
+
+    def _contar(self, **incrementos):
+        with self._lock:
+            for nome, valor in incrementos.items():
+                self._contadores[nome] += valor
+
+    def _ler_corpo(self, entrada):
+        try:
+            with open(self._arquivo(entrada['chave']), 'rb') as f:
+                return f.read()
+        except OSError:
+            # Índice apontando para arquivo apagado: esquece a entrada
+            self._remover(entrada['chave'], entrada['tamanho'])
+            return None
+
+    def _remover(self, chave, tamanho):
+        with self._lock:
+            self._banco().execute("DELETE FROM entradas WHERE chave = ?", (chave,))
+            self._conexao.commit()
+            self._tamanho_total -= tamanho or 0
+        try: os.remove(self._arquivo(chave))
+        except OSError: pass
+
+    def _gravar(self, url, resposta, headers=None):
+        conteudo = resposta.content
+        chave = self._chave(url, headers)
+        arquivo = self._arquivo(chave)
+        os.makedirs(os.path.dirname(arquivo), exist_ok=True)
+        temporario = f"{arquivo}.{threading.get_ident()}.tmp"
+        with open(temporario, 'wb') as f:
+            f.write(conteudo)
+        os.replace(temporario, arquivo)
+
+        cabecalhos = {k: v for k, v in resposta.headers.items() if k.lower() not in CABECALHOS_DESCARTADOS}
+        pedidos = _minusculos(headers)
+        variacao = {nome: pedidos.get(nome, '') for nome in self._vary(resposta)}
+        agora = time.time()
+        with self._lock:
+            banco = self._banco()
+            anterior = banco.execute("SELECT tamanho FROM entradas WHERE chave = ?", (chave,)).fetchone()
+            banco.execute(
+                "INSERT OR REPLACE INTO entradas "
+                "(chave, url, etag, last_modified, cabecalhos, tamanho, gravado_em, acessado_em, variacao) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (chave, url, resposta.headers.get('ETag'), resposta.headers.get('Last-Modified'),
+                 json.dumps(cabecalhos), len(conteudo), agora, agora, json.dumps(variacao))
+            )
+            banco.commit()
+            self._tamanho_total += len(conteudo) - (anterior[0] if anterior else 0)
+        self._despejar()
+
+    def _vary(self, resposta):
+        # Accept-Encoding não conta: o corpo é guardado já descomprimido
+        nomes = [n.strip().lower() for n in resposta.headers.get('Vary', '').split(',') if n.strip()]
+        return [n for n in nomes if n != 'accept-encoding']
+
+    def _tocar(self, chave, revalidado=False):
+        agora = time.time()
+        with self._lock:
+            if revalidado:
+                self._banco().execute("UPDATE entradas SET acessado_em = ?, gravado_em = ? WHERE chave = ?", (agora, agora, chave))
+            else:
+                self._banco().execute("UPDATE entradas SET acessado_em = ? WHERE chave = ?", (agora, chave))
+            self._conexao.commit()
+
+    def _despejar(self):
+        """LRU: remove as entradas menos acessadas até voltar a 90% do teto"""
+        teto = self.tamanho_maximo_mb * 1024 * 1024
+        if self._tamanho_total <= teto:
+            return
+        with self._lock:
+            linhas = self._banco().execute("SELECT chave, tamanho FROM entradas ORDER BY acessado_em").fetchall()
+        liberar = self._tamanho_total - teto * 0.9
+        for chave, tamanho in linhas:
+            if liberar <= 0:
+                break
+            self._remover(chave, tamanho)
+            liberar -= tamanho or 0
+
+    # ------------------------------------------------------------------
+    # FLUXO DE UMA REQUISIÇÃO (usado pelo caminho síncrono e pelo assíncrono)
+    # ------------------------------------------------------------------
+    def _resposta(self, url, entrada, corpo):
+        resposta = requests.Response()
+        resposta._content = corpo
+        resposta.status_code = 200
+        resposta.reason = 'OK'
+        resposta.url = url
+        resposta.headers = CaseInsensitiveDict(entrada['cabecalhos'])
+        resposta.encoding = get_encoding_from_headers(resposta.headers)
+        return resposta
+
+    def preparar(self, url, ttl=None, headers=None):
+        """
+        Antes da requisição (`headers`: os que o scraper vai mandar). Retorna
+        (resposta, entrada, cabecalhos_condicionais): resposta != None quando a entrada
+        ainda está no TTL e a rede nem é usada.
+        """
+        if not self.ativo:
+            return None, None, {}
+        ttl = self.ttl_padrao if ttl is None else ttl
+        entrada = self._buscar(url, headers)
+        if not entrada:
+            return None, None, {}
+
+        if ttl and time.time() - entrada['gravado_em'] < ttl:
+            corpo = self._ler_corpo(entrada)
+            if corpo is not None:
+                self._tocar(entrada['chave'])
+                self._contar(hits=1, bytes_economizados=len(corpo))
+                return self._resposta(url, entrada, corpo), entrada, {}
+
+        condicionais = {}
+        if entrada['etag']:
+            condicionais['If-None-Match'] = entrada['etag']
+        if entrada['last_modified']:
+            condicionais['If-Modified-Since'] = entrada['last_modified']
+        return None, entrada, condicionais
+
+    def concluir(self, url, resposta, entrada=None, ttl=None, headers=None):
+        """Depois da requisição: 304 vira a resposta guardada; 200 cacheável é gravado"""
+        if not self.ativo:
+            return resposta
+        if resposta.status_code == 304 and entrada:
+            corpo = self._ler_corpo(entrada)
+            if corpo is not None:
+                self._tocar(entrada['chave'], revalidado=True)
+                self._contar(revalidados=1, bytes_economizados=len(corpo))
+                return self._resposta(url, entrada, corpo)
+            return resposta
+
+        if resposta.status_code == 200:
+            self._contar(baixados=1)
+            ttl = self.ttl_padrao if ttl is None else ttl
+            controle = resposta.headers.get('Cache-Control', '').lower()
+            tem_validador = resposta.headers.get('ETag') or resposta.headers.get('Last-Modified')
+            vary_tudo = resposta.headers.get('Vary', '').strip() == '*'
+            if 'no-store' not in controle and not vary_tudo and (tem_validador or ttl):
+                try:
+                    self._gravar(url, resposta, headers)
+                except Exception as e:
+                    print(f"   ⚠️ [CACHE HTTP] Falha ao gravar {url}: {e}")
+        return resposta
+
+    def estatisticas(self):
+        with self._lock:
+            entradas = self._banco().execute("SELECT COUNT(*) FROM entradas").fetchone()[0] if self.ativo else 0
+            return dict(self._contadores, entradas=entradas, tamanho_mb=round(self._tamanho_total / 1024 / 1024, 1))
+
+
+_cache = CacheHTTP()
+
+
+def obter_cache_http():
+    return _cache
@@ -0,0 +1,96 @@
+# utils/cache_snapshots.py
+"""
+Cache do DOM já renderizado (depois das esperas, dos cliques em "ver mais" e das abas)
+dos sites pesados em JS. Renderizar é a parte cara do job: com o snapshot guardado, um
+job repetido ou reprocessado vai direto para a extração, sem abrir o Chrome.
+
+Um arquivo .html.gz por URL canônica em 'snapshots/'. Vale pelo 'snapshot_ttl' do
+site no SITES_CONFIG; sites sem a chave não usam o cache.
+"""
+import os
+import gzip
+import time
+import hashlib
+import threading
+from utils.url_canonica import canonicalizar_url
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_SNAPSHOTS = os.path.join(BASE_DIR, 'snapshots')
+
+
+class CacheSnapshots:
+    def __init__(self, pasta=PASTA_SNAPSHOTS, limpar_a_cada=50):
+        self.pasta = pasta
+        self.limpar_a_cada = limpar_a_cada
+        self._lock = threading.Lock()
+        self._gravacoes = 0
+        self._maior_ttl = 0
+        self._contadores = {'hits': 0, 'misses': 0, 'gravados': 0}
+
+    def _arquivo(self, url):
+        chave = hashlib.sha1(canonicalizar_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.pasta, f"{chave}.html.gz")
+
+    def ler(self, url, ttl):
+        """HTML renderizado da URL, ou None se não houver snapshot dentro do TTL"""
+        arquivo = self._arquivo(url)
+        try:
+            if time.time() - os.path.getmtime(arquivo) < ttl:
+                with gzip.open(arquivo, 'rt', encoding='utf-8') as f:
+                    html = f.read()
+                self._contar('hits')
+                return html
+        except (OSError, EOFError):
+            pass
+        self._contar('misses')
+        return None
+
+    def gravar(self, url, html, ttl):
+        os.makedirs(self.pasta, exist_ok=True)
+        arquivo = self._arquivo(url)
+        temporario = f"{arquivo}.{threading.get_ident()}.tmp"
+        with gzip.open(temporario, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(html)
+        os.replace(temporario, arquivo)
+
+        with self._lock:
+            self._contadores['gravados'] += 1
+            self._maior_ttl = max(self._maior_ttl, ttl)
+            self._gravacoes += 1
+            limpar = self._gravacoes % self.limpar_a_cada == 0
+        if limpar:
+            self.limpar_expirados()
+
+    def invalidar(self, url):
+        try: os.remove(self._arquivo(url))
+        except OSError: pass
+
+    def limpar_expirados(self):
+        """Apaga snapshots mais velhos que o maior TTL em uso"""
+        limite = time.time() - self._maior_ttl
+        try:
+            nomes = os.listdir(self.pasta)
+        except OSError:
+            return
+        for nome in nomes:
+            caminho = os.path.join(self.pasta, nome)
+            try:
+                if os.path.getmtime(caminho) < limite:
+                    os.remove(caminho)
+            except OSError:
+                pass
+
+    def _contar(self, chave):
+        with self._lock:
+            self._contadores[chave] += 1
+
+    def estatisticas(self):
+        with self._lock:
+            return dict(self._contadores)
+
+
+_snapshots = CacheSnapshots()
+
+
+def obter_snapshots():
+    return _snapshots
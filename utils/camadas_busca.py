@@ -0,0 +1,59 @@
+# utils/camadas_busca.py
+"""
+Memória de qual camada de busca resolve cada site: 'http' (GET simples, sem Chrome)
+ou 'navegador'. Um site só passa para o navegador depois de `falhas_para_trocar`
+jobs seguidos em que o HTTP não bastou (um timeout ou 503 isolado não conta); daí em
+diante começa direto nele, mas de tempos em tempos o HTTP é testado de novo (o site
+pode ter mudado).
+"""
+import threading
+
+
+class MemoriaCamadas:
+    def __init__(self, reavaliar_a_cada=25, falhas_para_trocar=3):
+        self.reavaliar_a_cada = reavaliar_a_cada
+        self.falhas_para_trocar = falhas_para_trocar
+        self._lock = threading.Lock()
+        self._sites = {}   # site -> {'camada', 'desde_teste', 'falhas_http', 'http', 'navegador'}
+
+    def camada_inicial(self, site):
+        """'http' ou 'navegador': por onde o próximo job do site deve começar"""
+        with self._lock:
+            registro = self._sites.get(site)
+            if not registro or registro['camada'] == 'http':
+                return 'http'
+            registro['desde_teste'] += 1
+            if self.reavaliar_a_cada and registro['desde_teste'] >= self.reavaliar_a_cada:
+                registro['desde_teste'] = 0
+                return 'http'
+            return 'navegador'
+
+    def registrar(self, site, camada):
+        """Camada que resolveu o job do site ('navegador' depois de um HTTP que não bastou)"""
+        with self._lock:
+            registro = self._sites.setdefault(
+                site, {'camada': 'http', 'desde_teste': 0, 'falhas_http': 0, 'http': 0, 'navegador': 0}
+            )
+            registro[camada] += 1
+            if camada == 'http':
+                registro['falhas_http'] = 0
+            elif registro['camada'] == 'http':
+                registro['falhas_http'] += 1
+                if registro['falhas_http'] < self.falhas_para_trocar:
+                    return
+            if registro['camada'] != camada:
+                print(f"   🪜 [CAMADAS] {site}: passando de '{registro['camada']}' para '{camada}'.")
+                registro['camada'] = camada
+                registro['desde_teste'] = 0
+
+    def estatisticas(self):
+        with self._lock:
+            return {site: {'camada': r['camada'], 'http': r['http'], 'navegador': r['navegador']}
+                    for site, r in self._sites.items()}
+
+
+_memoria = MemoriaCamadas()
+
+
+def obter_memoria_camadas():
+    return _memoria
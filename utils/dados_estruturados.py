@@ -0,0 +1,183 @@
+# utils/dados_estruturados.py
+"""
+Primeira passada sobre qualquer HTML de produto: lê os dados estruturados que a própria
+loja publica para o Google (JSON-LD schema.org/Product, inclusive dentro de @graph,
+microdata itemprop e OpenGraph) e devolve título, descrição, imagem e uma ficha técnica
+parcial (marca, SKU, GTIN, dimensões, additionalProperty...).
+
+'completo' diz se o resultado basta para pular as heurísticas de DOM do site (e, nos
+sites que começam por HTTP, o navegador): título, imagem, descrição de verdade e uma
+ficha com pelo menos `minimo_specs` itens técnicos (additionalProperty e dimensões).
+Marca, SKU, EAN e afins entram na ficha, mas não contam: um bloco só de identificadores
+não substitui a tabela de specs do site.
+"""
+import json
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+
+# Campos simples do Product -> nome na ficha técnica
+CAMPOS_SPECS = [
+    ('brand', 'Marca'), ('manufacturer', 'Fabricante'), ('model', 'Modelo'),
+    ('mpn', 'MPN'), ('sku', 'SKU'),
+    ('gtin13', 'EAN'), ('gtin', 'EAN'), ('gtin12', 'UPC'), ('gtin14', 'GTIN-14'), ('gtin8', 'GTIN-8'),
+    ('color', 'Cor'), ('material', 'Material'),
+    ('weight', 'Peso'), ('width', 'Largura'), ('height', 'Altura'), ('depth', 'Profundidade')
+]
+
+# Só estes campos simples contam como ficha técnica; os demais são identificadores
+CAMPOS_DIMENSOES = ('Peso', 'Largura', 'Altura', 'Profundidade')
+IDENTIFICADORES = {nome for _, nome in CAMPOS_SPECS if nome not in CAMPOS_DIMENSOES}
+
+TIPOS_PRODUTO = ('Product', 'ProductGroup', 'IndividualProduct', 'ProductModel')
+
+
+def _texto(valor):
+    """Valor schema.org (str, número, Brand, QuantitativeValue...) como texto simples"""
+    if valor is None:
+        return ""
+    if isinstance(valor, list):
+        return ", ".join(t for t in (_texto(v) for v in valor) if t)
+    if isinstance(valor, dict):
+        if 'value' in valor:
+            unidade = valor.get('unitText') or valor.get('unitCode') or ''
+            return f"{valor['value']} {unidade}".strip()
+        return _texto(valor.get('name') or valor.get('@id'))
+    texto = str(valor).strip()
+    if '<' in texto and '>' in texto:
+        texto = BeautifulSoup(texto, 'html.parser').get_text(separator="\n", strip=True)
+    return texto
+
+
+def _imagem(valor):
+    if isinstance(valor, list):
+        for item in valor:
+            url = _imagem(item)
+            if url: return url
+        return None
+    if isinstance(valor, dict):
+        return _imagem(valor.get('contentUrl') or valor.get('url'))
+    return valor.strip() if isinstance(valor, str) and valor.strip() else None
+
+
+def _eh_produto(item):
+    tipo = item.get('@type')
+    tipos = tipo if isinstance(tipo, list) else [tipo]
+    return any(t in TIPOS_PRODUTO for t in tipos)
+
+
+def _nos_jsonld(dado):
+    """Percorre listas e @graph devolvendo todos os objetos"""
+    if isinstance(dado, list):
+        for item in dado:
+            yield from _nos_jsonld(item)
+    elif isinstance(dado, dict):
+        yield dado
+        if '@graph' in dado:
+            yield from _nos_jsonld(dado['@graph'])
+
+
+def _produto_jsonld(soup):
+    for script in soup.find_all("script", type="application/ld+json"):
+        bruto = script.string or script.get_text()
+        if not bruto:
+            continue
+        try:
+            dado = json.loads(bruto.strip())
+        except ValueError:
+            # Alguns sites deixam quebras de linha cruas dentro das strings
+            try: dado = json.loads(bruto.replace('\n', ' ').replace('\r', ' ').strip())
+            except ValueError: continue
+        for item in _nos_jsonld(dado):
+            if _eh_produto(item):
+                # ProductGroup: os dados concretos costumam estar na primeira variante
+                variantes = item.get('hasVariant')
+                if item.get('@type') == 'ProductGroup' and isinstance(variantes, list) and variantes:
+                    return dict(variantes[0], **{k: v for k, v in item.items() if k != 'hasVariant' and v})
+                return item
+    return None
+
+
+def _specs_do_produto(produto):
+    specs = {}
+    for campo, nome in CAMPOS_SPECS:
+        valor = _texto(produto.get(campo))
+        if valor and nome not in specs:
+            specs[nome] = valor
+    propriedades = produto.get('additionalProperty') or []
+    if isinstance(propriedades, dict):
+        propriedades = [propriedades]
+    for prop in propriedades:
+        if isinstance(prop, dict):
+            nome, valor = _texto(prop.get('name')), _texto(prop.get('value'))
+            if nome and valor:
+                specs[nome] = valor
+    return specs
+
+
+def contar_specs_tecnicas(specs):
+    """Itens da ficha que não são identificadores (Marca, SKU, EAN, Cor...)"""
+    return sum(1 for nome in specs if nome not in IDENTIFICADORES)
+
+
+def _produto_microdata(soup):
+    escopo = soup.find(attrs={'itemtype': lambda t: t and 'schema.org/Product' in t})
+    if not escopo:
+        return None
+    produto = {}
+    for el in escopo.find_all(attrs={'itemprop': True}):
+        campo = el['itemprop']
+        if campo in produto:
+            continue
+        valor = el.get('content') or el.get('src') or el.get('href') or el.get_text(separator="\n", strip=True)
+        if valor:
+            produto[campo] = valor
+    return produto
+
+
+def _opengraph(soup):
+    dados = {}
+    for meta in soup.find_all('meta'):
+        chave = meta.get('property') or meta.get('name') or ''
+        if chave in ('og:title', 'og:description', 'og:image', 'og:image:secure_url', 'twitter:image') and meta.get('content'):
+            dados.setdefault(chave, meta['content'].strip())
+    return dados
+
+
+def extrair_dados_estruturados(html, url_base=None, minimo_descricao=40, minimo_specs=5):
+    """
+    html: string ou BeautifulSoup. Retorna
+    {'titulo', 'descricao', 'imagem', 'specs', 'fontes', 'completo'}.
+    """
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html or "", 'html.parser')
+    resultado = {'titulo': "", 'descricao': "", 'imagem': None, 'specs': {}, 'fontes': [], 'completo': False}
+
+    # Ordem de confiança: JSON-LD > microdata > OpenGraph. Cada fonte só preenche o que falta.
+    for fonte, produto in (('json-ld', _produto_jsonld(soup)), ('microdata', _produto_microdata(soup))):
+        if not produto:
+            continue
+        resultado['fontes'].append(fonte)
+        resultado['titulo'] = resultado['titulo'] or _texto(produto.get('name'))
+        resultado['descricao'] = resultado['descricao'] or _texto(produto.get('description'))
+        resultado['imagem'] = resultado['imagem'] or _imagem(produto.get('image'))
+        for chave, valor in _specs_do_produto(produto).items():
+            resultado['specs'].setdefault(chave, valor)
+
+    og = _opengraph(soup)
+    if og:
+        resultado['fontes'].append('opengraph')
+        resultado['titulo'] = resultado['titulo'] or og.get('og:title', "")
+        resultado['descricao'] = resultado['descricao'] or og.get('og:description', "")
+        resultado['imagem'] = resultado['imagem'] or og.get('og:image:secure_url') or og.get('og:image') or og.get('twitter:image')
+
+    if resultado['imagem']:
+        if resultado['imagem'].startswith('//'):
+            resultado['imagem'] = 'https:' + resultado['imagem']
+        elif url_base:
+            resultado['imagem'] = urljoin(url_base, resultado['imagem'])
+
+    resultado['completo'] = bool(
+        resultado['titulo'] and resultado['imagem']
+        and len(resultado['descricao']) >= minimo_descricao
+        and contar_specs_tecnicas(resultado['specs']) >= minimo_specs
+    )
+    return resultado
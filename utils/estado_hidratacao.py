@@ -0,0 +1,313 @@
+# utils/estado_hidratacao.py
+"""
+Leitura do estado de hidratação das lojas em Next.js/React. O HTML cru que o servidor
+manda já traz, num <script>, o JSON com que o React monta a página (__NEXT_DATA__,
+window.__INITIAL_STATE__, __PRELOADED_STATE__, __APOLLO_STATE__...). Descrição
+completa, ficha técnica e galeria estão ali antes de qualquer renderização ou clique
+em "mostrar descrição".
+
+Não há um formato comum entre as lojas: o JSON é percorrido inteiro e o objeto que
+mais parece um produto (nome + descrição/ficha/imagem) é o escolhido. Campos que o
+estado não trouxer saem dos dados estruturados da mesma página (JSON-LD/OpenGraph).
+Retorno no mesmo formato de utils/dados_estruturados.py.
+"""
+import re
+import json
+from urllib.parse import urljoin, urlsplit, parse_qs
+from bs4 import BeautifulSoup
+from utils.dados_estruturados import extrair_dados_estruturados, contar_specs_tecnicas
+
+# window.__ALGUMA_COISA__ = {...}  ou  = JSON.parse("...")
+RE_ESTADO_GLOBAL = re.compile(r'window\.(__[A-Z0-9_]+__)\s*=\s*')
+
+CHAVES_TITULO = ('productName', 'name', 'title', 'nome', 'titulo')
+CHAVES_DESCRICAO = ('longDescription', 'fullDescription', 'descriptionHtml', 'htmlDescription',
+                    'description', 'descricao', 'shortDescription')
+CHAVES_IMAGEM = ('images', 'image', 'imageUrl', 'photos', 'pictures', 'media', 'gallery', 'imagens', 'thumbnail')
+CHAVES_SPECS = ('specifications', 'technicalSpecifications', 'technicalSpecification', 'specs',
+                'characteristics', 'caracteristicas', 'especificacoes', 'fichaTecnica', 'attributes', 'properties')
+
+# Dentro de um item de ficha técnica
+CHAVES_NOME_SPEC = ('name', 'label', 'key', 'title', 'nome')
+CHAVES_VALOR_SPEC = ('value', 'values', 'valor', 'text', 'description')
+CHAVES_GRUPO_SPEC = ('specifications', 'attributes', 'items', 'fields')
+CHAVES_URL_IMAGEM = ('url', 'src', 'imageUrl', 'original', 'zoom', 'large', 'g', 'path')
+
+# Identidade do nó: precisa bater com a URL pedida (ou o nome com o da página)
+CHAVES_ID = ('id', 'sku', 'productId', 'productID', 'skuId', 'itemId', 'code', 'codigo', 'slug',
+             'urlKey', 'url_key', 'linkText', 'productReference', 'refId', 'partNumber')
+CHAVES_LINK = ('url', 'link', 'href', 'canonicalUrl', 'canonical', 'permalink', 'path')
+# Chaves de um dict de atributos que não são ficha técnica (GraphQL, ids, links)
+CHAVES_NAO_SPEC = {k.lower() for k in CHAVES_ID + CHAVES_LINK} | {'uuid', 'typename', 'sellerid', 'ean', 'gtin'}
+RE_CHAVE_ID = re.compile(r'(?:[a-z](?:Id|ID)|_id)$')
+
+LIMITE_NOS = 200000
+
+
+def _scripts_estado(soup):
+    """Todos os JSONs de estado embutidos na página, com o nome da fonte"""
+    for script in soup.find_all('script'):
+        bruto = script.string or script.get_text()
+        if not bruto:
+            continue
+        tipo = (script.get('type') or '').lower()
+
+        if script.get('id') == '__NEXT_DATA__' or (tipo == 'application/json' and len(bruto) > 200):
+            try:
+                yield script.get('id') or 'application/json', json.loads(bruto)
+            except ValueError:
+                pass
+            continue
+        if tipo and 'javascript' not in tipo:
+            continue
+
+        for achado in RE_ESTADO_GLOBAL.finditer(bruto):
+            inicio = achado.end()
+            try:
+                if bruto.startswith('JSON.parse(', inicio):
+                    literal, _ = json.JSONDecoder().raw_decode(bruto, inicio + len('JSON.parse('))
+                    dado = json.loads(literal)
+                else:
+                    dado, _ = json.JSONDecoder().raw_decode(bruto, inicio)
+            except ValueError:
+                continue
+            yield achado.group(1), dado
+
+
+def _texto(valor):
+    if isinstance(valor, dict):
+        valor = valor.get('html') or valor.get('text') or valor.get('value') or ""
+    if not isinstance(valor, str):
+        return ""
+    texto = valor.strip()
+    if '<' in texto and '>' in texto:
+        texto = BeautifulSoup(texto, 'html.parser').get_text(separator="\n", strip=True)
+    return texto
+
+
+def _valor_spec(valor):
+    if isinstance(valor, list):
+        return ", ".join(t for t in (_valor_spec(v) for v in valor) if t)
+    if isinstance(valor, dict):
+        return _valor_spec(valor.get('value') or valor.get('name') or valor.get('label'))
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        return str(valor)
+    return re.sub(r'\s+', ' ', _texto(valor)).strip()
+
+
+def _pares_specs(valor, profundidade=0):
+    """Lista de {name, value}, grupos com lista interna, dict simples ou 'Chave: Valor'"""
+    if profundidade > 3:
+        return
+    if isinstance(valor, dict):
+        if any(k in valor for k in CHAVES_GRUPO_SPEC):
+            for k in CHAVES_GRUPO_SPEC:
+                if isinstance(valor.get(k), list):
+                    yield from _pares_specs(valor[k], profundidade + 1)
+            return
+        # Mapa nome -> valor (ou nome -> {name, value}); ids e campos internos ficam de fora
+        for chave, v in valor.items():
+            if chave.startswith('__') or chave.lower() in CHAVES_NAO_SPEC or RE_CHAVE_ID.search(chave):
+                continue
+            if isinstance(v, dict):
+                nome = next((v[k] for k in CHAVES_NOME_SPEC if isinstance(v.get(k), str) and v[k].strip()), None)
+                interno = next((v[k] for k in CHAVES_VALOR_SPEC if v.get(k) not in (None, '', [])), None)
+                if nome and interno is not None:
+                    yield nome.strip(), _valor_spec(interno)
+            elif isinstance(v, (str, int, float)) and not isinstance(v, bool):
+                yield chave, _valor_spec(v)
+        return
+    if not isinstance(valor, list):
+        return
+    for item in valor:
+        if isinstance(item, str) and ':' in item:
+            chave, v = item.split(':', 1)
+            yield chave.strip(), v.strip()
+        elif isinstance(item, dict):
+            grupo = next((item[k] for k in CHAVES_GRUPO_SPEC if isinstance(item.get(k), list)), None)
+            if grupo is not None:
+                yield from _pares_specs(grupo, profundidade + 1)
+                continue
+            nome = next((item[k] for k in CHAVES_NOME_SPEC if isinstance(item.get(k), str) and item[k].strip()), None)
+            v = next((item[k] for k in CHAVES_VALOR_SPEC if item.get(k) not in (None, '', [])), None)
+            if nome and v is not None:
+                yield nome.strip(), _valor_spec(v)
+
+
+def _url_imagem(valor, profundidade=0):
+    if profundidade > 4 or valor is None:
+        return None
+    if isinstance(valor, str):
+        url = valor.strip()
+        return url if url.startswith(('http', '//', '/')) and ' ' not in url else None
+    if isinstance(valor, list):
+        for item in valor:
+            url = _url_imagem(item, profundidade + 1)
+            if url: return url
+        return None
+    if isinstance(valor, dict):
+        for chave in CHAVES_URL_IMAGEM:
+            url = _url_imagem(valor.get(chave), profundidade + 1)
+            if url: return url
+    return None
+
+
+def _ler_candidato(no):
+    titulo = next((no[k].strip() for k in CHAVES_TITULO
+                   if isinstance(no.get(k), str) and 2 < len(no[k].strip()) < 300), "")
+    if not titulo:
+        return None
+    descricoes = [_texto(no.get(k)) for k in CHAVES_DESCRICAO if no.get(k)]
+    specs = {}
+    for chave in CHAVES_SPECS:
+        for nome, valor in _pares_specs(no.get(chave)):
+            nome = re.sub(r'\s+', ' ', str(nome)).strip().rstrip(':')
+            if nome and valor and nome not in specs:
+                specs[nome] = valor
+    imagem = None
+    for chave in CHAVES_IMAGEM:
+        imagem = _url_imagem(no.get(chave))
+        if imagem: break
+    ids = [str(no[k]).strip() for k in CHAVES_ID if isinstance(no.get(k), (str, int)) and not isinstance(no.get(k), bool)]
+    links = [no[k].strip() for k in CHAVES_LINK if isinstance(no.get(k), str) and no[k].strip()]
+    return {'titulo': titulo, 'descricao': max(descricoes, key=len, default=""), 'imagem': imagem, 'specs': specs,
+            'ids': ids, 'links': links}
+
+
+def _normalizar_nome(texto):
+    return re.sub(r'[^a-z0-9]+', ' ', (texto or "").lower()).strip()
+
+
+def _mesmo_nome(titulo, nomes_pagina):
+    """Nome do nó igual ao da página, ou contido nele ('Mouse X | Loja' contém 'Mouse X')"""
+    titulo = _normalizar_nome(titulo)
+    if len(titulo) < 4:
+        return False
+    for nome in nomes_pagina:
+        nome = _normalizar_nome(nome)
+        if nome and (titulo == nome or (len(titulo) >= 10 and titulo in nome) or (len(nome) >= 10 and nome in titulo)):
+            return True
+    return False
+
+
+def _mesma_url(candidato, url):
+    """Algum id/SKU/slug do nó aparece como trecho do caminho da URL, ou o link dele é a própria URL"""
+    if not url:
+        return False
+    partes = urlsplit(url)
+    caminho = partes.path.lower().rstrip('/')
+    trechos = set(caminho.split('/')) | set(re.split(r'[^a-z0-9]+', caminho))
+    for valores in parse_qs(partes.query).values():
+        trechos.update(v.lower() for v in valores)
+    for ident in candidato['ids']:
+        ident = ident.lower()
+        if len(ident) >= 3 and (ident in trechos or ('-' in ident and len(ident) >= 8 and ident in caminho)):
+            return True
+    for link in candidato['links']:
+        caminho_link = urlsplit(link).path.lower().rstrip('/')
+        if caminho_link and caminho_link == caminho:
+            return True
+    return False
+
+
+def _pontuar(candidato, chave_pai, em_lista, minimo_descricao):
+    pontos = 3
+    if candidato['descricao']:
+        pontos += 2 if len(candidato['descricao']) >= minimo_descricao else 1
+    if candidato['specs']:
+        pontos += 2 + min(len(candidato['specs']), 20) / 20
+    if candidato['imagem']:
+        pontos += 1
+    # pageProps.product, state.produto...: o produto da página fica fora de listas
+    if 'product' in chave_pai.lower() or 'produto' in chave_pai.lower():
+        pontos += 1 if em_lista else 3
+    if em_lista:
+        pontos -= 4   # relacionados, vitrines, "quem viu também"
+    return pontos
+
+
+def _melhor_produto(dado, minimo_descricao, url=None, nomes_pagina=()):
+    """
+    Percorre o JSON (em largura, até LIMITE_NOS) e devolve o nó que mais parece um produto,
+    entre os que são o produto da URL: id/SKU/slug no caminho ou nome igual ao da página
+    (JSON-LD/og:title/<title>). Um relacionado com ficha maior nunca toma o lugar dele.
+    """
+    melhor, melhor_pontos = None, None
+    fila, vistos = [('', False, dado)], 0
+    while fila and vistos < LIMITE_NOS:
+        proximos = []
+        for chave_pai, em_lista, no in fila:
+            vistos += 1
+            if isinstance(no, dict):
+                candidato = _ler_candidato(no)
+                if candidato and (candidato['descricao'] or candidato['specs']):
+                    candidato['nome_confere'] = _mesmo_nome(candidato['titulo'], nomes_pagina)
+                    if candidato['nome_confere'] or _mesma_url(candidato, url):
+                        pontos = _pontuar(candidato, chave_pai, em_lista, minimo_descricao)
+                        if melhor_pontos is None or pontos > melhor_pontos:
+                            melhor, melhor_pontos = candidato, pontos
+                proximos.extend((str(k), em_lista, v) for k, v in no.items() if isinstance(v, (dict, list)))
+            elif isinstance(no, list):
+                proximos.extend((chave_pai, True, v) for v in no if isinstance(v, (dict, list)))
+        fila = proximos
+    return melhor
+
+
+def _normalizar_imagem(url, url_base):
+    if not url:
+        return None
+    if url.startswith('//'):
+        url = 'https:' + url
+    elif url_base:
+        url = urljoin(url_base, url)
+    # Otimizador de imagens do Next: a original vem no parâmetro url=
+    if '/_next/image' in url:
+        original = parse_qs(urlsplit(url).query).get('url')
+        if original:
+            return _normalizar_imagem(original[0], url_base)
+    return url
+
+
+def extrair_estado_hidratacao(html, url_base=None, minimo_descricao=40, minimo_specs=3, estruturados=None):
+    """
+    html: string ou BeautifulSoup; url_base é a URL do produto pedido; `estruturados` é a
+    leitura de dados estruturados já feita sobre o mesmo HTML (evita repetir). Retorna
+    {'titulo', 'descricao', 'imagem', 'specs', 'fontes', 'completo'}.
+    'completo' exige que o nome do produto confira com o da página (JSON-LD/og:title/<title>).
+    """
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html or "", 'html.parser')
+    resultado = {'titulo': "", 'descricao': "", 'imagem': None, 'specs': {}, 'fontes': [], 'completo': False}
+
+    if estruturados is None:
+        estruturados = extrair_dados_estruturados(soup, url_base=url_base)
+    nomes_pagina = [estruturados['titulo']]
+    if soup.title and soup.title.string:
+        nomes_pagina.append(soup.title.string)
+
+    for fonte, dado in _scripts_estado(soup):
+        produto = _melhor_produto(dado, minimo_descricao, url_base, nomes_pagina)
+        if not produto:
+            continue
+        resultado['fontes'].append(fonte)
+        resultado['titulo'] = resultado['titulo'] or produto['titulo']
+        if len(produto['descricao']) > len(resultado['descricao']):
+            resultado['descricao'] = produto['descricao']
+        resultado['imagem'] = resultado['imagem'] or produto['imagem']
+        for chave, valor in produto['specs'].items():
+            resultado['specs'].setdefault(chave, valor)
+
+    if resultado['fontes']:
+        resultado['titulo'] = resultado['titulo'] or estruturados['titulo']
+        resultado['descricao'] = resultado['descricao'] or estruturados['descricao']
+        resultado['imagem'] = resultado['imagem'] or estruturados['imagem']
+        for chave, valor in estruturados['specs'].items():
+            resultado['specs'].setdefault(chave, valor)
+
+    resultado['imagem'] = _normalizar_imagem(resultado['imagem'], url_base)
+    resultado['completo'] = bool(
+        resultado['titulo'] and resultado['imagem']
+        and _mesmo_nome(resultado['titulo'], nomes_pagina)
+        and len(resultado['descricao']) >= minimo_descricao
+        and contar_specs_tecnicas(resultado['specs']) >= minimo_specs
+    )
+    return resultado
@@ -0,0 +1,167 @@
+# utils/executor_jobs.py
+"""
+Executor dos pedidos da API: um número fixo de workers consumindo uma fila limitada.
+A rota só registra o pedido e enfileira (sem criar thread por URL); se a fila
+estiver cheia o lote inteiro é recusado na hora, em vez de a máquina afundar.
+Quantos desses jobs abrem navegador ao mesmo tempo continua sendo decidido pelo
+governador; os só-HTTP seguem para o motor assíncrono.
+
+Com `limites` (utils/limites_site.py), cada tarefa leva o nome do site e o worker
+pega o primeiro job da fila cujo site ainda tem orçamento: um site saturado espera
+sem segurar os pedidos dos outros.
+
+Uma tarefa que devolve um concurrent.futures.Future (scraper só-HTTP agendado no
+motor assíncrono) libera o worker na hora; o job continua contando para o site até
+o Future terminar.
+"""
+import math
+import time
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+
+class ExecutorJobs:
+    def __init__(self, workers=16, fila_maxima=5000, limites=None, nome="Job"):
+        self.workers = workers
+        self.fila_maxima = fila_maxima
+        self.limites = limites
+        self.nome = nome
+        self._condicao = threading.Condition()
+        self._fila = deque()        # (funcao, args, site, enfileirado_em)
+        self._threads = []
+        self._ocupados = 0
+        self._no_loop = 0           # jobs que devolveram Future e ainda rodam no motor assíncrono
+        self._concluidos = 0
+        self._falhas = 0
+        self._recusados = 0
+        self._espera_total = 0.0
+        self._espera_maxima = 0.0
+
+    def configurar(self, **opcoes):
+        for chave, valor in opcoes.items():
+            if not hasattr(self, chave) or chave.startswith('_'):
+                raise ValueError(f"Opção do executor desconhecida: {chave}")
+            setattr(self, chave, valor)
+
+    def _iniciar_workers(self):
+        # Chamado com o lock: sobe os workers que faltam (na primeira submissão)
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._trabalhar, name=f"{self.nome}-{len(self._threads) + 1}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def submeter_lote(self, tarefas):
+        """
+        tarefas: lista de (funcao, args) ou (funcao, args, site). Tudo ou nada: retorna
+        False (e não enfileira nada) se o lote não couber na fila.
+        """
+        agora = time.time()
+        with self._condicao:
+            if len(self._fila) + len(tarefas) > self.fila_maxima:
+                self._recusados += len(tarefas)
+                return False
+            self._iniciar_workers()
+            self._fila.extend((t[0], t[1], t[2] if len(t) > 2 else None, agora) for t in tarefas)
+            self._condicao.notify(len(tarefas))
+        return True
+
+    def submeter(self, funcao, *args, site=None):
+        return self.submeter_lote([(funcao, args, site)])
+
+    def _proxima(self):
+        """
+        Chamado com o lock. Índice do primeiro job que pode começar agora, ou
+        (None, segundos até o próximo balde de fichas encher; None = só quando algo mudar).
+        """
+        if not self.limites:
+            return (0, 0) if self._fila else (None, None)
+        agora = time.time()
+        menor = math.inf
+        avaliados = {}
+        for indice, (_, _, site, _) in enumerate(self._fila):
+            if site not in avaliados:
+                avaliados[site] = self.limites.espera(site, agora)
+            if avaliados[site] == 0:
+                return indice, 0
+            menor = min(menor, avaliados[site])
+        return None, (None if menor == math.inf else menor)
+
+    def _trabalhar(self):
+        while True:
+            with self._condicao:
+                indice, espera = self._proxima()
+                while indice is None:
+                    self._condicao.wait(timeout=espera)
+                    indice, espera = self._proxima()
+                funcao, args, site, enfileirado_em = self._fila[indice]
+                del self._fila[indice]
+                if self.limites:
+                    self.limites.iniciar(site)
+                espera = time.time() - enfileirado_em
+                self._ocupados += 1
+                self._espera_total += espera
+                self._espera_maxima = max(self._espera_maxima, espera)
+
+            retorno = None
+            try:
+                retorno = funcao(*args)
+            except Exception as e:
+                print(f"   💥 [EXECUTOR] Job terminou com erro não tratado: {e}")
+                self._encerrar(site, True)
+                continue
+
+            if isinstance(retorno, Future):
+                with self._condicao:
+                    self._ocupados -= 1
+                    self._no_loop += 1
+                retorno.add_done_callback(
+                    lambda futuro, site=site: self._encerrar(site, futuro.cancelled() or futuro.exception() is not None, True)
+                )
+            else:
+                self._encerrar(site, False)
+
+    def _encerrar(self, site, falhou, no_loop=False):
+        with self._condicao:
+            if no_loop:
+                self._no_loop -= 1
+            else:
+                self._ocupados -= 1
+            self._concluidos += 1
+            self._falhas += falhou
+            if self.limites:
+                self.limites.terminar(site)
+                # A vaga do site pode destravar um job que estava esperando
+                self._condicao.notify()
+
+    def estatisticas(self):
+        with self._condicao:
+            iniciados = self._concluidos + self._ocupados + self._no_loop
+            return {
+                "workers": self.workers,
+                "ocupados": self._ocupados,
+                "no_loop": self._no_loop,
+                "na_fila": len(self._fila),
+                "fila_maxima": self.fila_maxima,
+                "mais_antigo_na_fila_s": round(time.time() - self._fila[0][3], 2) if self._fila else 0.0,
+                "espera_media_s": round(self._espera_total / iniciados, 2) if iniciados else 0.0,
+                "espera_maxima_s": round(self._espera_maxima, 2),
+                "concluidos": self._concluidos,
+                "falhas": self._falhas,
+                "recusados": self._recusados,
+                "rodando_por_site": self.limites.estatisticas() if self.limites else {}
+            }
+
+
+_executor = ExecutorJobs()
+
+# Entregas (status + webhook) saem por workers próprios, sem esperar atrás das raspagens
+_entregas = ExecutorJobs(workers=4, nome="Entrega")
+
+
+def obter_executor():
+    return _executor
+
+
+def obter_executor_entregas():
+    return _entregas
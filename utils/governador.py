@@ -0,0 +1,98 @@
+# utils/governador.py
+"""
+Limite global de jobs com navegador rodando ao mesmo tempo.
+A capacidade é calculada a partir da RAM e dos núcleos da máquina e, além disso,
+um job só é admitido se ainda houver memória livre. Quem não consegue vaga espera
+na fila. Scrapers que só usam requests nunca passam por aqui.
+"""
+import os
+import time
+import threading
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class GovernadorNavegadores:
+    def __init__(self, maximo=None, mb_por_job=450, reserva_mb=1024, jobs_por_nucleo=1.0, memoria_minima_mb=600, espera_maxima=600):
+        self.mb_por_job = mb_por_job
+        self.reserva_mb = reserva_mb
+        self.memoria_minima_mb = memoria_minima_mb
+        self.espera_maxima = espera_maxima
+        self.capacidade = self._calcular_capacidade(maximo, jobs_por_nucleo)
+
+        self._condicao = threading.Condition()
+        self._em_uso = 0
+        self._na_fila = 0
+        self._admitidos = 0
+        self._espera_total = 0.0
+
+        print(f"   🚦 [GOVERNADOR] Até {self.capacidade} job(s) com navegador ao mesmo tempo.")
+
+    def _calcular_capacidade(self, maximo, jobs_por_nucleo):
+        por_cpu = max(1, int((os.cpu_count() or 2) * jobs_por_nucleo))
+        capacidade = por_cpu
+        if psutil is not None:
+            total_mb = psutil.virtual_memory().total / (1024 * 1024)
+            por_ram = max(1, int((total_mb - self.reserva_mb) / self.mb_por_job))
+            capacidade = min(capacidade, por_ram)
+        if maximo:
+            capacidade = min(capacidade, maximo)
+        return max(1, capacidade)
+
+    def _memoria_livre_mb(self):
+        if psutil is None: return None
+        return psutil.virtual_memory().available / (1024 * 1024)
+
+    def _pode_admitir(self):
+        """Chamado com o lock adquirido"""
+        if self._em_uso >= self.capacidade:
+            return False
+        livre = self._memoria_livre_mb()
+        # Com a máquina sem memória só entra um job por vez (nunca trava tudo)
+        if livre is not None and livre < self.memoria_minima_mb and self._em_uso > 0:
+            return False
+        return True
+
+    def adquirir(self):
+        """Bloqueia até haver vaga para mais um navegador"""
+        inicio = time.time()
+        with self._condicao:
+            self._na_fila += 1
+            try:
+                while not self._pode_admitir():
+                    restante = self.espera_maxima - (time.time() - inicio)
+                    if restante <= 0:
+                        raise Exception("Sem vaga de navegador (fila do governador excedeu o tempo limite)")
+                    # Acorda periodicamente para reavaliar a memória livre
+                    self._condicao.wait(timeout=min(restante, 2))
+            finally:
+                self._na_fila -= 1
+            self._em_uso += 1
+            self._admitidos += 1
+            self._espera_total += time.time() - inicio
+
+        espera = time.time() - inicio
+        if espera > 1:
+            print(f"   🚦 [GOVERNADOR] Vaga de navegador liberada após {espera:.1f}s na fila.")
+
+    def liberar(self):
+        with self._condicao:
+            self._em_uso = max(0, self._em_uso - 1)
+            self._condicao.notify()
+
+    def estatisticas(self):
+        with self._condicao:
+            media = self._espera_total / self._admitidos if self._admitidos else 0.0
+            dados = {
+                "capacidade": self.capacidade,
+                "em_uso": self._em_uso,
+                "na_fila": self._na_fila,
+                "espera_media_s": round(media, 2)
+            }
+        livre = self._memoria_livre_mb()
+        if livre is not None:
+            dados["memoria_livre_mb"] = int(livre)
+        return dados
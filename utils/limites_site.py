@@ -0,0 +1,65 @@
+# utils/limites_site.py
+"""
+Orçamento por site para o executor de pedidos: quantos jobs do mesmo site podem
+rodar ao mesmo tempo ('max_simultaneos') e quantos podem começar por minuto
+('jobs_por_minuto', balde de fichas com rajada de 'rajada' jobs). Vinte links da
+KaBuM chegando juntos entram aos poucos, sem 20 navegadores no mesmo site (captcha,
+403), enquanto os pedidos de outros sites continuam passando na frente.
+
+Os valores vêm de cada entrada do SITES_CONFIG; sem a chave, vale LIMITE_POR_SITE.
+Não tem lock próprio: o executor chama tudo com o lock da fila adquirido.
+"""
+import math
+import time
+
+
+class LimitesSite:
+    def __init__(self, sites_config=None, max_simultaneos=0, jobs_por_minuto=0, rajada=0):
+        self.sites_config = sites_config or {}
+        self.padrao = {'max_simultaneos': max_simultaneos, 'jobs_por_minuto': jobs_por_minuto, 'rajada': rajada}
+        self._em_andamento = {}   # site -> jobs rodando
+        self._baldes = {}         # site -> [fichas, atualizado_em]
+
+    def _limite(self, site, chave):
+        return self.sites_config.get(site, {}).get(chave, self.padrao[chave])
+
+    def _fichas(self, site, agora):
+        """Recarrega o balde do site e devolve (fichas, por_segundo, capacidade)"""
+        por_minuto = self._limite(site, 'jobs_por_minuto')
+        if not por_minuto:
+            return math.inf, 0, math.inf
+        # Rajada padrão: o próprio limite de simultâneos (ou 1)
+        capacidade = self._limite(site, 'rajada') or max(1, self._limite(site, 'max_simultaneos') or 1)
+        por_segundo = por_minuto / 60.0
+        balde = self._baldes.setdefault(site, [capacidade, agora])
+        balde[0] = min(capacidade, balde[0] + (agora - balde[1]) * por_segundo)
+        balde[1] = agora
+        return balde[0], por_segundo, capacidade
+
+    def espera(self, site, agora=None):
+        """0 se um job do site pode começar agora; senão, segundos até poder (inf = esperar um job acabar)"""
+        if site is None:
+            return 0
+        maximo = self._limite(site, 'max_simultaneos')
+        if maximo and self._em_andamento.get(site, 0) >= maximo:
+            return math.inf
+        fichas, por_segundo, _ = self._fichas(site, agora or time.time())
+        if fichas >= 1:
+            return 0
+        return (1 - fichas) / por_segundo
+
+    def iniciar(self, site, agora=None):
+        if site is None:
+            return
+        self._em_andamento[site] = self._em_andamento.get(site, 0) + 1
+        if self._limite(site, 'jobs_por_minuto'):
+            self._fichas(site, agora or time.time())
+            self._baldes[site][0] -= 1
+
+    def terminar(self, site):
+        if site is None:
+            return
+        self._em_andamento[site] = max(0, self._em_andamento.get(site, 0) - 1)
+
+    def estatisticas(self):
+        return {site: rodando for site, rodando in self._em_andamento.items() if rodando}
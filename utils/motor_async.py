@@ -0,0 +1,162 @@
+# utils/motor_async.py
+"""
+Motor assíncrono dos scrapers que não precisam de navegador. Um único event loop,
+numa thread de fundo, multiplexa todos os jobs HTTP em andamento: enquanto um job
+espera a página, os outros já estão parseando ou baixando imagem, sem ocupar uma
+thread por job. Com o aiohttp instalado, as conexões saem de um pool por modo de
+TLS (mesmos modos do utils.sessoes_http); sem ele, cada GET roda na sessão
+compartilhada do requests numa thread auxiliar.
+
+As respostas são sempre requests.Response, então o parsing dos scrapers não muda.
+
+Os fallbacks de navegador dos scrapers assíncronos (Chrome, espera no governador)
+rodam numa pool de threads própria (em_thread_navegador), nunca no executor padrão
+do loop, que fica para os to_thread curtos: parsing, gravação de imagem, Word/PDF.
+"""
+import asyncio
+import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from utils.sessoes_http import http_get, ACCEPT_ENCODING, MODOS_TLS
+from utils.cache_http import obter_cache_http
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class MotorAsync:
+    def __init__(self, conexoes_totais=200, conexoes_por_host=10, timeout_padrao=20, threads_navegador=8):
+        self.conexoes_totais = conexoes_totais
+        self.conexoes_por_host = conexoes_por_host
+        self.timeout_padrao = timeout_padrao
+        self.threads_navegador = threads_navegador
+        self._lock = threading.Lock()
+        self._loop = None
+        self._executor_navegador = None
+        self._sessoes = {}   # tls -> aiohttp.ClientSession (só usado dentro do loop)
+        self._em_andamento = 0
+        self._concluidos = 0
+
+    # ------------------------------------------------------------------
+    # LOOP
+    # ------------------------------------------------------------------
+    def _obter_loop(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                pronto = threading.Event()
+
+                def rodar():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(pronto.set)
+                    loop.run_forever()
+
+                threading.Thread(target=rodar, name="MotorAsync", daemon=True).start()
+                pronto.wait()
+                self._loop = loop
+            return self._loop
+
+    def agendar(self, coro):
+        """Coloca a corrotina no loop e devolve um concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(self._acompanhar(coro), self._obter_loop())
+
+    def executar(self, coro, timeout=None):
+        """Roda a corrotina no loop e bloqueia só a thread chamadora até o resultado"""
+        return self.agendar(coro).result(timeout)
+
+    async def em_thread_navegador(self, funcao, *args):
+        """
+        Roda `funcao` (trabalho com Chrome) na pool própria do navegador. Pode esperar
+        minutos pelo governador sem tirar thread dos GETs e parsings dos outros jobs.
+        """
+        with self._lock:
+            if self._executor_navegador is None:
+                self._executor_navegador = ThreadPoolExecutor(self.threads_navegador, thread_name_prefix="MotorNavegador")
+        return await asyncio.get_running_loop().run_in_executor(self._executor_navegador, funcao, *args)
+
+    async def _acompanhar(self, coro):
+        # Contadores só são tocados dentro do loop: dispensam lock
+        self._em_andamento += 1
+        try:
+            return await coro
+        finally:
+            self._em_andamento -= 1
+            self._concluidos += 1
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+    def _contexto_ssl(self, tls):
+        if tls is None:
+            return None
+        if tls == 'sem_verificacao':
+            return False
+        ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+        try:
+            ctx.set_ciphers('ALL:@SECLEVEL=0')
+        except:
+            ctx.set_ciphers('DEFAULT')
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+        return ctx
+
+    def _sessao(self, tls):
+        sessao = self._sessoes.get(tls)
+        if sessao is None or sessao.closed:
+            conector = aiohttp.TCPConnector(
+                limit=self.conexoes_totais,
+                limit_per_host=self.conexoes_por_host,
+                ssl=self._contexto_ssl(tls),
+                ttl_dns_cache=300
+            )
+            sessao = aiohttp.ClientSession(connector=conector, headers={'Accept-Encoding': ACCEPT_ENCODING})
+            self._sessoes[tls] = sessao
+        return sessao
+
+    async def get(self, url, tls=None, headers=None, timeout=None, cache_ttl=None):
+        """GET assíncrono (passando pelo cache em disco). Retorna um requests.Response"""
+        if tls not in MODOS_TLS:
+            raise ValueError(f"Modo de TLS desconhecido: {tls}")
+        timeout = timeout or self.timeout_padrao
+
+        if aiohttp is None:
+            return await asyncio.to_thread(http_get, url, tls=tls, cache_ttl=cache_ttl, headers=headers, timeout=timeout)
+
+        cache = obter_cache_http()
+        pedidos = headers
+        guardada, entrada, condicionais = cache.preparar(url, cache_ttl, pedidos)
+        if guardada is not None:
+            return guardada
+        if condicionais:
+            headers = dict(headers or {}, **condicionais)
+
+        limite = aiohttp.ClientTimeout(total=timeout)
+        async with self._sessao(tls).get(url, headers=headers, timeout=limite) as r:
+            resposta = requests.Response()
+            resposta._content = await r.read()
+            resposta.status_code = r.status
+            resposta.reason = r.reason
+            resposta.url = str(r.url)
+            resposta.headers = CaseInsensitiveDict(r.headers)
+            resposta.encoding = get_encoding_from_headers(resposta.headers)
+        return cache.concluir(url, resposta, entrada, cache_ttl, pedidos)
+
+    def estatisticas(self):
+        return {
+            'backend': 'aiohttp' if aiohttp else 'threads',
+            'threads_navegador': self.threads_navegador,
+            'em_andamento': self._em_andamento,
+            'concluidos': self._concluidos
+        }
+
+
+_motor = MotorAsync()
+
+
+def obter_motor():
+    return _motor
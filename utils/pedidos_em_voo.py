@@ -0,0 +1,70 @@
+# utils/pedidos_em_voo.py
+"""
+Coalescência de pedidos repetidos: o bot reenvia o mesmo link enquanto o primeiro
+job ainda roda (timeout do webhook, clique duplo...). Pela URL canônica, o pedido
+novo é anexado ao job em andamento em vez de abrir outra raspagem em paralelo e
+gerar outro par de arquivos. Quando o job termina, concluir() devolve todos os
+pedidos anexados e cada um recebe o seu próprio status/webhook do mesmo resultado.
+"""
+import threading
+from utils.url_canonica import canonicalizar_url
+
+
+class PedidosEmVoo:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._em_voo = {}         # url canônica -> [pedido, ...] (o primeiro é o que roda)
+        self._coalescidos = 0
+
+    def anexar_lote(self, pedidos, enfileirar):
+        """
+        pedidos: dicts com pelo menos 'id' e 'url'. Os de URL já em andamento (ou repetida
+        no próprio lote) só são anexados; enfileirar(novos) recebe os que precisam rodar
+        (chamado mesmo com a lista vazia) e devolve True/False. Com False nada fica
+        registrado e o retorno é False.
+        """
+        with self._lock:
+            novos, tocadas = [], set()
+            for pedido in pedidos:
+                chave = canonicalizar_url(pedido['url'])
+                tocadas.add(chave)
+                if chave in self._em_voo:
+                    self._em_voo[chave].append(pedido)
+                else:
+                    self._em_voo[chave] = [pedido]
+                    novos.append(pedido)
+
+            if not enfileirar(novos):
+                ids = {p['id'] for p in pedidos}
+                for chave in tocadas:
+                    restantes = [p for p in self._em_voo[chave] if p['id'] not in ids]
+                    if restantes:
+                        self._em_voo[chave] = restantes
+                    else:
+                        del self._em_voo[chave]
+                return False
+
+            self._coalescidos += len(pedidos) - len(novos)
+        if len(pedidos) > len(novos):
+            print(f"   🔗 [EM VOO] {len(pedidos) - len(novos)} pedido(s) anexado(s) a job já em andamento.")
+        return True
+
+    def concluir(self, url):
+        """Tira a URL de andamento e devolve todos os pedidos que esperavam por ela"""
+        with self._lock:
+            return self._em_voo.pop(canonicalizar_url(url), [])
+
+    def estatisticas(self):
+        with self._lock:
+            return {
+                "urls_em_andamento": len(self._em_voo),
+                "pedidos_anexados": sum(len(p) - 1 for p in self._em_voo.values()),
+                "coalescidos": self._coalescidos
+            }
+
+
+_em_voo = PedidosEmVoo()
+
+
+def obter_pedidos_em_voo():
+    return _em_voo
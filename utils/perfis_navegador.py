@@ -0,0 +1,168 @@
+# utils/perfis_navegador.py
+"""
+Perfis persistentes por site: pasta de user-data-dir do Chrome + cópia dos cookies e do
+localStorage (consentimento, tokens de desafio anti-bot). Depois que um desafio é
+resolvido uma vez, os próximos jobs já chegam com o 'passe' e não precisam esperar.
+Quando a página de desafio aparece de novo, o estado salvo é descartado.
+"""
+import os
+import re
+import json
+import time
+import shutil
+import threading
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_PERFIS = os.path.join(BASE_DIR, 'perfis')
+
+# Textos que indicam que o site entregou uma página de verificação em vez do produto
+MARCADORES_DESAFIO = [
+    "just a moment", "checking your browser", "cf-challenge",
+    "px-captcha", "captcha-delivery", "_incapsula_resource", "access denied",
+    "robot check", "are you a robot", "verifique se você é humano", "verificando se você é humano",
+    "pardon our interruption"
+]
+
+
+
+def parece_desafio(texto):
+    """True se o texto (HTML ou innerText) tem cara de página de verificação anti-bot"""
+    texto = (texto or "").lower()
+    return any(m in texto for m in MARCADORES_DESAFIO)
+
+
+SCRIPT_LER_STORAGE = """
+var dados = {};
+try {
+    for (var i = 0; i < localStorage.length; i++) {
+        var k = localStorage.key(i);
+        dados[k] = localStorage.getItem(k);
+    }
+} catch (e) {}
+return {origem: location.origin, itens: dados};
+"""
+
+
+class PerfisNavegador:
+    def __init__(self, pasta=PASTA_PERFIS):
+        self.pasta = pasta
+        self._lock = threading.Lock()
+
+    def _pasta_site(self, site_nome):
+        nome = re.sub(r'[^\w-]', '_', str(site_nome).lower())
+        return os.path.join(self.pasta, nome)
+
+    def pasta_user_data(self, site_nome):
+        caminho = os.path.join(self._pasta_site(site_nome), 'chrome')
+        os.makedirs(caminho, exist_ok=True)
+        return caminho
+
+    def _arquivo_estado(self, site_nome):
+        return os.path.join(self._pasta_site(site_nome), 'estado.json')
+
+    # ------------------------------------------------------------------
+
+    def restaurar(self, driver, site_nome):
+        """Devolve ao navegador os cookies e o localStorage salvos. Retorna True se havia estado."""
+        arquivo = self._arquivo_estado(site_nome)
+        if not os.path.exists(arquivo):
+            return False
+        try:
+            with open(arquivo, encoding='utf-8') as f:
+                estado = json.load(f)
+        except:
+            return False
+
+        try:
+            if estado.get('cookies'):
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setCookies", {"cookies": self._cookies_para_cdp(estado['cookies'])})
+
+            storage = estado.get('storage') or {}
+            if storage.get('itens'):
+                # Roda antes dos scripts da página, só na origem salva, sem sobrescrever o que já existir
+                script = (
+                    "(function(){ if (location.origin !== %s) return; var itens = %s;"
+                    " try { for (var k in itens) { if (localStorage.getItem(k) === null) localStorage.setItem(k, itens[k]); } } catch(e) {} })();"
+                ) % (json.dumps(storage.get('origem')), json.dumps(storage['itens']))
+                resposta = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+                driver.script_perfil = resposta.get('identifier')
+        except Exception as e:
+            print(f"   ⚠️ [PERFIL] Falha ao restaurar estado de {site_nome}: {e}")
+            return False
+
+        print(f"   🍪 [PERFIL] Estado de {site_nome} restaurado (salvo há {int((time.time() - estado.get('salvo_em', time.time())) / 60)} min).")
+        return True
+
+    def salvar(self, driver, site_nome):
+        """Guarda cookies e localStorage da página atual para os próximos jobs do site"""
+        try:
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get('cookies', [])
+            storage = driver.execute_script(SCRIPT_LER_STORAGE)
+        except Exception as e:
+            print(f"   ⚠️ [PERFIL] Não foi possível ler o estado de {site_nome}: {e}")
+            return False
+
+        if not cookies:
+            return False
+
+        estado = {'salvo_em': time.time(), 'cookies': cookies, 'storage': storage}
+        arquivo = self._arquivo_estado(site_nome)
+        with self._lock:
+            os.makedirs(os.path.dirname(arquivo), exist_ok=True)
+            temporario = arquivo + ".tmp"
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(estado, f)
+            os.replace(temporario, arquivo)
+        return True
+
+    def descartar_script(self, driver):
+        identificador = getattr(driver, 'script_perfil', None)
+        if identificador:
+            try: driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identificador})
+            except: pass
+            driver.script_perfil = None
+
+    def invalidar(self, site_nome, apagar_user_data=False):
+        """Chamado quando o desafio volta a aparecer: o 'passe' salvo não vale mais"""
+        with self._lock:
+            arquivo = self._arquivo_estado(site_nome)
+            if os.path.exists(arquivo):
+                try: os.remove(arquivo)
+                except: pass
+        if apagar_user_data:
+            shutil.rmtree(os.path.join(self._pasta_site(site_nome), 'chrome'), ignore_errors=True)
+        print(f"   🧹 [PERFIL] Estado salvo de {site_nome} invalidado (desafio detectado).")
+
+    # ------------------------------------------------------------------
+
+    def desafio_na_pagina(self, driver):
+        """Detecta páginas de verificação anti-bot (Cloudflare, PerimeterX, Akamai, Captcha)"""
+        try:
+            amostra = driver.execute_script(
+                "return (document.title || '') + ' ' + (document.body ? document.body.innerText.slice(0, 2000) : '') + ' ' + document.documentElement.outerHTML.slice(0, 5000);"
+            )
+        except:
+            return False
+        return parece_desafio(amostra)
+
+    def _cookies_para_cdp(self, cookies):
+        """Network.getAllCookies devolve campos que o Network.setCookies não aceita"""
+        aceitos = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires', 'priority')
+        convertidos = []
+        agora = time.time()
+        for c in cookies:
+            if c.get('expires', -1) not in (-1, None) and c['expires'] < agora:
+                continue
+            novo = {k: v for k, v in c.items() if k in aceitos}
+            if novo.get('expires') == -1:
+                novo.pop('expires')
+            convertidos.append(novo)
+        return convertidos
+
+
+_perfis = PerfisNavegador()
+
+
+def obter_perfis():
+    return _perfis
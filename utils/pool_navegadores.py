@@ -0,0 +1,534 @@
+# utils/pool_navegadores.py
+import threading
+import time
+import undetected_chromedriver as uc
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from utils.bloqueio_recursos import remover_bloqueio
+from utils.runtime_navegador import obter_runtime
+
+# Argumentos que podem ser aplicados num navegador já aberto (não entram na assinatura do pool)
+PREFIXOS_AJUSTAVEIS = ("--user-agent=", "user-agent=", "--window-size=")
+
+
+# Sem estas flags o Chrome congela abas em segundo plano (lazy load e timers param de rodar)
+FLAGS_MODO_ABAS = (
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+)
+
+
+def opcoes_padrao():
+    """Opções usadas pela maioria dos scrapers (são as que o pool pré-aquece)"""
+    options = uc.ChromeOptions()
+    options.page_load_strategy = 'eager'
+    options.add_argument("--no-first-run")
+    options.add_argument("--password-store=basic")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    return options
+
+
+class AbaNavegador(webdriver.Chrome):
+    """
+    Sessão do chromedriver presa a uma única aba de um Chrome compartilhado.
+    Para o scraper funciona como um driver comum, mas a janela pertence ao
+    navegador hospedeiro: minimizar/maximizar/redimensionar não tem efeito.
+
+    Com `isolar`, a aba nasce num contexto de navegador próprio (Target.createBrowserContext,
+    como uma janela anônima): cookies, localStorage e cache não vazam entre jobs
+    simultâneos no mesmo site. O contexto é descartado na devolução.
+    """
+
+    def __init__(self, endereco_depuracao, executavel_driver, page_load_strategy=None, isolar=True):
+        opts = Options()
+        opts.debugger_address = endereco_depuracao
+        if page_load_strategy:
+            opts.page_load_strategy = page_load_strategy
+        super().__init__(service=Service(executable_path=executavel_driver), options=opts)
+
+        # Cada job trabalha numa aba nova; as abas dos outros jobs não são tocadas
+        self.contexto = None
+        if isolar:
+            try:
+                self.contexto = self.execute_cdp_cmd("Target.createBrowserContext", {})['browserContextId']
+                alvo = self.execute_cdp_cmd("Target.createTarget", {
+                    "url": "about:blank", "browserContextId": self.contexto
+                })['targetId']
+                # O handle de janela do chromedriver é o targetId do CDP
+                self.switch_to.window(alvo)
+            except Exception as e:
+                print(f"   ⚠️ [POOL] Aba sem contexto isolado ({e}). Cookies compartilhados com as outras abas.")
+                self._descartar_contexto()
+        if self.contexto is None:
+            self.switch_to.new_window('tab')
+        self.handle_aba = self.current_window_handle
+
+    def minimize_window(self): pass
+    def maximize_window(self): pass
+    def set_window_size(self, width, height, windowHandle="current"): pass
+
+    def fechar_aba(self):
+        """Fecha só a aba deste job e encerra a sessão (o Chrome hospedeiro continua vivo)"""
+        # Bloqueio e User-Agent valem para a aba: zera antes de soltá-la
+        remover_bloqueio(self)
+        try: self.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": ""})
+        except: pass
+
+        if self.contexto:
+            # Descartar o contexto fecha a aba junto com cookies e storage do job
+            self._descartar_contexto()
+        else:
+            try:
+                for handle in self.window_handles:
+                    if handle == self.handle_aba:
+                        self.switch_to.window(handle)
+                        self.close()
+            except: pass
+        try: super().quit()
+        except: pass
+
+    def _descartar_contexto(self):
+        if not self.contexto: return
+        try: self.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": self.contexto})
+        except: pass
+        self.contexto = None
+
+
+class PoolNavegadores:
+    """
+    Mantém navegadores Chrome já abertos para serem emprestados aos scrapers.
+    Cada navegador fica associado a uma 'assinatura' (tipo de driver + opções de
+    inicialização), pois opções de linha de comando não mudam depois que o Chrome sobe.
+    User-Agent e tamanho de janela são reaplicados a cada empréstimo.
+
+    No modo 'abas', um mesmo Chrome atende vários jobs ao mesmo tempo: cada job
+    recebe uma AbaNavegador (sessão própria do chromedriver presa a uma aba), cada
+    uma no seu contexto isolado. Hospedeiros com perfil persistente são a exceção:
+    as abas usam o contexto padrão para enxergar os cookies aquecidos do perfil.
+    """
+
+    def __init__(self, tamanho_maximo=4, ociosos_por_assinatura=2, tempo_ocioso_maximo=600, espera_maxima=300,
+                 modo='navegador', abas_por_navegador=4, runtime=None, supervisor=None):
+        self.runtime = runtime or obter_runtime()
+        self.supervisor = supervisor
+        if supervisor:
+            supervisor.ao_encontrar_orfao(self.recolher_orfao)
+        self.tamanho_maximo = tamanho_maximo
+        self.ociosos_por_assinatura = ociosos_por_assinatura
+        self.tempo_ocioso_maximo = tempo_ocioso_maximo
+        self.espera_maxima = espera_maxima
+        self.modo = modo
+        self.abas_por_navegador = abas_por_navegador
+
+        # Modo abas: assinatura -> [hospedeiro, ...] e id(aba) -> hospedeiro
+        self._hospedeiros = {}
+        self._abas = {}
+
+        self._condicao = threading.Condition()
+        self._ociosos = {}      # assinatura -> [(driver, ocioso_desde), ...]
+        self._em_uso = {}       # id(driver) -> assinatura
+        self._total = 0         # navegadores vivos (em uso + ociosos + sendo criados)
+        self._perfis = {}       # pasta de user-data-dir -> id(driver) que a ocupa (None = subindo)
+
+    # ------------------------------------------------------------------
+    # API PÚBLICA
+    # ------------------------------------------------------------------
+
+    def emprestar(self, options=None, undetected=True, dono=None):
+        """
+        Entrega um navegador pronto (reaproveitado se houver um compatível ocioso).
+        `dono`: DonoJob do scraper, para o supervisor recolher o driver se o job acabar sem devolver.
+        """
+        if options is None:
+            options = opcoes_padrao()
+        if self.modo == 'abas' and undetected:
+            return self._emprestar_aba(options, dono)
+
+        assinatura = self._assinatura(options, undetected)
+        limite = time.time() + self.espera_maxima
+
+        while True:
+            driver = self._retirar_ocioso(assinatura)
+            if driver is not None:
+                if self._saudavel(driver):
+                    self._preparar(driver, options)
+                    with self._condicao:
+                        self._em_uso[id(driver)] = assinatura
+                    if self.supervisor: self.supervisor.marcar_emprestimo(driver, dono)
+                    return driver
+                self._descartar(driver)
+                continue
+
+            with self._condicao:
+                if self._perfil_ocupado(options):
+                    # Outro Chrome vivo já usa a pasta deste perfil: segue com perfil temporário
+                    assinatura = self._assinatura(options, undetected)
+                    continue
+                if self._total < self.tamanho_maximo or self._liberar_vaga_ociosa():
+                    self._total += 1
+                    self._reservar_perfil(options)
+                    break
+                restante = limite - time.time()
+                if restante <= 0:
+                    raise Exception("Pool de navegadores esgotado (tempo de espera excedido)")
+                self._condicao.wait(timeout=min(restante, 5))
+
+        try:
+            driver = self._criar(options, undetected)
+        except Exception:
+            with self._condicao:
+                self._total -= 1
+                self._liberar_perfil(options=options)
+                self._condicao.notify()
+            raise
+
+        self._preparar(driver, options)
+        with self._condicao:
+            self._em_uso[id(driver)] = assinatura
+            self._associar_perfil(options, driver)
+        if self.supervisor: self.supervisor.marcar_emprestimo(driver, dono)
+        return driver
+
+    def devolver(self, driver):
+        """Recebe o navegador de volta; limpa o estado e guarda para o próximo job"""
+        if isinstance(driver, AbaNavegador):
+            self._devolver_aba(driver)
+            return
+
+        with self._condicao:
+            assinatura = self._em_uso.pop(id(driver), None)
+
+        if assinatura is None:
+            # Não pertence ao pool
+            try: driver.quit()
+            except: pass
+            return
+
+        if self.supervisor:
+            self.supervisor.marcar_devolucao(driver)
+            if self.supervisor.deve_reciclar(driver):
+                self._descartar(driver)
+                return
+
+        if not self._saudavel(driver) or not self._limpar(driver):
+            self._descartar(driver)
+            return
+
+        with self._condicao:
+            fila = self._ociosos.setdefault(assinatura, [])
+            if len(fila) < self.ociosos_por_assinatura:
+                fila.append((driver, time.time()))
+                self._condicao.notify()
+                return
+        self._descartar(driver)
+
+    def aquecer(self, quantidade=1, fabrica_opcoes=opcoes_padrao):
+        """Sobe navegadores em segundo plano para que o primeiro job já os encontre abertos"""
+        def _tarefa():
+            for _ in range(quantidade):
+                try:
+                    driver = self.emprestar(fabrica_opcoes())
+                    self.devolver(driver)
+                except Exception as e:
+                    print(f"   ⚠️ [POOL] Falha ao pré-aquecer navegador: {e}")
+                    return
+            print(f"   🔥 [POOL] {quantidade} navegador(es) pré-aquecido(s).")
+
+        threading.Thread(target=_tarefa, name="AquecerPool", daemon=True).start()
+
+    def encerrar(self):
+        """Fecha todos os navegadores ociosos"""
+        with self._condicao:
+            filas = list(self._ociosos.values())
+            self._ociosos = {}
+            hospedeiros = [h for lista in self._hospedeiros.values() for h in lista]
+            self._hospedeiros = {}
+        for fila in filas:
+            for driver, _ in fila:
+                self._descartar(driver)
+        for hospedeiro in hospedeiros:
+            self._descartar(hospedeiro['driver'])
+
+    def estatisticas(self):
+        with self._condicao:
+            return {
+                "modo": self.modo,
+                "total": self._total,
+                "em_uso": len(self._em_uso) + len(self._abas),
+                "ociosos": sum(len(f) for f in self._ociosos.values()),
+                "abas_abertas": len(self._abas),
+                "maximo": self.tamanho_maximo
+            }
+
+    # ------------------------------------------------------------------
+    # MODO ABAS
+    # ------------------------------------------------------------------
+
+    def _emprestar_aba(self, options, dono=None):
+        for flag in FLAGS_MODO_ABAS:
+            if flag not in options.arguments:
+                options.add_argument(flag)
+        assinatura = self._assinatura(options, True)
+        limite = time.time() + self.espera_maxima
+
+        while True:
+            criar = False
+            with self._condicao:
+                self._expirar_hospedeiros()
+                candidatos = [h for h in self._hospedeiros.get(assinatura, [])
+                              if h['abas'] < self.abas_por_navegador and h['driver'] is not None]
+                if candidatos:
+                    hospedeiro = min(candidatos, key=lambda h: h['abas'])
+                    hospedeiro['abas'] += 1
+                elif self._perfil_ocupado(options):
+                    assinatura = self._assinatura(options, True)
+                    continue
+                elif self._total < self.tamanho_maximo or self._liberar_vaga_ociosa():
+                    self._total += 1
+                    self._reservar_perfil(options)
+                    hospedeiro = {'driver': None, 'abas': 1, 'ocioso_desde': None}
+                    self._hospedeiros.setdefault(assinatura, []).append(hospedeiro)
+                    criar = True
+                else:
+                    restante = limite - time.time()
+                    if restante <= 0:
+                        raise Exception("Pool de navegadores esgotado (tempo de espera excedido)")
+                    self._condicao.wait(timeout=min(restante, 5))
+                    continue
+
+            try:
+                if criar:
+                    hospedeiro['driver'] = self._criar(options, True)
+                    with self._condicao:
+                        self._associar_perfil(options, hospedeiro['driver'])
+                aba = AbaNavegador(
+                    hospedeiro['driver'].options.debugger_address,
+                    self.runtime.caminho_driver,
+                    getattr(options, 'page_load_strategy', None),
+                    isolar=self._pasta_perfil(options) is None
+                )
+            except Exception:
+                with self._condicao:
+                    hospedeiro['abas'] -= 1
+                    if criar and hospedeiro['driver'] is None:
+                        self._liberar_perfil(options=options)
+                    if criar or not self._saudavel(hospedeiro['driver']):
+                        self._remover_hospedeiro(hospedeiro)
+                    self._condicao.notify()
+                raise
+
+            self._preparar(aba, options)
+            with self._condicao:
+                hospedeiro['ocioso_desde'] = None
+                self._abas[id(aba)] = hospedeiro
+            if self.supervisor:
+                # As páginas da aba contam para o Chrome hospedeiro (é ele que é reciclado)
+                self.supervisor.registrar(aba, hospedeiro=hospedeiro['driver'])
+                self.supervisor.marcar_emprestimo(aba, dono)
+            return aba
+
+    def _devolver_aba(self, aba):
+        aba.fechar_aba()
+        if self.supervisor:
+            self.supervisor.encerrar_processos(aba)
+        with self._condicao:
+            hospedeiro = self._abas.pop(id(aba), None)
+            if hospedeiro is None: return
+            hospedeiro['abas'] -= 1
+            vazio = hospedeiro['abas'] <= 0
+            if vazio:
+                hospedeiro['ocioso_desde'] = time.time()
+            self._condicao.notify()
+
+        # Hospedeiro sem abas: momento seguro para reciclar. A medição de RSS (psutil)
+        # fica fora do lock para não travar os outros empréstimos.
+        if vazio and self.supervisor and self.supervisor.deve_reciclar(hospedeiro['driver']):
+            with self._condicao:
+                # Pode ter ganhado uma aba nova (ou sido removido) enquanto medíamos
+                if hospedeiro['abas'] <= 0 and any(hospedeiro in l for l in self._hospedeiros.values()):
+                    self._remover_hospedeiro(hospedeiro)
+                    self._condicao.notify()
+
+    def recolher_orfao(self, driver):
+        """Chamado pelo supervisor quando o job dono do driver morreu ou travou"""
+        if isinstance(driver, AbaNavegador):
+            self._devolver_aba(driver)
+            return
+        with self._condicao:
+            emprestado = self._em_uso.pop(id(driver), None) is not None
+        if emprestado:
+            self._descartar(driver)
+
+    def _remover_hospedeiro(self, hospedeiro):
+        """Chamado com o lock adquirido"""
+        for lista in self._hospedeiros.values():
+            if hospedeiro in lista:
+                lista.remove(hospedeiro)
+        self._total -= 1
+        if hospedeiro['driver'] is not None:
+            threading.Thread(target=self._fechar, args=(hospedeiro['driver'],), daemon=True).start()
+
+    def _expirar_hospedeiros(self):
+        """Chamado com o lock adquirido: fecha navegadores hospedeiros sem abas há muito tempo"""
+        agora = time.time()
+        for lista in list(self._hospedeiros.values()):
+            for hospedeiro in list(lista):
+                desde = hospedeiro['ocioso_desde']
+                if hospedeiro['abas'] <= 0 and desde and agora - desde > self.tempo_ocioso_maximo:
+                    self._remover_hospedeiro(hospedeiro)
+
+    # ------------------------------------------------------------------
+    # INTERNOS
+    # ------------------------------------------------------------------
+
+    def _assinatura(self, options, undetected):
+        argumentos = tuple(sorted(
+            a for a in getattr(options, 'arguments', [])
+            if not a.startswith(PREFIXOS_AJUSTAVEIS)
+        ))
+        estrategia = getattr(options, 'page_load_strategy', None)
+        return (bool(undetected), estrategia, argumentos)
+
+    def _retirar_ocioso(self, assinatura):
+        with self._condicao:
+            self._expirar_ociosos()
+            fila = self._ociosos.get(assinatura)
+            if fila:
+                driver, _ = fila.pop()
+                return driver
+        return None
+
+    def _expirar_ociosos(self):
+        """Chamado com o lock adquirido: fecha navegadores parados há muito tempo"""
+        agora = time.time()
+        for assinatura, fila in self._ociosos.items():
+            vencidos = [d for d, desde in fila if agora - desde > self.tempo_ocioso_maximo]
+            if vencidos:
+                self._ociosos[assinatura] = [(d, t) for d, t in fila if d not in vencidos]
+                for driver in vencidos:
+                    threading.Thread(target=self._descartar, args=(driver,), daemon=True).start()
+
+    def _liberar_vaga_ociosa(self):
+        """Chamado com o lock adquirido: fecha um ocioso de outra assinatura para abrir vaga"""
+        for fila in self._ociosos.values():
+            if fila:
+                driver, _ = fila.pop(0)
+                self._total -= 1
+                threading.Thread(target=self._fechar, args=(driver,), daemon=True).start()
+                return True
+        for lista in self._hospedeiros.values():
+            for hospedeiro in lista:
+                if hospedeiro['abas'] <= 0 and hospedeiro['driver'] is not None:
+                    self._remover_hospedeiro(hospedeiro)
+                    return True
+        return False
+
+    def _criar(self, options, undetected):
+        print("   🚀 [POOL] Iniciando novo navegador...")
+        driver = self.runtime.criar_driver(options, undetected)
+        if self.supervisor:
+            self.supervisor.registrar(driver)
+        return driver
+
+    def _preparar(self, driver, options):
+        """Reaplica User-Agent e tamanho de janela pedidos pelo scraper"""
+        user_agent = None
+        largura, altura = 1920, 1080
+        for arg in getattr(options, 'arguments', []):
+            if arg.startswith(("--user-agent=", "user-agent=")):
+                user_agent = arg.split("=", 1)[1]
+            elif arg.startswith("--window-size="):
+                try:
+                    largura, altura = [int(x) for x in arg.split("=", 1)[1].split(",")]
+                except: pass
+
+        try:
+            if user_agent:
+                driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": user_agent})
+            driver.set_window_size(largura, altura)
+        except: pass
+
+    def _limpar(self, driver):
+        """
+        Deixa o navegador sem rastros do job anterior (abas extras, cookies, página).
+        Os cookies de um Chrome preso a perfil persistente ficam: são o perfil aquecido.
+        """
+        with self._condicao:
+            com_perfil = id(driver) in self._perfis.values()
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            if not com_perfil:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            remover_bloqueio(driver)
+            driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": ""})
+            driver.get("about:blank")
+            return True
+        except:
+            return False
+
+    def _saudavel(self, driver):
+        try:
+            return bool(driver.window_handles)
+        except:
+            return False
+
+    def _fechar(self, driver):
+        try: driver.quit()
+        except: pass
+        if self.supervisor:
+            # Se o quit() falhou ou deixou processos para trás, o supervisor encerra
+            self.supervisor.encerrar_processos(driver)
+        with self._condicao:
+            self._liberar_perfil(driver=driver)
+
+    # ------------------------------------------------------------------
+    # PERFIS PERSISTENTES (uma pasta de user-data-dir só pode ter um Chrome por vez)
+    # ------------------------------------------------------------------
+
+    def _pasta_perfil(self, options):
+        for arg in getattr(options, 'arguments', []):
+            if arg.startswith("--user-data-dir="):
+                return arg
+        return None
+
+    def _perfil_ocupado(self, options):
+        """Chamado com o lock adquirido. Se a pasta estiver em uso, remove-a das opções."""
+        arg = self._pasta_perfil(options)
+        if arg and arg in self._perfis:
+            options.arguments.remove(arg)
+            return True
+        return False
+
+    def _reservar_perfil(self, options):
+        arg = self._pasta_perfil(options)
+        if arg:
+            self._perfis[arg] = None
+
+    def _associar_perfil(self, options, driver):
+        arg = self._pasta_perfil(options)
+        if arg:
+            self._perfis[arg] = id(driver)
+
+    def _liberar_perfil(self, options=None, driver=None):
+        """Chamado com o lock adquirido"""
+        if options is not None:
+            self._perfis.pop(self._pasta_perfil(options), None)
+        if driver is not None:
+            for arg, dono in list(self._perfis.items()):
+                if dono == id(driver):
+                    del self._perfis[arg]
+
+    def _descartar(self, driver):
+        self._fechar(driver)
+        with self._condicao:
+            self._total -= 1
+            self._condicao.notify()
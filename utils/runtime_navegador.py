@@ -0,0 +1,146 @@
+# utils/runtime_navegador.py
+"""
+Runtime único do navegador: descobre o Chrome instalado, prepara UMA vez o chromedriver
+patcheado (undetected_chromedriver) e guarda o binário em cache na pasta 'drivers'.
+Todos os scrapers recebem o mesmo executável pronto, então abrir um driver custa só
+o tempo de subir o processo, e o serviço sobe sem internet quando o cache já existe.
+"""
+import os
+import re
+import sys
+import shutil
+import hashlib
+import threading
+import subprocess
+import undetected_chromedriver as uc
+from undetected_chromedriver.patcher import Patcher
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_DRIVERS = os.path.join(BASE_DIR, 'drivers')
+EH_WINDOWS = sys.platform.startswith('win')
+
+
+class RuntimeNavegador:
+    def __init__(self, pasta_cache=PASTA_DRIVERS, versao_forcada=None):
+        self.pasta_cache = pasta_cache
+        self.versao_forcada = versao_forcada
+        self.caminho_chrome = None
+        self.versao_principal = None
+        self.caminho_driver = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # PREPARAÇÃO (roda uma vez)
+    # ------------------------------------------------------------------
+
+    def preparar(self):
+        """Resolve Chrome + chromedriver. Chamadas seguintes não fazem nada."""
+        with self._lock:
+            if self.caminho_driver:
+                return self
+
+            self.caminho_chrome = uc.find_chrome_executable()
+            if not self.caminho_chrome:
+                raise Exception("Google Chrome não encontrado nesta máquina")
+
+            self.versao_principal = self.versao_forcada or self._detectar_versao(self.caminho_chrome)
+            if not self.versao_principal:
+                raise Exception(f"Não foi possível descobrir a versão do Chrome em {self.caminho_chrome}")
+
+            os.makedirs(self.pasta_cache, exist_ok=True)
+            destino = os.path.join(self.pasta_cache, f"chromedriver_{self.versao_principal}" + (".exe" if EH_WINDOWS else ""))
+
+            if self._verificar(destino):
+                print(f"   🧰 [RUNTIME] Chrome {self.versao_principal} + chromedriver em cache ({destino})")
+            else:
+                print(f"   🧰 [RUNTIME] Preparando chromedriver {self.versao_principal} (primeira vez)...")
+                self._baixar_e_patchear(destino)
+                if not self._verificar(destino):
+                    raise Exception(f"chromedriver preparado em {destino} não passou na verificação")
+                print(f"   ✅ [RUNTIME] chromedriver {self.versao_principal} pronto e em cache.")
+
+            self.caminho_driver = destino
+            return self
+
+    def _detectar_versao(self, caminho_chrome):
+        """Descobre a versão principal do Chrome sem abrir o navegador nem usar a rede"""
+        if EH_WINDOWS:
+            # O instalador do Windows cria uma pasta com o número da versão ao lado do chrome.exe
+            pasta = os.path.dirname(caminho_chrome)
+            versoes = [d for d in os.listdir(pasta) if re.match(r'^\d+\.\d+\.\d+\.\d+$', d)]
+            if versoes:
+                versoes.sort(key=lambda v: [int(x) for x in v.split('.')])
+                return int(versoes[-1].split('.')[0])
+            return None
+
+        try:
+            saida = subprocess.run([caminho_chrome, '--version'], capture_output=True, text=True, timeout=15).stdout
+            achado = re.search(r'(\d+)\.\d+\.\d+', saida)
+            return int(achado.group(1)) if achado else None
+        except: return None
+
+    def _baixar_e_patchear(self, destino):
+        patcher = Patcher(version_main=self.versao_principal)
+        patcher.auto()
+        shutil.copy2(patcher.executable_path, destino)
+        if not EH_WINDOWS:
+            os.chmod(destino, 0o755)
+        with open(destino + ".sha256", "w") as f:
+            f.write(self._hash(destino))
+
+    def _verificar(self, caminho):
+        """Confere integridade (hash), patch do undetected e se a versão bate com o Chrome"""
+        if not os.path.exists(caminho) or not os.path.exists(caminho + ".sha256"):
+            return False
+        try:
+            with open(caminho + ".sha256") as f:
+                if f.read().strip() != self._hash(caminho):
+                    return False
+            if not Patcher(executable_path=caminho).is_binary_patched(caminho):
+                return False
+            saida = subprocess.run([caminho, '--version'], capture_output=True, text=True, timeout=15).stdout
+            achado = re.search(r'(\d+)\.\d+\.\d+', saida)
+            return bool(achado) and int(achado.group(1)) == self.versao_principal
+        except:
+            return False
+
+    def _hash(self, caminho):
+        h = hashlib.sha256()
+        with open(caminho, 'rb') as f:
+            for bloco in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(bloco)
+        return h.hexdigest()
+
+    # ------------------------------------------------------------------
+    # CRIAÇÃO DE DRIVERS
+    # ------------------------------------------------------------------
+
+    def criar_driver(self, options=None, undetected=True):
+        """Sobe um Chrome usando o chromedriver já preparado (sem patch nem download)"""
+        self.preparar()
+        if undetected:
+            return uc.Chrome(
+                options=options,
+                driver_executable_path=self.caminho_driver,
+                browser_executable_path=self.caminho_chrome,
+                version_main=self.versao_principal
+            )
+
+        if options is not None:
+            options.binary_location = self.caminho_chrome
+        return webdriver.Chrome(service=Service(executable_path=self.caminho_driver), options=options)
+
+
+_runtime = None
+_lock_runtime = threading.Lock()
+
+
+def obter_runtime():
+    """Runtime compartilhado pelo processo inteiro"""
+    global _runtime
+    with _lock_runtime:
+        if _runtime is None:
+            _runtime = RuntimeNavegador()
+    return _runtime
@@ -0,0 +1,255 @@
+# utils/scripts_navegador.py
+"""Scripts JavaScript injetados pelos scrapers (mantidos aqui para não poluir o BaseScraper)"""
+
+# Espera a página ficar pronta e devolve o controle assim que as condições são atendidas:
+#   - seletor alvo presente (se informado)
+#   - nenhuma mutação de DOM nem resposta de rede nos últimos `quietude` ms
+#   - imagens visíveis na tela já resolvidas (carregadas ou com erro)
+# Se `profundidade` > 0, rola uma tela por vez até essa altura (dispara o lazy load).
+# Argumentos: seletor, profundidade, quietude (ms), limite (ms), callback
+AGUARDAR_PAGINA = """
+var seletor = arguments[0], profundidade = arguments[1], quietude = arguments[2], limite = arguments[3];
+var callback = arguments[arguments.length - 1];
+var inicio = Date.now(), ultimaMutacao = Date.now(), ultimaRede = Date.now(), ultimaRolagem = 0;
+var pausaRolagem = Math.min(quietude, 250), posicaoAnterior = -1;
+
+var obsDom = new MutationObserver(function() { ultimaMutacao = Date.now(); });
+obsDom.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+
+var obsRede = null;
+try {
+    obsRede = new PerformanceObserver(function() { ultimaRede = Date.now(); });
+    obsRede.observe({type: 'resource'});
+} catch (e) {}
+
+function imagensPendentes() {
+    var pendentes = 0, altura = window.innerHeight;
+    var imgs = document.images;
+    for (var i = 0; i < imgs.length; i++) {
+        var r = imgs[i].getBoundingClientRect();
+        if (r.bottom < 0 || r.top > altura || r.width === 0) continue;
+        if (!imgs[i].complete) pendentes++;
+    }
+    return pendentes;
+}
+
+function finalizar(pronto) {
+    obsDom.disconnect();
+    if (obsRede) obsRede.disconnect();
+    callback({pronto: pronto, ms: Date.now() - inicio, rolagem: window.scrollY});
+}
+
+function checar() {
+    var agora = Date.now();
+    if (agora - inicio > limite) return finalizar(false);
+    if (seletor && !document.querySelector(seletor)) return setTimeout(checar, 100);
+
+    var quieto = (agora - ultimaMutacao >= quietude) && (agora - ultimaRede >= quietude) && imagensPendentes() === 0;
+    var alvo = Math.min(profundidade, document.documentElement.scrollHeight - window.innerHeight);
+
+    if (window.scrollY < alvo) {
+        // Rola mais uma tela assim que a anterior estabilizar (ou após uma pausa curta)
+        if (agora - ultimaRolagem >= pausaRolagem && (quieto || agora - ultimaRolagem >= quietude * 2)) {
+            if (window.scrollY === posicaoAnterior) { profundidade = 0; return setTimeout(checar, 100); } // rolagem travada
+            posicaoAnterior = window.scrollY;
+            window.scrollBy(0, Math.min(window.innerHeight, alvo - window.scrollY));
+            ultimaRolagem = agora;
+        }
+        return setTimeout(checar, 100);
+    }
+    if (!quieto) return setTimeout(checar, 100);
+    finalizar(true);
+}
+
+checar();
+"""
+
+# Extrai o produto inteiro numa única chamada (sem page_source + BeautifulSoup).
+# Recebe um spec declarativo por site (atributo EXTRACAO dos scrapers):
+#   'titulo':    lista de seletores; vale o primeiro elemento com texto
+#   'descricao': lista de regras; cada regra é um seletor (innerText do primeiro elemento com
+#                pelo menos `minimo` caracteres, padrão 15) ou um dict de lista de itens:
+#                {'itens', 'titulo', 'texto', 'ignorar', 'cabecalho', 'marcador', 'separador', 'limite_marcador'}
+#   'specs':     lista de regras, uma das formas:
+#                {'linhas', 'chave', 'valor'}      chave/valor dentro de cada linha
+#                {'chaves', 'valores'}             duas listas emparelhadas pela posição
+#                {'chaves', 'container', 'valor'}  valor no mesmo container (closest) da chave
+#                {'itens', 'separador'}            texto "Chave: Valor"
+#                opcional em qualquer regra: 'chave_max' (descarta chaves mais longas)
+#   'imagens':   lista de seletores (<img>, <meta content>, <a>/<link href>), em ordem de preferência
+# Nas regras de descrição e specs, uma regra só roda se as anteriores não acharam nada,
+# a não ser que tenha 'somar': True.
+# Argumentos: spec. Retorna {titulo, descricao, specs, imagens}
+EXTRAIR_PRODUTO = """
+var spec = arguments[0] || {};
+
+function lista(v) { return !v ? [] : (Array.isArray(v) ? v : [v]); }
+function texto(el) { return el ? (el.innerText || el.textContent || '').trim() : ''; }
+function todos(sel, raiz) {
+    if (!sel) return [];
+    try { return Array.prototype.slice.call((raiz || document).querySelectorAll(sel)); } catch (e) { return []; }
+}
+function primeiro(sel, raiz) {
+    if (!sel) return null;
+    try { return (raiz || document).querySelector(sel); } catch (e) { return null; }
+}
+
+function extrairTitulo(seletores) {
+    var sels = lista(seletores);
+    for (var i = 0; i < sels.length; i++) {
+        var els = todos(sels[i]);
+        for (var j = 0; j < els.length; j++) {
+            var t = texto(els[j]);
+            if (t) return t;
+        }
+    }
+    return '';
+}
+
+function textoRegra(regra, acumulado) {
+    if (typeof regra === 'string') regra = {seletor: regra};
+    var minimo = regra.minimo === undefined ? 15 : regra.minimo;
+
+    if (regra.seletor) {
+        var els = todos(regra.seletor);
+        for (var i = 0; i < els.length; i++) {
+            var t = texto(els[i]);
+            if (t.length >= minimo) return t;
+        }
+        return '';
+    }
+
+    if (regra.itens) {
+        var marcador = regra.marcador === undefined ? '• ' : regra.marcador;
+        var separador = regra.separador === undefined ? ': ' : regra.separador;
+        var linhas = [];
+        todos(regra.itens).forEach(function(el) {
+            if (regra.ignorar && el.matches(regra.ignorar)) return;
+            var tit = regra.titulo ? texto(primeiro(regra.titulo, el)).replace(/\\n/g, ' ') : '';
+            var txt = regra.texto ? texto(primeiro(regra.texto, el)).replace(/\\n/g, ' ') : texto(el);
+            if (!txt || txt.length < (regra.minimo_item || 1)) return;
+            if (acumulado.indexOf(txt) >= 0) return;
+            var linha = tit ? tit + separador + txt : txt;
+            if (linhas.indexOf(marcador + linha) >= 0 || linhas.indexOf(linha + '\\n') >= 0) return;
+            linhas.push(regra.limite_marcador && linha.length >= regra.limite_marcador ? linha + '\\n' : marcador + linha);
+        });
+        if (!linhas.length) return '';
+        return (regra.cabecalho ? regra.cabecalho + '\\n' : '') + linhas.join('\\n');
+    }
+    return '';
+}
+
+function extrairDescricao(regras) {
+    var partes = [];
+    lista(regras).forEach(function(regra) {
+        if (partes.length && !regra.somar) return;
+        var t = textoRegra(regra, partes.join('\\n'));
+        if (t) partes.push(t);
+    });
+    return partes.join('\\n\\n');
+}
+
+function extrairSpecs(regras) {
+    var specs = {}, total = 0;
+    function adicionar(chave, valor, regra) {
+        chave = (chave || '').trim(); valor = (valor || '').trim();
+        if (!chave || !valor || chave === valor) return;
+        if (regra.chave_max && chave.length > regra.chave_max) return;
+        if (!(chave in specs)) total++;
+        specs[chave] = valor;
+    }
+
+    lista(regras).forEach(function(regra) {
+        if (total && !regra.somar) return;
+        if (regra.linhas) {
+            todos(regra.linhas).forEach(function(linha) {
+                adicionar(texto(primeiro(regra.chave, linha)), texto(primeiro(regra.valor, linha)), regra);
+            });
+        } else if (regra.chaves && regra.container) {
+            todos(regra.chaves).forEach(function(el) {
+                var caixa = el.closest(regra.container);
+                if (caixa) adicionar(texto(el), texto(primeiro(regra.valor, caixa)), regra);
+            });
+        } else if (regra.chaves) {
+            var chaves = todos(regra.chaves), valores = todos(regra.valores);
+            for (var i = 0; i < chaves.length && i < valores.length; i++) {
+                adicionar(texto(chaves[i]), texto(valores[i]), regra);
+            }
+        } else if (regra.itens) {
+            var sep = regra.separador || ':';
+            todos(regra.itens).forEach(function(el) {
+                var t = texto(el), pos = t.indexOf(sep);
+                if (pos > 0) adicionar(t.slice(0, pos), t.slice(pos + sep.length), regra);
+            });
+        }
+    });
+    return specs;
+}
+
+function urlImagem(el) {
+    var tag = el.tagName.toLowerCase();
+    if (tag === 'meta') return el.getAttribute('content');
+    if (tag === 'a' || tag === 'link') return el.href;
+    return el.src || el.getAttribute('data-src') || el.currentSrc;
+}
+
+function extrairImagens(seletores) {
+    var urls = [];
+    lista(seletores).forEach(function(sel) {
+        todos(sel).forEach(function(el) {
+            var url = urlImagem(el);
+            if (url && url.indexOf('data:') !== 0 && urls.indexOf(url) < 0) urls.push(url);
+        });
+    });
+    return urls;
+}
+
+return {
+    titulo: extrairTitulo(spec.titulo),
+    descricao: extrairDescricao(spec.descricao),
+    specs: extrairSpecs(spec.specs),
+    imagens: extrairImagens(spec.imagens)
+};
+"""
+
+# Só os trechos que utils/dados_estruturados.py lê (JSON-LD, escopo microdata do Product,
+# metas OpenGraph/Twitter), para não trazer o page_source inteiro do navegador.
+# Sem argumentos. Retorna um HTML pequeno (string)
+COLETAR_ESTRUTURADOS = """
+var sel = 'script[type="application/ld+json"], [itemtype*="schema.org/Product"], ' +
+          'meta[property^="og:"], meta[name^="twitter:"]';
+var partes = [];
+document.querySelectorAll(sel).forEach(function(el) {
+    if (el.parentElement && el.parentElement.closest('[itemtype*="schema.org/Product"]')) return;
+    partes.push(el.outerHTML);
+});
+return partes.join('\\n');
+"""
+
+# Prepara um elemento para captura via CDP sem rolar a página: se for uma <img> ainda
+# não carregada (lazy), força o carregamento e espera o decode (até `limite` ms).
+# Devolve o retângulo em coordenadas do documento (para o clip do Page.captureScreenshot).
+# Argumentos: elemento, limite (ms), callback
+PREPARAR_CAPTURA = """
+var el = arguments[0], limite = arguments[1];
+var callback = arguments[arguments.length - 1];
+
+function responder() {
+    var r = el.getBoundingClientRect();
+    callback({
+        x: r.left + window.scrollX, y: r.top + window.scrollY,
+        largura: r.width, altura: r.height,
+        escala: window.devicePixelRatio || 1
+    });
+}
+
+var img = el.tagName.toLowerCase() === 'img' ? el : el.querySelector('img');
+if (!img || (img.complete && img.naturalWidth > 0)) return responder();
+
+if (img.loading === 'lazy') img.loading = 'eager';
+var respondido = false;
+function uma() { if (!respondido) { respondido = true; responder(); } }
+setTimeout(uma, limite);
+img.addEventListener('load', function() { (img.decode ? img.decode() : Promise.resolve()).then(uma, uma); });
+img.addEventListener('error', uma);
+"""
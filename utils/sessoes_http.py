@@ -0,0 +1,114 @@
+# utils/sessoes_http.py
+"""
+Sessões HTTP compartilhadas pelo processo inteiro, uma por host (e modo de TLS).
+Cada sessão mantém um pool de conexões keep-alive, então a página do produto e a
+imagem no mesmo CDN não pagam de novo o handshake TCP+TLS, e as respostas vêm
+comprimidas. Os GETs passam pelo cache em disco (utils/cache_http.py), que revalida
+com ETag/Last-Modified. O modo de TLS vem do 'tls' do site no SITES_CONFIG:
+  None              -> verificação normal
+  'sem_verificacao' -> certificado não verificado (sites com cadeia quebrada)
+  'legado'          -> sem verificação e com cifras antigas liberadas (SECLEVEL=0)
+"""
+import ssl
+import threading
+from urllib.parse import urlparse
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.poolmanager import PoolManager
+from urllib3.util.retry import Retry
+from utils.cache_http import obter_cache_http
+
+try:
+    import brotli  # noqa: F401  (o urllib3 só descomprime 'br' se existir)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+MODOS_TLS = (None, 'sem_verificacao', 'legado')
+
+
+# --- ADAPTADOR SSL (SECLEVEL=0) ---
+class UnsafeSSLAdapter(HTTPAdapter):
+    def init_poolmanager(self, connections, maxsize, block=False, **kwargs):
+        ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+        try:
+            ctx.set_ciphers('ALL:@SECLEVEL=0')
+        except:
+            ctx.set_ciphers('DEFAULT')
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+        self.poolmanager = PoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            ssl_context=ctx
+        )
+
+
+class RegistroSessoes:
+    def __init__(self, conexoes_por_host=10, tentativas=2, timeout_padrao=20):
+        self.conexoes_por_host = conexoes_por_host
+        self.tentativas = tentativas
+        self.timeout_padrao = timeout_padrao
+        self._lock = threading.Lock()
+        self._sessoes = {}   # (host, tls) -> requests.Session
+        self._avisos_desligados = False
+
+    def _criar(self, tls):
+        sessao = requests.Session()
+        sessao.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        retry = Retry(total=self.tentativas, backoff_factor=0.3,
+                      status_forcelist=(502, 503, 504), allowed_methods=frozenset(['GET', 'HEAD']),
+                      raise_on_status=False)   # esgotadas as tentativas, devolve a última resposta (503...)
+        classe = UnsafeSSLAdapter if tls == 'legado' else HTTPAdapter
+        adaptador = classe(pool_connections=1, pool_maxsize=self.conexoes_por_host, max_retries=retry)
+        sessao.mount('https://', adaptador)
+        sessao.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=self.conexoes_por_host, max_retries=retry))
+
+        if tls in ('sem_verificacao', 'legado'):
+            sessao.verify = False
+            if not self._avisos_desligados:
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                self._avisos_desligados = True
+        return sessao
+
+    def sessao(self, url, tls=None):
+        """Sessão do host da URL (criada na primeira vez)"""
+        if tls not in MODOS_TLS:
+            raise ValueError(f"Modo de TLS desconhecido: {tls}")
+        chave = (urlparse(url).netloc.lower(), tls)
+        with self._lock:
+            sessao = self._sessoes.get(chave)
+            if sessao is None:
+                sessao = self._criar(tls)
+                self._sessoes[chave] = sessao
+        return sessao
+
+    def get(self, url, tls=None, cache_ttl=None, **kwargs):
+        kwargs.setdefault('timeout', self.timeout_padrao)
+        cache = obter_cache_http()
+        headers = kwargs.get('headers')
+        guardada, entrada, condicionais = cache.preparar(url, cache_ttl, headers)
+        if guardada is not None:
+            return guardada
+        if condicionais:
+            kwargs['headers'] = dict(headers or {}, **condicionais)
+        resposta = self.sessao(url, tls).get(url, **kwargs)
+        return cache.concluir(url, resposta, entrada, cache_ttl, headers)
+
+    def estatisticas(self):
+        with self._lock:
+            return {'hosts': len(self._sessoes)}
+
+
+_registro = RegistroSessoes()
+
+
+def obter_sessoes():
+    return _registro
+
+
+def http_get(url, tls=None, cache_ttl=None, **kwargs):
+    """requests.get reaproveitando a conexão do host (e o cache em disco)"""
+    return _registro.get(url, tls=tls, cache_ttl=cache_ttl, **kwargs)
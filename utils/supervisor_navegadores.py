@@ -0,0 +1,275 @@
+# utils/supervisor_navegadores.py
+"""
+Supervisor dos processos de navegador criados pelo serviço.
+- Registra chromedriver + chrome de cada driver criado pelo runtime/pool.
+- Diz ao pool quando reciclar um driver (muitas páginas navegadas ou RSS alto).
+- Varre periodicamente: recolhe navegadores cujo job dono já terminou (ou travou),
+  processos que sobraram de um quit() que falhou e chromes 'filhos' nossos que
+  ninguém registrou.
+
+A posse é por job, não por thread: os workers do executor e as threads do motor
+assíncrono vivem para sempre, então cada scraper leva um DonoJob que é encerrado
+no liberar_navegadores.
+"""
+import os
+import time
+import threading
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+NOMES_PROCESSOS = ('chrome', 'chromedriver', 'undetected_chromedriver')
+
+
+class DonoJob:
+    """Marca de posse dos navegadores de um job; driver ainda emprestado a um dono encerrado é órfão"""
+
+    def __init__(self):
+        self.ativo = True
+
+    def encerrar(self):
+        self.ativo = False
+
+
+class SupervisorNavegadores:
+    def __init__(self, reciclar_apos_paginas=50, limite_rss_mb=1500, intervalo_varredura=60, tempo_maximo_emprestimo=900):
+        self.reciclar_apos_paginas = reciclar_apos_paginas
+        self.limite_rss_mb = limite_rss_mb
+        self.intervalo_varredura = intervalo_varredura
+        self.tempo_maximo_emprestimo = tempo_maximo_emprestimo
+
+        self._lock = threading.Lock()
+        self._registros = {}   # id(driver) -> {'driver', 'pids', 'paginas', 'dono', 'criado_em'}
+        self._ao_encontrar_orfao = None
+        self._thread = None
+        self._relatorio = {
+            'varreduras': 0,
+            'drivers_reciclados': 0,
+            'orfaos_recolhidos': 0,
+            'processos_mortos': 0,
+            'memoria_liberada_mb': 0.0,
+            'ultima_varredura': None
+        }
+
+    # ------------------------------------------------------------------
+    # REGISTRO
+    # ------------------------------------------------------------------
+
+    def registrar(self, driver, hospedeiro=None):
+        """
+        Chamado logo depois que um driver é criado. Cada driver.get passa a contar uma
+        página para o navegador que a renderiza (`hospedeiro`, no caso de uma aba).
+        """
+        pids = set()
+        try: pids.add(driver.service.process.pid)
+        except: pass
+        pid_navegador = getattr(driver, 'browser_pid', None)
+        if pid_navegador:
+            pids.add(pid_navegador)
+        pids.update(self._descendentes(pids))
+
+        with self._lock:
+            self._registros[id(driver)] = {
+                'driver': driver, 'pids': pids, 'paginas': 0,
+                'dono': None, 'emprestado_em': None, 'criado_em': time.time()
+            }
+        self._contar_navegacoes(driver, hospedeiro or driver)
+
+    def _contar_navegacoes(self, driver, alvo):
+        navegar = driver.get
+
+        def get(url, *args, **kwargs):
+            # about:blank é a limpeza do pool, não uma página
+            if not str(url).startswith("about:"):
+                self.contar_pagina(alvo)
+            return navegar(url, *args, **kwargs)
+
+        driver.get = get
+
+    def marcar_emprestimo(self, driver, dono=None):
+        """Driver saiu do pool para um job (`dono`: DonoJob do scraper; sem ele, só o limite de tempo vale)"""
+        with self._lock:
+            registro = self._registros.get(id(driver))
+            if registro:
+                registro['dono'] = dono
+                registro['emprestado_em'] = time.time()
+
+    def contar_pagina(self, driver):
+        with self._lock:
+            registro = self._registros.get(id(driver))
+            if registro:
+                registro['paginas'] += 1
+
+    def marcar_devolucao(self, driver):
+        with self._lock:
+            registro = self._registros.get(id(driver))
+            if registro:
+                registro['dono'] = None
+                registro['emprestado_em'] = None
+
+    def esquecer(self, driver):
+        with self._lock:
+            return self._registros.pop(id(driver), None)
+
+    def ao_encontrar_orfao(self, callback):
+        """O pool informa como recolher um driver cujo job morreu"""
+        self._ao_encontrar_orfao = callback
+
+    # ------------------------------------------------------------------
+    # RECICLAGEM
+    # ------------------------------------------------------------------
+
+    def deve_reciclar(self, driver):
+        """True se o driver já serviu páginas demais ou está usando memória demais"""
+        with self._lock:
+            registro = self._registros.get(id(driver))
+            if not registro:
+                return False
+            paginas = registro['paginas']
+            pids = set(registro['pids'])
+
+        motivo = None
+        if self.reciclar_apos_paginas and paginas >= self.reciclar_apos_paginas:
+            motivo = f"{paginas} páginas"
+        else:
+            rss = self._rss_mb(pids | self._descendentes(pids))
+            if self.limite_rss_mb and rss > self.limite_rss_mb:
+                motivo = f"{rss:.0f} MB de RSS"
+
+        if motivo:
+            print(f"   ♻️ [SUPERVISOR] Reciclando navegador ({motivo}).")
+            with self._lock:
+                self._relatorio['drivers_reciclados'] += 1
+            return True
+        return False
+
+    def encerrar_processos(self, driver):
+        """Depois do quit(): garante que nenhum processo do driver ficou para trás"""
+        registro = self.esquecer(driver)
+        if not registro:
+            return
+        mortos, memoria = self._matar(registro['pids'] | self._descendentes(registro['pids']))
+        if mortos:
+            with self._lock:
+                self._relatorio['processos_mortos'] += mortos
+                self._relatorio['memoria_liberada_mb'] += memoria
+
+    # ------------------------------------------------------------------
+    # VARREDURA DE ÓRFÃOS
+    # ------------------------------------------------------------------
+
+    def iniciar(self):
+        if self._thread: return
+        self._thread = threading.Thread(target=self._loop, name="SupervisorNavegadores", daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while True:
+            time.sleep(self.intervalo_varredura)
+            try:
+                self.varrer()
+            except Exception as e:
+                print(f"   ⚠️ [SUPERVISOR] Falha na varredura: {e}")
+
+    def varrer(self):
+        """Recolhe navegadores de jobs encerrados ou travados e mata processos de navegador sem dono"""
+        orfaos = []
+        agora = time.time()
+        with self._lock:
+            for registro in self._registros.values():
+                if registro['emprestado_em'] is None: continue
+                dono = registro['dono']
+                encerrado = dono is not None and not dono.ativo
+                travado = self.tempo_maximo_emprestimo and agora - registro['emprestado_em'] > self.tempo_maximo_emprestimo
+                if encerrado or travado:
+                    orfaos.append(registro['driver'])
+
+        for driver in orfaos:
+            if self._ao_encontrar_orfao:
+                self._ao_encontrar_orfao(driver)
+            else:
+                try: driver.quit()
+                except: pass
+            self.encerrar_processos(driver)
+
+        # Processos de Chrome/chromedriver filhos deste serviço que não pertencem a nenhum driver vivo
+        with self._lock:
+            conhecidos = set()
+            for registro in self._registros.values():
+                conhecidos |= registro['pids']
+        conhecidos |= self._descendentes(conhecidos)
+        soltos = [p for p in self._processos_de_navegador() if p not in conhecidos]
+        mortos, memoria = self._matar(set(soltos))
+
+        with self._lock:
+            self._relatorio['varreduras'] += 1
+            self._relatorio['orfaos_recolhidos'] += len(orfaos)
+            self._relatorio['processos_mortos'] += mortos
+            self._relatorio['memoria_liberada_mb'] += memoria
+            self._relatorio['ultima_varredura'] = time.strftime("%Y-%m-%d %H:%M:%S")
+
+        if orfaos or mortos:
+            print(f"   🧹 [SUPERVISOR] Recolhidos {len(orfaos)} navegador(es) órfão(s), "
+                  f"{mortos} processo(s) solto(s) encerrado(s), ~{memoria:.0f} MB liberados.")
+
+    def relatorio(self):
+        with self._lock:
+            dados = dict(self._relatorio)
+            dados['navegadores_registrados'] = len(self._registros)
+        dados['memoria_liberada_mb'] = round(dados['memoria_liberada_mb'], 1)
+        dados['psutil'] = psutil is not None
+        return dados
+
+    # ------------------------------------------------------------------
+    # PROCESSOS (psutil é opcional: sem ele, só o kill direto dos PIDs registrados)
+    # ------------------------------------------------------------------
+
+    def _descendentes(self, pids):
+        if psutil is None: return set()
+        filhos = set()
+        for pid in pids:
+            try:
+                filhos.update(p.pid for p in psutil.Process(pid).children(recursive=True))
+            except: pass
+        return filhos
+
+    def _processos_de_navegador(self):
+        if psutil is None: return []
+        try:
+            filhos = psutil.Process(os.getpid()).children(recursive=True)
+        except: return []
+        encontrados = []
+        agora = time.time()
+        for p in filhos:
+            try:
+                # Ignora processos recém-criados: podem ser de um driver que ainda está subindo
+                if agora - p.create_time() < 120: continue
+                if p.name().lower().startswith(NOMES_PROCESSOS):
+                    encontrados.append(p.pid)
+            except: pass
+        return encontrados
+
+    def _rss_mb(self, pids):
+        if psutil is None: return 0.0
+        total = 0
+        for pid in pids:
+            try: total += psutil.Process(pid).memory_info().rss
+            except: pass
+        return total / (1024 * 1024)
+
+    def _matar(self, pids):
+        """Retorna (quantidade de processos encerrados, MB liberados)"""
+        # Sem psutil não dá para confirmar que o PID ainda é um Chrome (o Windows reaproveita PIDs)
+        if psutil is None: return 0, 0.0
+        mortos, memoria = 0, 0.0
+        for pid in pids:
+            try:
+                proc = psutil.Process(pid)
+                if not proc.name().lower().startswith(NOMES_PROCESSOS): continue
+                memoria += proc.memory_info().rss / (1024 * 1024)
+                proc.kill()
+                mortos += 1
+            except: pass
+        return mortos, memoria
@@ -0,0 +1,32 @@
+# utils/url_canonica.py
+"""
+Forma canônica de uma URL de produto, usada como chave de cache: o mesmo produto
+chega com parâmetros de campanha, fragmento, host em maiúsculas ou barra no fim,
+e tudo isso deve cair na mesma entrada.
+"""
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Parâmetros que só rastreiam a origem do clique e não mudam a página
+PARAMETROS_RASTREIO = {
+    'gclid', 'gclsrc', 'dclid', 'fbclid', 'msclkid', 'yclid', 'srsltid', '_gl',
+    'ref', 'ref_', 'referrer', 'mc_cid', 'mc_eid', 'igshid',
+    'tracking_id', 'searchvariation', 'position', 'search_layout'
+}
+
+
+def canonicalizar_url(url):
+    partes = urlsplit((url or '').strip())
+    esquema = (partes.scheme or 'https').lower()
+    host = partes.netloc.lower()
+    if (esquema, host[-3:]) == ('http', ':80') or (esquema, host[-4:]) == ('https', ':443'):
+        host = host.rsplit(':', 1)[0]
+
+    caminho = partes.path or '/'
+    if len(caminho) > 1:
+        caminho = caminho.rstrip('/')
+
+    parametros = sorted(
+        (k, v) for k, v in parse_qsl(partes.query, keep_blank_values=True)
+        if not k.lower().startswith('utm_') and k.lower() not in PARAMETROS_RASTREIO
+    )
+    return urlunsplit((esquema, host, caminho, urlencode(parametros), ''))